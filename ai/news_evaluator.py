@@ -24,6 +24,12 @@ def evaluate_news_article(title: str, content: str, link: str) -> Dict:
             '우주소녀', '팬미팅', '콘서트', '아이돌', '가수', '연예인', '음악', '앨범'
         ]
         
+        # 운영 중 추가한 키워드 (크롤링 설정 extra_*_keywords)
+        from utils.crawl_settings import get_settings
+        settings = get_settings()
+        space_keywords.extend(settings.extra_space_keywords)
+        exclude_keywords.extend(settings.extra_exclude_keywords)
+        
         title_lower = title.lower()
         content_lower = content.lower()
         
@@ -52,34 +58,13 @@ def evaluate_news_article(title: str, content: str, link: str) -> Dict:
         found_keywords = [keyword for keyword in space_keywords 
                          if keyword in title_lower or keyword in content_lower][:3]
         
-        # 더 구체적이고 흥미로운 요약 생성
-        title_lower = title.lower()
-        
-        if '우주의 끝' in title:
-            summary = "우주의 경계와 크기에 대한 과학적 탐구입니다. 우주론과 물리학의 기본 질문을 다룹니다."
-        elif '한양대' in title and 'ssp' in title_lower:
-            summary = "한양대 ERICA가 국내 최초로 국제우주대학 우주연구 프로그램을 개최합니다. 한국 우주교육의 새로운 이정표입니다."
-        elif '블랙홀' in title or '중력파' in title:
-            summary = "블랙홀이나 중력파 관련 최신 연구 결과입니다. 우주의 기본 원리를 이해하는 데 도움이 됩니다."
-        elif '외계인' in title or '생명체' in title:
-            summary = "외계 생명체 탐사나 관련 연구 소식입니다. 인류의 우주에서의 위치를 새롭게 생각하게 합니다."
-        elif '화성' in title and ('탐사' in title or '착륙' in title):
-            summary = "화성 탐사 미션의 새로운 소식입니다. 인류의 화성 정착 꿈에 한 걸음 더 가까워졌습니다."
-        elif '달' in title and ('기지' in title or '정착' in title):
-            summary = "달 기지 건설이나 달 정착 계획 관련 소식입니다. 인류의 우주 시대가 본격화되고 있습니다."
-        elif '제임스웹' in title or 'jwst' in title_lower:
-            summary = "제임스웹 우주망원경의 새로운 발견입니다. 우주의 초기 모습을 더 선명하게 보여주고 있습니다."
-        elif '누리호' in title or '한국형' in title:
-            summary = "한국의 누리호 로켓 관련 소식입니다. 한국이 우주 강국으로 도약하고 있습니다."
-        elif '발사' in title or '성공' in title:
-            summary = "우주 발사체나 인공위성 발사 성공 소식입니다. 우주 기술의 눈부신 발전을 보여줍니다."
-        else:
-            # 제목에서 핵심 내용 추출
-            if '?' in title:
-                summary = f"우주에 대한 흥미로운 질문을 다룹니다. 과학적 호기심을 자극하는 내용입니다."
-            else:
-                key_topic = title.split(',')[0].split('-')[0].strip()[:40]
-                summary = f"{key_topic}에 대한 우주 과학 소식입니다. 우주의 신비를 풀어가는 여정입니다."
+        # 요약은 본문이 짧아 게시글에 본문 대신 요약을 쓸 때만 요청 (설정된 요약 백엔드, 실패/시간 초과 시 제목 규칙 기반 요약)
+        # → 본문이 충분한 기사는 요약 서비스를 기다리지 않음
+        summary = ""
+        from utils.article import SUMMARY_BODY_THRESHOLD
+        if len(content.strip()) <= SUMMARY_BODY_THRESHOLD:
+            from ai.summarizer import summarize_article
+            summary = summarize_article(title, content)
         
         return {
             "evaluation": "ACCEPT",
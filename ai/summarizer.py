@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+기사 요약 (교체 가능한 백엔드 + 배치 요청 + 내용 해시 캐시)
+
+- 백엔드: rules (제목 규칙, 항상 즉시 응답), http (요약 서비스 - 로컬 추론 서버 등, 대역 서버는 ai/summary_server.py)
+  register_backend 로 다른 백엔드 추가 가능, 선택은 SUMMARIZER_BACKEND
+- 여러 스레드에서 들어온 요약 요청을 짧게(SUMMARIZER_BATCH_WAIT) 모아 한 번에 전송, 동시 요청 수 제한
+- 호출한 쪽은 SUMMARIZER_TIMEOUT 까지만 기다리고 넘으면 규칙 기반 요약 사용 (늦게 온 결과는 캐시에만 저장)
+- 연속 실패가 쌓이면 잠시 원격 호출을 멈추고 규칙 기반 요약만 사용 (서비스 장애가 크롤링을 붙잡지 않도록)
+- 원격 요약은 (백엔드, 제목, 본문) 해시로 SQLite 에 저장 → 같은 기사는 다시 요약하지 않음
+"""
+import hashlib
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import (
+    SUMMARIZER_BACKEND, SUMMARIZER_URL, SUMMARIZER_MODEL, SUMMARIZER_TIMEOUT, SUMMARIZER_BATCH_SIZE,
+    SUMMARIZER_BATCH_WAIT, SUMMARIZER_MAX_CONCURRENCY, SUMMARIZER_INPUT_CHARS, SUMMARIZER_MAX_CHARS,
+    SUMMARIZER_FAILURE_THRESHOLD, SUMMARIZER_COOLDOWN, SUMMARY_CACHE_DB, SUMMARY_CACHE_RETENTION_DAYS
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ---- 규칙 기반 요약 (기본 백엔드이자 모든 백엔드의 대체 경로) ----
+
+# (제목에 모두 있어야 하는 단어, 하나라도 있어야 하는 단어, 요약) - 위에서부터 먼저 맞는 규칙 사용, 대소문자 무시
+_RULES = [
+    ((), ("블랙홀", "중력파"), "블랙홀이나 중력파 관련 최신 연구 결과입니다. 우주의 기본 원리를 이해하는 데 도움이 됩니다."),
+    ((), ("외계인", "생명체"), "외계 생명체 탐사나 관련 연구 소식입니다. 인류의 우주에서의 위치를 새롭게 생각하게 합니다."),
+    (("화성",), ("탐사", "착륙"), "화성 탐사 미션의 새로운 소식입니다. 인류의 화성 정착 꿈에 한 걸음 더 가까워졌습니다."),
+    (("달",), ("기지", "정착"), "달 기지 건설이나 달 정착 계획 관련 소식입니다. 인류의 우주 시대가 본격화되고 있습니다."),
+    ((), ("제임스웹", "jwst"), "제임스웹 우주망원경의 새로운 발견입니다. 우주의 초기 모습을 더 선명하게 보여주고 있습니다."),
+    ((), ("누리호", "한국형"), "한국의 누리호 로켓 관련 소식입니다. 한국이 우주 강국으로 도약하고 있습니다."),
+    ((), ("발사", "성공"), "우주 발사체나 인공위성 발사 성공 소식입니다. 우주 기술의 눈부신 발전을 보여줍니다."),
+]
+
+
+def rule_summary(title: str, content: str = "") -> str:
+    """제목 규칙 기반 요약 (맞는 규칙이 없으면 제목 앞부분으로 만든 문장)"""
+    title_lower = title.lower()
+    for required, any_of, summary in _RULES:
+        if all(word in title_lower for word in required) and (not any_of or any(word in title_lower for word in any_of)):
+            return summary
+    if '?' in title:
+        return "우주에 대한 흥미로운 질문을 다룹니다. 과학적 호기심을 자극하는 내용입니다."
+    key_topic = title.split(',')[0].split('-')[0].strip()[:40]
+    return f"{key_topic}에 대한 우주 과학 소식입니다. 우주의 신비를 풀어가는 여정입니다."
+
+
+# ---- 백엔드 ----
+
+class SummaryBackend:
+    """요약 백엔드 인터페이스: 항목 목록 → 요약 목록 (요약하지 못한 항목은 None, 전체 실패는 예외)"""
+
+    name = "base"
+    remote = False  # True 면 배치/시간 제한/캐시를 거침
+
+    @property
+    def cache_namespace(self) -> str:
+        """캐시 키 구분 (모델/서비스가 바뀌면 이전 요약을 쓰지 않도록)"""
+        return self.name
+
+    def summarize_batch(self, items: List[Tuple[str, str]]) -> List[Optional[str]]:
+        raise NotImplementedError
+
+
+class RuleBasedBackend(SummaryBackend):
+    name = "rules"
+
+    def summarize_batch(self, items: List[Tuple[str, str]]) -> List[Optional[str]]:
+        return [rule_summary(title, content) for title, content in items]
+
+
+class HttpSummaryBackend(SummaryBackend):
+    """요약 서비스 HTTP 호출
+
+    요청: POST {"model", "max_chars", "items": [{"id", "title", "content"}]}
+    응답: {"summaries": [{"id", "summary"}]}
+    """
+
+    name = "http"
+    remote = True
+
+    def __init__(self, url: str = SUMMARIZER_URL, model: str = SUMMARIZER_MODEL, timeout: float = SUMMARIZER_TIMEOUT,
+                 input_chars: int = SUMMARIZER_INPUT_CHARS, max_chars: int = SUMMARIZER_MAX_CHARS):
+        self.url = url
+        self.model = model
+        self.timeout = timeout
+        self.input_chars = input_chars
+        self.max_chars = max_chars
+
+    @property
+    def cache_namespace(self) -> str:
+        return f"http:{self.url}:{self.model}:{self.max_chars}"
+
+    def summarize_batch(self, items: List[Tuple[str, str]]) -> List[Optional[str]]:
+        from utils.http_client import get_session
+        payload = {
+            "model": self.model,
+            "max_chars": self.max_chars,
+            "items": [{"id": str(index), "title": title, "content": (content or "")[:self.input_chars]}
+                      for index, (title, content) in enumerate(items)]
+        }
+        response = get_session().post(self.url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        summaries = {str(entry.get("id")): entry.get("summary") for entry in response.json().get("summaries", [])}
+        results = []
+        for index in range(len(items)):
+            summary = (summaries.get(str(index)) or "").strip()
+            results.append(summary[:self.max_chars] if summary else None)
+        return results
+
+
+_BACKENDS: Dict[str, Callable[[], SummaryBackend]] = {
+    "rules": RuleBasedBackend,
+    "http": HttpSummaryBackend,
+}
+
+
+def register_backend(name: str, factory: Callable[[], SummaryBackend]):
+    """요약 백엔드 등록 (SUMMARIZER_BACKEND 에 이름 지정)"""
+    _BACKENDS[name] = factory
+
+
+# ---- 요약 캐시 ----
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    summary TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_created ON summaries(created_at);
+"""
+
+
+def content_key(namespace: str, title: str, content: str) -> str:
+    return hashlib.sha256(f"{namespace}\x00{title}\x00{content or ''}".encode('utf-8')).hexdigest()[:32]
+
+
+class SummaryCache:
+    """내용 해시 → 요약 (SQLite)"""
+
+    def __init__(self, path: str = SUMMARY_CACHE_DB, retention_days: int = SUMMARY_CACHE_RETENTION_DAYS):
+        self.path = path
+        self.retention_days = retention_days
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.execute("DELETE FROM summaries WHERE created_at < ?", (time.time() - retention_days * 86400,))
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, entries: List[Tuple[str, str]]):
+        if entries:
+            now = time.time()
+            with self._connect() as conn:
+                conn.executemany("INSERT OR REPLACE INTO summaries (key, summary, created_at) VALUES (?, ?, ?)",
+                                 [(key, summary, now) for key, summary in entries])
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+
+
+# ---- 배치 요약기 ----
+
+class _Request:
+    __slots__ = ("key", "title", "content", "future")
+
+    def __init__(self, key: str, title: str, content: str):
+        self.key = key
+        self.title = title
+        self.content = content
+        self.future = Future()
+
+
+class Summarizer:
+    """요약 요청을 모아 백엔드로 보내는 요약기 (스레드 안전)"""
+
+    def __init__(self, backend: SummaryBackend, cache: Optional[SummaryCache] = None,
+                 timeout: float = SUMMARIZER_TIMEOUT, batch_size: int = SUMMARIZER_BATCH_SIZE,
+                 batch_wait: float = SUMMARIZER_BATCH_WAIT, max_concurrency: int = SUMMARIZER_MAX_CONCURRENCY,
+                 failure_threshold: int = SUMMARIZER_FAILURE_THRESHOLD, cooldown: float = SUMMARIZER_COOLDOWN):
+        self.backend = backend
+        self.cache = cache
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}  # 같은 기사가 동시에 들어오면 요청 하나를 공유
+        self._failures = 0
+        self._paused_until = 0.0
+        self._stats = {"cache_hits": 0, "remote": 0, "fallback": 0, "batches": 0, "errors": 0}
+        self._queue = queue.Queue()
+        self._pool = None
+        self._collector = None
+        if backend.remote:
+            # 동시 요청 수 = 배치 전송 스레드 수
+            self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="summarizer")
+            self._collector = threading.Thread(target=self._collect_loop, name="summary-batcher", daemon=True)
+            self._collector.start()
+
+    def _count(self, name: str, value: int = 1):
+        with self._lock:
+            self._stats[name] += value
+
+    @property
+    def paused(self) -> bool:
+        return time.monotonic() < self._paused_until
+
+    def summarize_many(self, items: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """[(제목, 본문)] → [(요약, 출처)] (출처: cache / remote / rules), 전체 대기는 timeout 한 번"""
+        if not self.backend.remote:
+            return [(summary or rule_summary(title, content), "rules")
+                    for summary, (title, content) in zip(self.backend.summarize_batch(items), items)]
+
+        results: List[Optional[Tuple[str, str]]] = [None] * len(items)
+        waiting = []
+        for index, (title, content) in enumerate(items):
+            key = content_key(self.backend.cache_namespace, title, content)
+            cached = self.cache.get(key) if self.cache else None
+            if cached:
+                self._count("cache_hits")
+                results[index] = (cached, "cache")
+            elif not self.paused:
+                waiting.append((index, self._submit(key, title, content)))
+
+        deadline = time.monotonic() + self.timeout
+        for index, future in waiting:
+            try:
+                summary = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeout:
+                logger.warning(f"요약 시간 초과 ({self.timeout}초), 규칙 기반 요약 사용: {items[index][0][:30]}...")
+                continue
+            except Exception as e:
+                logger.debug(f"요약 실패, 규칙 기반 요약 사용: {e}")
+                continue
+            if summary:
+                self._count("remote")
+                results[index] = (summary, "remote")
+
+        for index, (title, content) in enumerate(items):
+            if results[index] is None:
+                self._count("fallback")
+                results[index] = (rule_summary(title, content), "rules")
+        return results
+
+    def summarize(self, title: str, content: str) -> Tuple[str, str]:
+        return self.summarize_many([(title, content)])[0]
+
+    def _submit(self, key: str, title: str, content: str) -> Future:
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            request = _Request(key, title, content)
+            self._inflight[key] = request.future
+        self._queue.put(request)
+        return request.future
+
+    def _collect_loop(self):
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+            batch = [request]
+            deadline = time.monotonic() + self.batch_wait
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._queue.put(None)  # 남은 배치를 보낸 뒤 종료
+                    break
+                batch.append(request)
+            self._pool.submit(self._run_batch, batch)
+
+    def _finish(self, request: _Request, summary: Optional[str] = None, error: Exception = None):
+        with self._lock:
+            self._inflight.pop(request.key, None)
+        if error is not None:
+            request.future.set_exception(error)
+        else:
+            request.future.set_result(summary)
+
+    def _run_batch(self, batch: List[_Request]):
+        if self.paused:
+            for request in batch:
+                self._finish(request, error=RuntimeError("요약 서비스 일시 중지"))
+            return
+        self._count("batches")
+        try:
+            summaries = self.backend.summarize_batch([(request.title, request.content) for request in batch])
+            if len(summaries) != len(batch):
+                raise ValueError(f"요약 수 불일치: {len(summaries)} != {len(batch)}")
+        except Exception as e:
+            self._count("errors")
+            with self._lock:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    self._paused_until = time.monotonic() + self.cooldown
+                    self._failures = 0
+                    logger.warning(f"요약 서비스 연속 실패, {self.cooldown}초 동안 규칙 기반 요약 사용: {e}")
+            for request in batch:
+                self._finish(request, error=e)
+            return
+        with self._lock:
+            self._failures = 0
+        if self.cache:
+            try:
+                self.cache.put_many([(request.key, summary) for request, summary in zip(batch, summaries) if summary])
+            except sqlite3.Error as e:
+                logger.error(f"요약 캐시 저장 실패: {e}")
+        for request, summary in zip(batch, summaries):
+            self._finish(request, summary)
+
+    def close(self):
+        if self._collector is not None:
+            self._queue.put(None)
+            self._collector.join(timeout=5)
+            self._pool.shutdown(wait=False)
+            self._collector = None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(backend=self.backend.name, paused=self.paused)
+        if self.cache:
+            stats["cached"] = self.cache.count()
+        return stats
+
+
+_summarizer = None
+_summarizer_lock = threading.Lock()
+
+
+def get_summarizer() -> Summarizer:
+    global _summarizer
+    if _summarizer is None:
+        with _summarizer_lock:
+            if _summarizer is None:
+                factory = _BACKENDS.get(SUMMARIZER_BACKEND)
+                if factory is None:
+                    logger.error(f"알 수 없는 요약 백엔드: {SUMMARIZER_BACKEND}, 규칙 기반 요약 사용")
+                    factory = RuleBasedBackend
+                backend = factory()
+                _summarizer = Summarizer(backend, SummaryCache() if backend.remote else None)
+                logger.info(f"요약 백엔드: {backend.name}")
+    return _summarizer
+
+
+def shutdown_summarizer():
+    """배치 스레드 종료 (서버 종료 시, 만든 적 없으면 아무것도 안 함)"""
+    global _summarizer
+    with _summarizer_lock:
+        if _summarizer is not None:
+            _summarizer.close()
+            _summarizer = None
+
+
+def summarize_article(title: str, content: str) -> str:
+    """설정된 백엔드로 기사 요약 (실패/시간 초과 시 규칙 기반 요약)"""
+    return get_summarizer().summarize(title, content)[0]
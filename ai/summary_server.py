@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+요약 서비스 대역 서버 (로컬 추론 서버 대신 HttpSummaryBackend 를 시험할 때 사용)
+
+본문 앞 문장을 max_chars 까지 이어 붙이는 추출 요약, --delay 로 느린 모델 흉내
+
+실행: python -m ai.summary_server --port 8090 [--delay 0.5] [--fail-rate 0.2]
+크롤러: SUMMARIZER_BACKEND=http SUMMARIZER_URL=http://127.0.0.1:8090/summarize
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+_SENTENCE = re.compile(r'(?<=[.!?])\s+')
+
+
+def lead_summary(title: str, content: str, max_chars: int) -> str:
+    """본문 앞 문장 추출 요약 (본문이 없으면 제목)"""
+    sentences = [sentence.strip() for sentence in _SENTENCE.split(content or "") if sentence.strip()]
+    summary = ""
+    for sentence in sentences:
+        if summary and len(summary) + len(sentence) + 1 > max_chars:
+            break
+        summary = f"{summary} {sentence}".strip()
+    return (summary or title)[:max_chars]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    delay = 0.0
+    fail_rate = 0.0
+    stats: Dict[str, int] = {"requests": 0, "items": 0}
+    lock = threading.Lock()
+
+    def do_POST(self):
+        if self.path != "/summarize":
+            self.send_error(404)
+            return
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        items = payload.get("items", [])
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["items"] += len(items)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail_rate and random.random() < self.fail_rate:
+            self.send_error(503)
+            return
+        max_chars = int(payload.get("max_chars") or 300)
+        body = json.dumps({"summaries": [
+            {"id": item.get("id"), "summary": lead_summary(item.get("title", ""), item.get("content", ""), max_chars)}
+            for item in items
+        ]}, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != "/stats":
+            self.send_error(404)
+            return
+        with self.lock:
+            body = json.dumps(self.stats).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8090, delay: float = 0.0, fail_rate: float = 0.0) -> ThreadingHTTPServer:
+    """대역 서버 생성 (port=0 이면 빈 포트, serve_forever 는 호출한 쪽에서)"""
+    handler = type("SummaryHandler", (_Handler,), {
+        "delay": delay, "fail_rate": fail_rate, "stats": {"requests": 0, "items": 0}, "lock": threading.Lock()
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="요약 서비스 대역 서버")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8090)
+    arg_parser.add_argument("--delay", type=float, default=0.0, help="요청당 지연 (초)")
+    arg_parser.add_argument("--fail-rate", type=float, default=0.0, help="503 응답 비율")
+    args = arg_parser.parse_args()
+
+    server = make_server(args.host, args.port, args.delay, args.fail_rate)
+    print(f"요약 대역 서버: http://{args.host}:{server.server_address[1]}/summarize")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
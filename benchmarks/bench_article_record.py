@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+기사 레코드 벤치마크: 후보 20,000개를 딕셔너리 + 미리 만든 본문으로 들고 있을 때 vs Article (__slots__, 지연 본문)
+
+- 기존: 후보마다 키가 다른 딕셔너리, 본문 문자열을 수집 시점에 += 로 조립 (버려질 후보도)
+- 개선: utils.article.Article, 본문은 전송하는 기사만 템플릿으로 한 번 조립
+
+실행: python -m benchmarks.bench_article_record
+"""
+import random
+import tracemalloc
+
+from benchmarks.harness import measure, print_table
+from utils.article import Article
+
+CANDIDATES = 20000
+SENT = 5  # 중복/할당량을 통과해 실제로 전송되는 수
+
+_OUTLETS = ["연합뉴스", "사이언스타임즈", "IT조선", "동아사이언스", "한국경제"]
+
+
+def _make_rows(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        outlet = rng.choice(_OUTLETS)
+        title = f"누리호 {index}차 발사 관련 소식 {rng.randint(1000, 9999)}"
+        rows.append({
+            "title": f"{title} - {outlet}", "clean_title": title, "outlet": outlet,
+            "link": f"https://news.example.com/articles/{index}", "pub_date": "Mon, 06 Jan 2025 03:00:00 GMT",
+            "description": f"{title} 에 대한 RSS 설명입니다. " * rng.randint(6, 12)
+        })
+    return rows
+
+
+def _baseline_content(row) -> str:
+    content = f"{row['outlet']}에서 보도한 우주 관련 최신 뉴스입니다.\n\n"
+    content += f"📰 기사 내용:\n{row['description']}\n\n"
+    content += f"📅 발행일: {row['pub_date']}\n"
+    content += "🏷️ 핵심 키워드: 누리호, 발사, 우주\n"
+    content += f"🔗 원문 링크: {row['link']}\n🌌 출처: {row['outlet']}"
+    return content
+
+
+def _baseline(rows):
+    """딕셔너리 레코드 + 수집 시점 본문 조립"""
+    articles = [{
+        "title": row["clean_title"], "content": _baseline_content(row), "source": "GoogleNews",
+        "published_at": row["pub_date"], "url": row["link"], "rss_description": row["description"],
+        "source_name": "GoogleNews", "ai_evaluation": {"evaluation": "ACCEPT"}, "metrics": {}
+    } for row in rows]
+    return articles, [article["content"] for article in articles[:SENT]]
+
+
+def _candidate(rows):
+    """Article 레코드 + 전송하는 기사만 본문 조립"""
+    articles = []
+    for row in rows:
+        article = Article(row["clean_title"], "GoogleNews", raw_title=row["title"], url=row["link"],
+                          outlet=row["outlet"], published_at=row["pub_date"])
+        article.evaluated(row["description"], "", {"evaluation": "ACCEPT", "keywords": ["누리호", "발사", "우주"]}, {})
+        articles.append(article)
+    return articles, [article.content for article in articles[:SENT]]
+
+
+def _peak_bytes(func, rows) -> int:
+    tracemalloc.start()
+    result = func(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main():
+    rows = _make_rows(CANDIDATES)
+    # 같은 본문인지 확인
+    assert _baseline(rows[:SENT])[1] == _candidate(rows[:SENT])[1]
+
+    print_table(f"기사 레코드 (후보 {CANDIDATES:,}개, 전송 {SENT}개)", [
+        {"name": "레코드 생성 + 전송 본문 조립", "baseline": measure(_baseline, rows, repeat=5),
+         "candidate": measure(_candidate, rows, repeat=5)}
+    ])
+    baseline_peak, candidate_peak = _peak_bytes(_baseline, rows), _peak_bytes(_candidate, rows)
+    print(f"\n최대 메모리: 기존 {baseline_peak / 1024 / 1024:.1f}MB → 개선 {candidate_peak / 1024 / 1024:.1f}MB "
+          f"({baseline_peak / candidate_peak:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+발행일 파싱 벤치마크: dateutil 단독 vs 형식별 빠른 경로 (+ 캐시)
+
+실행: python -m benchmarks.bench_date_parser
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+from dateutil import parser
+
+from benchmarks.harness import measure, print_table
+from utils import date_parser
+
+ITEMS = 500
+
+def _make_feed(fmt: str):
+    """RSS 한 번에 들어오는 발행일 문자열 (ITEMS개)"""
+    rng = random.Random(42)
+    base = datetime(2025, 1, 6, 7, 0, tzinfo=timezone.utc)
+    return [(base - timedelta(minutes=rng.randint(0, 60 * 24 * 14))).strftime(fmt) for _ in range(ITEMS)]
+
+def _baseline(values):
+    for value in values:
+        parser.parse(value).replace(tzinfo=None)
+
+def _candidate_cold(values):
+    date_parser._parse.cache_clear()
+    for value in values:
+        date_parser.parse_pub_date(value)
+
+def _candidate_warm(values):
+    for value in values:
+        date_parser.parse_pub_date(value)
+
+def _check_equivalence(values):
+    """같은 시각으로 해석하는지 확인 (기존 방식은 시간대를 버리므로 UTC 입력만 비교)"""
+    for value in values:
+        expected = parser.parse(value).astimezone(timezone.utc)
+        assert date_parser.parse_pub_date(value) == expected, value
+
+def main():
+    feeds = {
+        "RFC 822 (RSS pubDate)": _make_feed("%a, %d %b %Y %H:%M:%S GMT"),
+        "ISO 8601": _make_feed("%Y-%m-%dT%H:%M:%S+00:00"),
+    }
+    rows = []
+    for name, values in feeds.items():
+        _check_equivalence(values)
+        baseline = measure(_baseline, values)
+        rows.append({"name": f"{name} {ITEMS}건 (캐시 없음)", "baseline": baseline,
+                     "candidate": measure(_candidate_cold, values)})
+        _candidate_warm(values)
+        rows.append({"name": f"{name} {ITEMS}건 (재수집, 캐시)", "baseline": baseline,
+                     "candidate": measure(_candidate_warm, values)})
+
+    print_table("발행일 파싱", rows)
+    print(f"\n통계: {date_parser.get_date_parse_stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+로깅 오버헤드 벤치마크: 동기 파일 핸들러 vs QueueHandler/QueueListener
+
+호출 스레드(크롤링 루프)가 로그 한 건에 쓰는 시간을 비교합니다.
+실행: python -m benchmarks.bench_logging
+"""
+import logging
+import os
+import tempfile
+from logging.handlers import RotatingFileHandler
+
+from benchmarks.harness import measure, print_table
+from utils import logger_setup
+
+MESSAGES = 5000
+
+def _setup_sync(log_dir: str):
+    """기존 방식: 루트 로거에 회전 파일 핸들러 2개를 직접 연결 (콘솔 제외)"""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    logger_setup.stop_logger()
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for name, level in (("crawler.log", logging.INFO), ("error.log", logging.ERROR)):
+        handler = RotatingFileHandler(os.path.join(log_dir, name), maxBytes=10*1024*1024, backupCount=5, encoding='utf-8')
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+def _setup_queue(log_dir: str, json_format: bool):
+    """개선 방식: QueueHandler 만 연결하고 기록은 리스너 스레드가 처리"""
+    logger_setup.setup_logger(log_dir=log_dir, json_format=json_format)
+    # 콘솔 출력은 측정에서 제외
+    listener = logger_setup._listener
+    listener.handlers = tuple(h for h in listener.handlers if isinstance(h, RotatingFileHandler))
+
+def _emit(logger: logging.Logger):
+    for i in range(MESSAGES):
+        logger.info(f"기사 내용 추출 성공: {i}자")
+
+def _emit_sampled(logger: logging.Logger):
+    for i in range(MESSAGES):
+        logger_setup.log_sampled(logger, logging.INFO, "bench", f"유사 제목 제외: {i}")
+
+def main():
+    logger = logging.getLogger("bench")
+    rows = []
+    with tempfile.TemporaryDirectory() as log_dir:
+        _setup_sync(log_dir)
+        sync_result = measure(_emit, logger, repeat=3)
+
+        _setup_queue(log_dir, json_format=False)
+        queue_result = measure(_emit, logger, repeat=3)
+        rows.append({"name": f"텍스트 로그 {MESSAGES}건", "baseline": sync_result, "candidate": queue_result})
+
+        _setup_queue(log_dir, json_format=True)
+        rows.append({"name": f"JSON 로그 {MESSAGES}건", "baseline": sync_result,
+                     "candidate": measure(_emit, logger, repeat=3)})
+        rows.append({"name": f"샘플링 로그 {MESSAGES}건", "baseline": sync_result,
+                     "candidate": measure(_emit_sampled, logger, repeat=3)})
+        logger_setup.stop_logger()
+
+    print_table("로깅 (호출 스레드 기준)", rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+이미 본 항목 확인 벤치마크: 기록 200,000건에 대한 후보 100개 확인
+
+- 기존: JSON 기록 파일을 다시 읽어 목록에서 찾기 (local_cache 방식 / 목록 in 검사)
+- 개선: utils.seen_filter.SeenFilter (메모리 Bloom 필터, 적중한 키만 SQLite 확인)
+
+실행: python -m benchmarks.bench_seen_filter
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.harness import measure, print_table, format_seconds
+from utils.seen_filter import SeenFilter
+
+STORED = 200000
+BATCH = 100
+
+
+def _baseline(path, urls):
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    stored = [entry["url"] for entry in entries]
+    return [url in stored for url in urls]
+
+
+def main():
+    stored = [f"https://news.example.com/articles/{index}" for index in range(STORED)]
+    new_urls = [f"https://news.example.com/new/{index}" for index in range(BATCH)]
+    seen_urls = stored[-BATCH:]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "seen.json")
+        now = time.time()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump([{"url": url, "ts": now} for url in stored], f)
+
+        db_path, filter_path = os.path.join(directory, "seen.db"), os.path.join(directory, "seen_filter.bin")
+        started = time.perf_counter()
+        seen_filter = SeenFilter(db_path, filter_path)
+        seen_filter.add_many(("url", url) for url in stored)
+        seen_filter.save()
+        build_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        reloaded = SeenFilter(db_path, filter_path)
+        load_seconds = time.perf_counter() - started
+
+        assert _baseline(path, new_urls[:5]) == reloaded.contains_many([("url", url) for url in new_urls[:5]])
+        assert all(reloaded.contains_many([("url", url) for url in seen_urls]))
+
+        rows = [
+            {"name": f"새 URL {BATCH}개 (대부분 필터에서 끝)", "baseline": measure(_baseline, path, new_urls, repeat=3),
+             "candidate": measure(reloaded.contains_many, [("url", url) for url in new_urls], repeat=5)},
+            {"name": f"본 URL {BATCH}개 (SQLite 확인)", "baseline": measure(_baseline, path, seen_urls, repeat=3),
+             "candidate": measure(reloaded.contains_many, [("url", url) for url in seen_urls], repeat=5)},
+        ]
+        print_table(f"이미 본 항목 확인 (기록 {STORED:,}건)", rows)
+
+        stats = reloaded.stats()
+        set_bytes = sys.getsizeof(set(stored)) + sum(sys.getsizeof(url) for url in stored)
+        print(f"\n필터 메모리: {stats['filter_bytes'] / 1024:.0f}KB (같은 URL 의 파이썬 set: {set_bytes / 1024 / 1024:.1f}MB)")
+        print(f"필터 적중 {stats['filter_hits']}건 중 DB 에 없음(오탐) {stats['unconfirmed']}건")
+        print(f"구성(DB 기록 포함): {format_seconds(build_seconds)}, 재시작 로드: {format_seconds(load_seconds)}")
+
+
+if __name__ == "__main__":
+    main()
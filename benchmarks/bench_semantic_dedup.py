@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+의미 기반 중복 탐지 벤치마크: 저장 제목 50,000개에 대한 제목당 질의 지연 시간
+
+- 기존: 저장된 모든 제목과 희소 벡터 코사인을 하나씩 계산 (선형 탐색)
+- 개선: utils.semantic_dedup.SemanticIndex (numpy 행렬 곱, 없으면 역색인)
+
+실행: python -m benchmarks.bench_semantic_dedup
+"""
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.harness import measure, print_table, format_seconds
+from utils.semantic_dedup import SemanticIndex, embed_title, cosine
+
+STORED = 50000
+BATCH = 20
+
+_SUBJECTS = ["누리호", "다누리", "스페이스X", "NASA", "아르테미스", "제임스웹 망원경", "한국천문연구원", "블루오리진",
+             "중국 창어", "인도 찬드라얀", "ESA", "허블", "우주항공청", "KAIST", "소행성 베누", "화성 탐사선"]
+_EVENTS = ["발사 성공", "발사 연기", "시험비행", "궤도 진입", "임무 연장", "관측 결과 공개", "새 사진 공개",
+           "탐사 계획 발표", "예산 확대", "엔진 시험", "착륙 성공", "통신 복구", "위성 분리", "국제 협력 체결"]
+_DETAILS = ["우주산업 새 장", "내년 상반기 목표", "민간 기업 참여", "세계 최초", "역대 최대 규모", "과학계 주목",
+            "외계행성 대기 분석", "달 남극 탐사", "재사용 로켓", "소형 위성 발사"]
+
+
+def _make_titles(count: int, seed: int):
+    rng = random.Random(seed)
+    return [f"{rng.choice(_SUBJECTS)} {rng.randint(1, 99)}차 {rng.choice(_EVENTS)}, {rng.choice(_DETAILS)} "
+            f"({rng.randint(1000, 9999)})" for _ in range(count)]
+
+
+def _linear_top1(stored_vectors, titles):
+    for title in titles:
+        query = embed_title(title)
+        max(range(len(stored_vectors)), key=lambda row: cosine(query, stored_vectors[row]))
+
+
+def main():
+    stored = _make_titles(STORED, seed=1)
+    queries = _make_titles(BATCH, seed=2)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "semantic_news.json")
+        index = SemanticIndex(path, max_items=STORED)
+
+        started = time.perf_counter()
+        index.add_many(stored)
+        build_seconds = time.perf_counter() - started
+        index.save()
+        started = time.perf_counter()
+        reloaded = SemanticIndex(path, max_items=STORED)
+        load_seconds = time.perf_counter() - started
+        assert len(reloaded) == len(index)
+
+        stored_vectors = [embed_title(title) for title in stored]
+        baseline_single = measure(_linear_top1, stored_vectors, queries[:1], repeat=3)
+        baseline_batch = measure(_linear_top1, stored_vectors, queries, repeat=1)
+
+        # 같은 결과인지 확인 (상위 1개, numpy 는 정확한 top-k)
+        for title in queries[:3] if index.backend == "numpy" else ():
+            query = embed_title(title)
+            expected = max(cosine(query, vector) for vector in stored_vectors)
+            assert abs(index.query(title, k=1)[0][1] - expected) < 1e-4, title
+
+        rows = []
+        indexes = [index]
+        if index.backend == "numpy":  # numpy 가 없는 환경의 역색인 방식도 함께 측정
+            fallback = SemanticIndex(os.path.join(directory, "fallback.json"), max_items=STORED, use_numpy=False)
+            fallback.add_many(stored)
+            indexes.append(fallback)
+        for current in indexes:
+            rows.append({"name": f"{current.backend}: 제목 1건 top-5", "baseline": baseline_single,
+                         "candidate": measure(current.query, queries[0], k=5, repeat=5)})
+            rows.append({"name": f"{current.backend}: 제목 {BATCH}건 배치 top-5", "baseline": baseline_batch,
+                         "candidate": measure(current.query_batch, queries, k=5, repeat=5)})
+        print_table(f"의미 기반 중복 탐지 (저장 {STORED:,}건, 기존은 선형 코사인 top-1)", rows)
+
+        print()
+        for row in rows[1::2]:
+            print(f"{row['name'].split(':')[0]} 배치 질의 제목당: {format_seconds(row['candidate']['median'] / BATCH)}")
+        print(f"색인 구성: {format_seconds(build_seconds)}, 파일 로드(벡터 재계산 포함): {format_seconds(load_seconds)}, "
+              f"파일 크기: {os.path.getsize(path) / 1024 / 1024:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
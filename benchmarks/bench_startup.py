@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+서버 기동 벤치마크: main 모듈 임포트 시간과 첫 응답(time-to-healthy)까지 걸리는 시간
+
+실행: python -m benchmarks.bench_startup [--runs 3] [--path /]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from benchmarks.harness import format_seconds
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def measure_import() -> float:
+    """새 인터프리터에서 main 임포트에 걸린 시간"""
+    code = "import time; s = time.perf_counter(); import main; print(time.perf_counter() - s)"
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=REPO_ROOT, stderr=subprocess.DEVNULL)
+    return float(output.decode().strip().splitlines()[-1])
+
+def measure_time_to_healthy(path: str, timeout: float = 30) -> float:
+    """uvicorn 프로세스 시작부터 첫 200 응답까지 걸린 시간"""
+    port = _free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=1) as resp:
+                    if resp.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.02)
+        raise TimeoutError(f"{timeout}초 안에 응답 없음")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 기동 시간 측정")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--path", default="/", help="준비 완료 판단에 사용할 엔드포인트")
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    healthy = [measure_time_to_healthy(args.path) for _ in range(args.runs)]
+
+    print("\n== 서버 기동 ==")
+    print(f"main 임포트       중앙값 {format_seconds(statistics.median(imports))}  최소 {format_seconds(min(imports))}")
+    print(f"첫 응답({args.path:<6})  중앙값 {format_seconds(statistics.median(healthy))}  최소 {format_seconds(min(healthy))}")
+
+if __name__ == "__main__":
+    main()
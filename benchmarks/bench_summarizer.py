@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+요약기 벤치마크: 기사 40개(같은 기사 8개 포함)를 크롤링 스레드 8개가 요약, 대역 서버 요청당 지연 0.2초
+
+- 기존: 기사마다 요약 서비스 요청 1회 (배치/캐시 없음)
+- 개선: ai.summarizer.Summarizer (스레드 간 배치, 동시 요청 2개, 내용 해시 캐시)
+
+실행: python -m benchmarks.bench_summarizer
+"""
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.harness import measure, print_table
+from ai.summarizer import HttpSummaryBackend, Summarizer, SummaryCache
+from ai.summary_server import make_server
+
+ARTICLES = 40
+DUPLICATES = 8
+THREADS = 8
+DELAY = 0.2
+
+
+def _items():
+    unique = [(f"제임스웹 망원경 관측 {index}", f"관측 결과 {index} 를 발표했습니다. 초기 은하의 모습이 담겼습니다.")
+              for index in range(ARTICLES - DUPLICATES)]
+    return unique + unique[:DUPLICATES]
+
+
+def _baseline(backend, items):
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        return list(pool.map(lambda item: backend.summarize_batch([item])[0], items))
+
+
+def _candidate(summarizer, items):
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        return list(pool.map(lambda item: summarizer.summarize(*item)[0], items))
+
+
+def main():
+    server = make_server(port=0, delay=DELAY)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stats = server.RequestHandlerClass.stats
+    backend = HttpSummaryBackend(url=f"http://127.0.0.1:{server.server_address[1]}/summarize", timeout=10)
+    items = _items()
+
+    with tempfile.TemporaryDirectory() as directory:
+        def cold_run():
+            cache = SummaryCache(os.path.join(directory, f"cache_{os.urandom(4).hex()}.db"))
+            summarizer = Summarizer(backend, cache, timeout=10)
+            try:
+                return _candidate(summarizer, items)
+            finally:
+                summarizer.close()
+
+        assert _baseline(backend, items) == cold_run()
+        stats.update(requests=0, items=0)
+        baseline = measure(_baseline, backend, items, repeat=2)
+        baseline_requests = stats["requests"] // 2
+        stats.update(requests=0, items=0)
+        cold = measure(cold_run, repeat=2)
+        cold_requests = stats["requests"] // 2
+
+        warm_summarizer = Summarizer(backend, SummaryCache(os.path.join(directory, "warm.db")), timeout=10)
+        _candidate(warm_summarizer, items)
+        warm = measure(_candidate, warm_summarizer, items, repeat=3)
+        warm_summarizer.close()
+
+        print_table(f"기사 {ARTICLES}개 요약 (스레드 {THREADS}개, 요청 지연 {DELAY}초)", [
+            {"name": "첫 요약 (캐시 없음)", "baseline": baseline, "candidate": cold},
+            {"name": "다시 요약 (같은 기사)", "baseline": baseline, "candidate": warm},
+        ])
+        print(f"\n요약 서비스 요청 수: 기존 {baseline_requests}회 → 배치 {cold_requests}회, 캐시 적중 시 0회")
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
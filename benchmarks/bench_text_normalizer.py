@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+텍스트 정제 벤치마크: 기존 인라인 re.sub 방식 vs utils.text_normalizer
+
+실행: python -m benchmarks.bench_text_normalizer
+"""
+import re
+
+from benchmarks.harness import measure, print_table
+from utils.text_normalizer import (
+    strip_title_source, clean_rss_description, strip_trailing_phrase, PARAGRAPH_BOILERPLATE
+)
+
+# ---- 기존 구현 (crawler/optimized_news_crawler.py 에서 옮겨온 그대로) ----
+
+def legacy_clean_title(title):
+    clean_title = re.sub(r'^\[.*?\]\s*', '', title).strip()
+    return re.sub(r'\s*-\s*[가-힣A-Za-z0-9\s]+$', '', clean_title).strip()
+
+def legacy_clean_description(rss_description, clean_title):
+    clean_desc = rss_description
+    if clean_title in clean_desc:
+        clean_desc = clean_desc.replace(clean_title, '').strip()
+    clean_desc = re.sub(r'[가-힣A-Za-z0-9]+\s*$', '', clean_desc).strip()
+    return re.sub(r'\s*-\s*[가-힣A-Za-z0-9\s]+$', '', clean_desc).strip()
+
+def legacy_strip_phrase(rss_description):
+    return re.sub(r'[가-힣A-Za-z0-9\s\'"\-’]+\s*$', '', rss_description).strip()
+
+LEGACY_SKIP_WORDS = [
+    '광고', '구독', '로그인', '회원가입', '댓글', '공유하기',
+    '이메일', '페이스북', '트위터', '카카오톡', '라인',
+    'copyright', 'ⓒ', '©', '저작권', '무단전재'
+]
+
+def legacy_filter(paragraphs):
+    return [text for text in paragraphs
+            if len(text) > 30 and
+            not any(skip in text.lower() for skip in LEGACY_SKIP_WORDS) and
+            not text.startswith(('사진=', '이미지=', '출처=', '기자='))]
+
+# ---- 입력 데이터 ----
+
+NORMAL_TITLE = "[한국대학신문] 누리호 4차 발사 성공, 한국 우주 산업 새 장 열어 - 한국대학신문"
+NORMAL_DESC = "누리호 4차 발사 성공 소식입니다. 한국항공우주연구원은 오늘 - 연합뉴스"
+# 긴 한글 단어 뒤 문장부호: 끝 앵커 패턴이 모든 시작 위치에서 재탐색 (O(n^2))
+PATHOLOGICAL_DESC = ("우주" * 2500 + ".") * 2
+PATHOLOGICAL_PHRASE = "우주 탐사 " * 2000 + "!" + "x"
+PATHOLOGICAL_TITLE = "우주 " * 1500 + "- NASA! 발표"
+PARAGRAPHS = ["한국항공우주연구원은 오늘 누리호 발사 준비 상황을 공개했다. " * 3] * 40 + ["ⓒ 무단전재 금지 " * 5] * 10
+
+def check_equivalence():
+    """기존 구현과 결과가 같은지 확인"""
+    cases_title = [NORMAL_TITLE, PATHOLOGICAL_TITLE, "제목 - ", "[a] b - c d", "no suffix here!"]
+    for title in cases_title:
+        assert legacy_clean_title(title) == strip_title_source(title), title[:40]
+    for desc in [NORMAL_DESC, PATHOLOGICAL_DESC, "짧은 설명", "끝 공백   "]:
+        assert legacy_clean_description(desc, "누리호") == clean_rss_description(desc, "누리호"), desc[:40]
+        assert legacy_strip_phrase(desc) == strip_trailing_phrase(desc), desc[:40]
+    assert legacy_strip_phrase(PATHOLOGICAL_PHRASE) == strip_trailing_phrase(PATHOLOGICAL_PHRASE)
+    assert legacy_filter(PARAGRAPHS) == PARAGRAPH_BOILERPLATE.filter(PARAGRAPHS, min_length=30)
+
+def main():
+    check_equivalence()
+    rows = [
+        {"name": "제목 정제 (일반)",
+         "baseline": measure(legacy_clean_title, NORMAL_TITLE, number=2000),
+         "candidate": measure(strip_title_source, NORMAL_TITLE, number=2000)},
+        {"name": "제목 정제 (병적 입력)",
+         "baseline": measure(legacy_clean_title, PATHOLOGICAL_TITLE),
+         "candidate": measure(strip_title_source, PATHOLOGICAL_TITLE)},
+        {"name": "RSS 설명 정제 (일반)",
+         "baseline": measure(legacy_clean_description, NORMAL_DESC, "누리호", number=2000),
+         "candidate": measure(clean_rss_description, NORMAL_DESC, "누리호", number=2000)},
+        {"name": "RSS 설명 정제 (병적 입력)",
+         "baseline": measure(legacy_clean_description, PATHOLOGICAL_DESC, "누리호", repeat=3),
+         "candidate": measure(clean_rss_description, PATHOLOGICAL_DESC, "누리호", repeat=3)},
+        {"name": "끝 구간 제거 (병적 입력)",
+         "baseline": measure(legacy_strip_phrase, PATHOLOGICAL_PHRASE, repeat=3),
+         "candidate": measure(strip_trailing_phrase, PATHOLOGICAL_PHRASE, repeat=3)},
+        {"name": "문단 금지어 필터 (50문단)",
+         "baseline": measure(legacy_filter, PARAGRAPHS, number=200),
+         "candidate": measure(PARAGRAPH_BOILERPLATE.filter, PARAGRAPHS, 30, number=200)},
+    ]
+    print_table("텍스트 정제", rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+간단한 벤치마크 도구 (python -m benchmarks.<모듈명> 으로 실행)
+"""
+import statistics
+import time
+from typing import Callable, Dict, List
+
+def measure(func: Callable, *args, repeat: int = 5, number: int = 1, **kwargs) -> Dict:
+    """함수 실행 시간 측정 (반복 횟수별 최소/중앙값, 1회 기준 초)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args, **kwargs)
+        samples.append((time.perf_counter() - start) / number)
+    return {"min": min(samples), "median": statistics.median(samples)}
+
+def format_seconds(seconds: float) -> str:
+    """사람이 읽기 쉬운 시간 단위로 변환"""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+def print_table(title: str, rows: List[Dict]):
+    """측정 결과 표 출력 (rows: name, baseline, candidate)"""
+    print(f"\n== {title} ==")
+    print(f"{'케이스':<36}{'기존':>14}{'개선':>14}{'배율':>10}")
+    for row in rows:
+        baseline, candidate = row["baseline"]["median"], row["candidate"]["median"]
+        speedup = baseline / candidate if candidate else float('inf')
+        print(f"{row['name']:<36}{format_seconds(baseline):>14}{format_seconds(candidate):>14}{speedup:>9.1f}x")
@@ -8,17 +8,183 @@ EVENT_API_KEY = "byeolnight-crawler-exhibitions"  # 전시회용 API 키
 
 # 크롤링 설정
 MAX_ARTICLES_PER_SOURCE = 3
+NEWS_ARTICLE_QUOTA = 5  # 1회 크롤링 최대 게시 수 (실제 기사가 부족할 때만 보충 기사로 채움)
+
+# 크롤링 튜닝 설정 파일 (무중단 재로드: POST /admin/settings/reload, 환경 변수 CRAWL_<항목> 이 우선)
+CRAWL_SETTINGS_FILE = os.getenv("CRAWL_SETTINGS_FILE", "data/crawl_settings.json")
+ADMIN_API_KEY = os.getenv("ADMIN_API_KEY", "")  # 설정 시 /admin/* 요청에 X-Admin-Key 헤더 필요
+
+# 우주 전시회 / 천문대 일정 크롤링 설정
+EXHIBITION_SOURCES_FILE = "data/exhibition_sources.json"  # 기관별 목록 페이지와 셀렉터
+EXHIBITION_STATE_FILE = "data/exhibition_state.json"  # 목록 페이지 해시, 전송한 일정
+EXHIBITION_ENDPOINT = "/api/admin/crawler/events"
+EXHIBITION_MAX_EVENTS_PER_RUN = 10
+EXHIBITION_WORKERS = 4
+EXHIBITION_SENT_RETENTION_DAYS = 180  # 전송 기록 보관 기간 (같은 일정 재전송 방지)
+
+# 보충 기사 주제 순환 설정
+FILLER_TOPICS_FILE = "data/filler_topics.json"
+FILLER_ROTATION_STATE_FILE = "data/filler_rotation.json"
+FILLER_ROTATION_HORIZON_HOURS = 7 * 24  # 이 기간 안에 쓴 주제는 다시 쓰지 않음 (DB 중복 체크 기간과 동일)
 REQUEST_TIMEOUT = 30
 
+# 스프링 전송 아웃박스 (전송 확인 전까지 보관 후 재시도)
+OUTBOX_DB = "data/outbox.db"
+OUTBOX_POLL_INTERVAL = 15  # 디스패처 확인 주기 (초), 새 게시글이 쌓이면 즉시 깨움
+OUTBOX_BATCH_SIZE = 20
+OUTBOX_BASE_DELAY = 30  # 첫 재시도 대기 (초), 실패할 때마다 2배
+OUTBOX_MAX_DELAY = 60 * 60  # 재시도 대기 상한 (초)
+OUTBOX_MAX_ATTEMPTS = 12  # 이 횟수를 넘으면 실패(dead) 처리
+OUTBOX_RETENTION_DAYS = 7  # 전송 완료 기록 보관 기간
+
 # 중복 처리 설정
 MAX_RETRY_COUNT = 5  # 최대 재시도 횟수
 DUPLICATE_CHECK_ENABLED = True  # 중복 체크 활성화
 
+# 이미지 검증 설정
+IMAGE_PROBE_TIMEOUT = 5  # 이미지 Range 요청 타임아웃 (초)
+IMAGE_PROBE_WORKERS = 8  # 동시 검증 스레드 수
+IMAGE_MAX_CANDIDATES = 6  # 기사당 검증할 최대 후보 수
+IMAGE_CACHE_SIZE = 2000  # URL별 메타데이터 캐시 항목 수
+IMAGE_CACHE_TTL = 6 * 60 * 60  # 캐시 유지 시간 (초)
+IMAGE_MIN_WIDTH = 200
+IMAGE_MIN_HEIGHT = 120
+
+# 기사 페이지 수집 상한 (메모리 제한)
+BOUNDED_FETCH_ENABLED = True
+MAX_ARTICLE_BYTES = 512 * 1024  # 기사당 최대 수집 바이트
+BOUNDED_FETCH_CHUNK_SIZE = 16 * 1024
+BOUNDED_FETCH_MAX_PARAGRAPHS = 40  # 이만큼 문단을 보면 수집 중단
+BOUNDED_FETCH_MIN_PARAGRAPHS = 3  # </article> 중단 전에 필요한 최소 문단 수
+
+# Selenium 렌더 팜 설정 (브라우저를 별도 프로세스에서 실행)
+RENDER_FARM_ENABLED = True
+RENDER_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))  # 워커 프로세스 수
+RENDER_JOB_TIMEOUT = 40  # 작업당 최대 시간 (초), 초과 시 워커 강제 종료
+RENDER_WORKER_MAX_JOBS = 20  # 워커당 처리 작업 수 (초과 시 재생성)
+RENDER_ACQUIRE_TIMEOUT = 60  # 유휴 워커 대기 시간 (초)
+
+# 헬스체크 설정 (백그라운드 프로브)
+HEALTH_PROBE_INTERVAL = 15  # 프로브 주기 (초)
+HEALTH_PROBE_TIMEOUT = 5  # 프로브별 타임아웃 (초)
+HEALTH_STALE_AFTER = 45  # 이 시간보다 오래된 결과는 stale 처리 (초)
+
+# 페이지 스냅샷 저장소 (추출 로직 오프라인 재검증용)
+SNAPSHOT_ENABLED = True
+SNAPSHOT_DIR = "data/snapshots"
+SNAPSHOT_RETENTION_DAYS = 14
+SNAPSHOT_MAX_BYTES = 500 * 1024 * 1024  # 압축 후 전체 용량 상한
+SNAPSHOT_COMPRESSION_LEVEL = 10  # zstd 레벨 (gzip 대체 시 최대 9)
+
+# 도메인별 요청 예절 (robots.txt, 호스트별 속도 제한)
+POLITENESS_ENABLED = True
+ROBOTS_USER_AGENT = "ByeolnightBot"  # robots.txt 규칙 매칭용 이름
+ROBOTS_CACHE_TTL = 6 * 60 * 60  # robots.txt 캐시 시간 (초)
+ROBOTS_EXEMPT_HOSTS = ["news.google.com"]  # RSS 피드/리다이렉트 엔드포인트 (피드 리더용)
+POLITENESS_RATE = 0.5  # 호스트별 초당 요청 수 (토큰 버킷)
+POLITENESS_BURST = 2  # 한 번에 몰아서 보낼 수 있는 요청 수
+POLITENESS_HOST_CONCURRENCY = 2  # 호스트별 동시 요청 수
+POLITENESS_MAX_WAIT = 60  # 이보다 오래 기다려야 하면 요청 포기 (초)
+POLITENESS_BACKOFF = 120  # 429/503 에 Retry-After 가 없을 때 중지 시간 (초)
+POLITENESS_HOST_OVERRIDES = {
+    # 백필 후보 링크는 모두 구글 뉴스 주소 (실제 기사는 언론사 호스트) → 동시성을 BACKFILL_WORKERS 만큼 허용
+    "news.google.com": {"rate": 1.0, "burst": 5, "concurrency": 8},
+}
+
+# 의미 기반 중복 탐지 (해시 n-gram 임베딩 색인, 사용 여부/기준은 크롤링 설정의 semantic_*)
+SEMANTIC_DEDUP_DIR = "data"  # semantic_<분류>.json 저장 위치
+SEMANTIC_DEDUP_DIM = 512  # 임베딩 차원 (numpy 행렬 메모리: 항목 수 x 차원 x 4바이트)
+SEMANTIC_DEDUP_RETENTION_DAYS = 30
+SEMANTIC_DEDUP_MAX_ITEMS = 20000
+
+# 교차 소스 기사 묶음 (MinHash LSH, 묶음 기준은 크롤링 설정의 story_similarity)
+STORY_MINHASH_PERMUTATIONS = 64
+STORY_LSH_BANDS = 32  # 밴드당 2행 → 유사도 0.4 쌍은 거의 항상 후보가 됨
+
+# 다중 인스턴스 조정 (공유 SQLite: 회차별 작업 리스, 소스/도메인 분할, 게시 선점)
+COORDINATION_ENABLED = os.getenv("COORDINATION_ENABLED", "false").lower() == "true"
+COORDINATION_DB = os.getenv("COORDINATION_DB", "data/coordination.db")  # 모든 인스턴스가 접근하는 공유 볼륨 경로
+NODE_ID = os.getenv("NODE_ID", "")  # 비우면 호스트명-PID
+NODE_HEARTBEAT_INTERVAL = 10  # 하트비트/리스 갱신 주기 (초)
+NODE_TTL = 30  # 하트비트가 이 시간보다 오래되면 노드 이탈로 간주 (초)
+JOB_LEASE_TTL = 60  # 작업 리스 만료 (실행 중에는 하트비트가 갱신)
+JOB_SLOT_KEEP = 6 * 60 * 60  # 끝난 회차 리스 유지 시간 (늦게 깨어난 노드의 재실행 방지)
+HASH_RING_VNODES = 64  # 노드당 가상 노드 수
+SHARED_CLAIM_RETENTION_DAYS = 30
+
+# 이미 본 URL / GUID / 제목 (시간 구간별 Bloom 필터 + SQLite 정확 확인)
+SEEN_FILTER_DB = "data/seen.db"
+SEEN_FILTER_FILE = "data/seen_filter.bin"  # 필터 스냅샷 (없거나 손상되면 DB 에서 재구성)
+SEEN_FILTER_RETENTION_DAYS = 30
+SEEN_FILTER_SLICE_HOURS = 24  # 세대 하나의 기간 (보관 기간이 지나면 세대 단위로 버림)
+SEEN_FILTER_SLICE_CAPACITY = 20000  # 세대당 첫 필터 용량 (넘으면 2배 용량 필터 추가)
+SEEN_FILTER_ERROR_RATE = 0.01
+SEEN_FILTER_SAVE_INTERVAL = 10 * 60  # 필터 파일 저장 + 오래된 행 정리 주기 (초), 종료 시에도 저장
+
+# 기사 요약 (rules: 제목 규칙, http: 요약 서비스 - 로컬 대역 서버는 python -m ai.summary_server)
+SUMMARIZER_BACKEND = os.getenv("SUMMARIZER_BACKEND", "rules")
+SUMMARIZER_URL = os.getenv("SUMMARIZER_URL", "http://127.0.0.1:8090/summarize")
+SUMMARIZER_MODEL = os.getenv("SUMMARIZER_MODEL", "")
+SUMMARIZER_TIMEOUT = 8  # 기사당 최대 대기 (초), 넘으면 규칙 기반 요약
+SUMMARIZER_BATCH_SIZE = 8  # 요청 하나에 담는 최대 기사 수
+SUMMARIZER_BATCH_WAIT = 0.05  # 배치를 모으는 최대 대기 (초)
+SUMMARIZER_MAX_CONCURRENCY = 2  # 요약 서비스 동시 요청 수
+SUMMARIZER_INPUT_CHARS = 4000  # 본문 앞부분만 전송
+SUMMARIZER_MAX_CHARS = 300
+SUMMARIZER_FAILURE_THRESHOLD = 3  # 연속 실패 배치 수
+SUMMARIZER_COOLDOWN = 60  # 연속 실패 후 원격 호출 중지 시간 (초)
+SUMMARY_CACHE_DB = "data/summary_cache.db"  # 내용 해시 → 요약
+SUMMARY_CACHE_RETENTION_DAYS = 90
+
+# 뉴스 피드 변화 감지 (조건부 요청 + 항목 목록 해시, 바뀐 피드의 새 항목만 처리)
+FEED_CHANGE_DETECTION = True
+FEED_STATE_FILE = "data/feed_state.json"
+FEED_STATE_RETENTION_DAYS = 14  # 처리한 항목 키 보관 기간 (피드에서 빠졌다 다시 올라온 항목도 다시 처리하지 않음)
+
+# 적응형 뉴스 폴링 (소스별 발행 간격 EMA 로 다음 확인 시각 추정, 고정 일정 실행은 그대로 유지)
+ADAPTIVE_SCHEDULE_ENABLED = os.getenv("ADAPTIVE_SCHEDULE_ENABLED", "false").lower() == "true"
+ADAPTIVE_STATE_FILE = "data/feed_rates.json"
+ADAPTIVE_TICK_MINUTES = 5  # 확인할 소스가 있는지 보는 주기 (분)
+ADAPTIVE_EMA_ALPHA = 0.3  # 새 간격 반영 비율
+ADAPTIVE_TARGET_NEW_ITEMS = 1.0  # 새 항목이 이만큼 쌓였을 것으로 예상될 때 확인
+ADAPTIVE_MIN_INTERVAL = 15 * 60  # 소스별 확인 간격 하한 (초)
+ADAPTIVE_MAX_INTERVAL = 12 * 60 * 60  # 소스별 확인 간격 상한 (초)
+ADAPTIVE_REQUEST_BUDGET = 12  # 시간당 피드 요청 상한 (모든 소스 합)
+ADAPTIVE_KNOWN_KEYS = 50  # 발행일 없는 항목 판별용으로 기억할 항목 키 수
+
+# 프로파일링 (POST /admin/profile/run 결과 파일, 상시 샘플링은 PROFILE_CONTINUOUS=true 일 때만)
+PROFILE_DIR = "logs/profiles"
+PROFILE_SAMPLE_INTERVAL = 0.005  # 요청 프로파일 샘플 간격 (초)
+PROFILE_MAX_DEPTH = 64  # 스택 최대 깊이 (넘는 부분은 잘라냄)
+PROFILE_CONTINUOUS = os.getenv("PROFILE_CONTINUOUS", "false").lower() == "true"
+PROFILE_CONTINUOUS_INTERVAL = 0.1  # 상시 샘플 간격 (초), 샘플 1회 ≈ 수십 µs 라 오버헤드 0.1% 미만
+PROFILE_CONTINUOUS_WINDOW_MINUTES = 60  # 분 단위 구간 보관 수
+
+# 발행일 파싱 설정
+DATE_PARSE_CACHE_SIZE = 4096  # 같은 날짜 문자열 재사용 캐시
+FEED_DEFAULT_UTC_OFFSET_HOURS = 9  # 시간대 표기가 없는 날짜는 KST 로 간주
+
+# 실행 이력 저장소 (분석용)
+RUN_HISTORY_DB = "data/run_history.db"
+RUN_HISTORY_RETENTION_DAYS = 30
+
+# 백필 설정 (장애 이후 과거 기간 재수집)
+BACKFILL_CHECKPOINT_FILE = "data/backfill_checkpoint.json"
+BACKFILL_WORKERS = 8  # 기사 처리 동시 스레드 수 (호스트별 제한은 POLITENESS_* 설정)
+BACKFILL_CANDIDATES_PER_DAY = 30  # 하루치 검색 결과 중 처리할 최대 후보 수
+BACKFILL_MAX_PER_DAY = 10  # 하루치 최대 게시 수
+BACKFILL_BATCH_SIZE = 10  # 스프링 전송 배치 크기 (배치마다 체크포인트 저장)
+BACKFILL_SEND_CONCURRENCY = 4
+BACKFILL_MAX_DAYS = 90  # 한 번에 요청할 수 있는 최대 기간
+BACKFILL_USE_SELENIUM = False  # 대량 처리 시 렌더링은 기본 비활성화
+
 # 작성자 ID 설정
 NEWS_AUTHOR_ID = "newsbot"  # 뉴스봇 ID
 EXHIBITION_AUTHOR_ID = "exhibitionbot"  # 전시회봇 ID
 
 # 로깅 설정
 LOG_LEVEL = "INFO"
+LOG_JSON_FORMAT = os.getenv("LOG_JSON_FORMAT", "false").lower() == "true"  # JSON Lines 구조화 로그
+LOG_SAMPLE_EVERY = 20  # 항목별 반복 로그는 N건마다 1건만 기록
 LOG_FILE_MAX_SIZE = 10 * 1024 * 1024  # 10MB
 LOG_BACKUP_COUNT = 5
\ No newline at end of file
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+소스별 갱신 주기 추정 + 적응형 폴링 일정
+
+- 피드를 읽을 때마다(고정 일정/수동/적응형 모두) 항목 발행일로 새 항목 사이 간격의 지수 이동 평균(EMA)을 갱신
+  발행일이 없는 항목은 이전에 본 항목 키와 비교해 새 항목 수만 세고, 간격은 (경과 시간 / 새 항목 수)로 추정
+  2xx/304 가 아닌 응답(429, 5xx 등)은 관측하지 않음 (빈 피드로 보고 EMA 를 늘리지 않도록)
+- 새 항목이 없으면 마지막 항목 이후 경과 시간이 EMA 보다 길 때 그만큼 EMA 를 늘림 → 조용한 소스는 점점 덜 확인
+- 다음 확인 시각 = 마지막 확인 + EMA x ADAPTIVE_TARGET_NEW_ITEMS (ADAPTIVE_MIN/MAX_INTERVAL 로 제한)
+- 시간당 피드 요청 수(ADAPTIVE_REQUEST_BUDGET)를 넘지 않도록, 확인할 때가 된 소스 중 새 항목이 많을 것으로 예상되는 순서로 선택
+  예산은 모든 피드 요청(고정 일정/수동/백필 포함)을 charge_feed_request 로 기록해 계산, 적응형 틱은 고른 소스만큼 미리 예약
+
+상태: 다중 인스턴스 조정(COORDINATION_ENABLED)이 켜져 있으면 조정 저장소의 공유 상태 (모든 노드가 같은 예산/추정값 사용),
+아니면 ADAPTIVE_STATE_FILE (JSON, 원자적 저장)
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import (
+    ADAPTIVE_STATE_FILE, ADAPTIVE_EMA_ALPHA, ADAPTIVE_TARGET_NEW_ITEMS, ADAPTIVE_MIN_INTERVAL,
+    ADAPTIVE_MAX_INTERVAL, ADAPTIVE_REQUEST_BUDGET, ADAPTIVE_KNOWN_KEYS
+)
+
+logger = logging.getLogger(__name__)
+
+_BUDGET_WINDOW = 60 * 60  # 요청 예산 구간 (초)
+_SHARED_STATE_NAME = "feed_rates"
+
+
+def _item_key(value: str) -> str:
+    return hashlib.blake2b(value.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _new_entry() -> Dict:
+    return {"ema": None, "last_pub": None, "last_poll": None, "last_attempt": None, "polls": 0, "new_items": 0,
+            "keys": []}
+
+
+def _load_file(path: str) -> Dict:
+    try:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except Exception as e:
+        logger.error(f"소스 갱신 주기 상태 로드 실패: {e}")
+    return {}
+
+
+def _normalize(state: Dict) -> Dict:
+    """기본 키 채움 + 요청 기록 형식 [시각, 소스, 예약 여부] (이전 형식은 시각만)"""
+    state.setdefault("sources", {})
+    state["polls"] = [poll if isinstance(poll, list) else [poll, "", 0] for poll in state.get("polls", [])]
+    return state
+
+
+class _FileStore:
+    """단일 노드 상태: 메모리 사본 + JSON 파일"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state = _normalize(_load_file(path))
+
+    @contextmanager
+    def update(self):
+        with self._lock:
+            yield self._state
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._state, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.error(f"소스 갱신 주기 상태 저장 실패: {e}")
+
+    @contextmanager
+    def read(self):
+        with self._lock:
+            yield self._state
+
+
+class _SharedStore:
+    """다중 인스턴스 상태: 조정 저장소의 공유 상태 (읽고 고치는 동안 쓰기 잠금)"""
+
+    def __init__(self, coordinator, seed_path: str):
+        self.coordinator = coordinator
+        self.seed_path = seed_path
+
+    @contextmanager
+    def update(self):
+        with self.coordinator.shared_state(_SHARED_STATE_NAME) as state:
+            if not state:
+                state.update(_load_file(self.seed_path))  # 처음 켤 때는 이 노드의 로컬 기록으로 시작
+            yield _normalize(state)
+
+    @contextmanager
+    def read(self):
+        yield _normalize(self.coordinator.read_shared_state(_SHARED_STATE_NAME) or _load_file(self.seed_path))
+
+
+class FeedRates:
+    """소스별 발행 간격 EMA, 다음 확인 시각, 피드 요청 예산 (스레드 안전, 조정 저장소 사용 시 노드 간 공유)"""
+
+    def __init__(self, state_file: str = ADAPTIVE_STATE_FILE, alpha: float = ADAPTIVE_EMA_ALPHA,
+                 target_items: float = ADAPTIVE_TARGET_NEW_ITEMS, min_interval: float = ADAPTIVE_MIN_INTERVAL,
+                 max_interval: float = ADAPTIVE_MAX_INTERVAL, budget: int = ADAPTIVE_REQUEST_BUDGET,
+                 known_keys: int = ADAPTIVE_KNOWN_KEYS, store=None):
+        self.state_file = state_file
+        self.alpha = alpha
+        self.target_items = target_items
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.budget = budget
+        self.known_keys = known_keys
+        if store is None:
+            from utils.coordination import get_coordinator
+            coordinator = get_coordinator()
+            store = _SharedStore(coordinator, state_file) if coordinator.enabled else _FileStore(state_file)
+        self._store = store
+
+    def _interval(self, ema: Optional[float]) -> float:
+        if ema is None:
+            return self.min_interval
+        return min(self.max_interval, max(self.min_interval, ema * self.target_items))
+
+    def _update_ema(self, ema: Optional[float], sample: float) -> float:
+        return sample if ema is None else self.alpha * sample + (1 - self.alpha) * ema
+
+    def observe(self, source: str, items: Iterable[Tuple[Optional[float], str]], now: float = None) -> int:
+        """피드 한 번 읽은 결과 반영 (items: (발행 시각 epoch 또는 None, 항목 키), 304 면 빈 목록), 새 항목 수 반환"""
+        now = now or time.time()
+        items = list(items)
+        with self._store.update() as state:
+            entry = state["sources"].setdefault(source, _new_entry())
+            known = set(entry["keys"])
+            first = entry["last_poll"] is None
+            last_pub = entry["last_pub"]
+            dated = sorted(ts for ts, _ in items if ts is not None and ts <= now)
+            new_dated = dated if last_pub is None else [ts for ts in dated if ts > last_pub]
+            new_undated = [key for ts, key in items if ts is None and _item_key(key) not in known]
+
+            ema = entry["ema"]
+            if len(new_dated) >= 1:
+                # 발행일 간격으로 EMA 갱신 (첫 확인이면 피드에 남은 항목끼리 간격으로 초기값)
+                previous = last_pub if last_pub is not None else new_dated[0]
+                for ts in new_dated:
+                    if ts > previous:
+                        ema = self._update_ema(ema, ts - previous)
+                    previous = ts
+                entry["last_pub"] = dated[-1]
+            if new_undated and not first and not new_dated:
+                ema = self._update_ema(ema, (now - entry["last_poll"]) / len(new_undated))
+            new_count = 0 if first else len(new_dated) + len(new_undated)
+            if new_count == 0 and not first:
+                # 조용한 구간도 관측값: 마지막 항목 이후 경과 시간이 EMA 보다 길면 EMA 를 늘림
+                reference = entry["last_pub"] if entry["last_pub"] is not None else entry["last_poll"]
+                quiet = now - reference
+                if ema is None or quiet > ema:
+                    ema = self._update_ema(ema, quiet)
+
+            entry.update(
+                ema=ema, last_poll=now, polls=entry["polls"] + 1, new_items=entry["new_items"] + new_count,
+                keys=[_item_key(key) for _, key in items if key][:self.known_keys] if items else entry["keys"]
+            )
+        return new_count
+
+    def next_poll(self, source: str) -> Optional[float]:
+        """다음 확인 시각 (한 번도 읽지 않은 소스는 None = 바로 확인)"""
+        with self._store.read() as state:
+            entry = state["sources"].get(source)
+            if entry is None or entry["last_poll"] is None:
+                return None
+            return entry["last_poll"] + self._interval(entry["ema"])
+
+    def charge(self, source: str, now: float = None):
+        """피드 요청 한 건을 예산에 기록 (take_due 가 이 소스에 예약해 둔 몫이 있으면 그것을 사용)"""
+        now = now or time.time()
+        with self._store.update() as state:
+            polls = [poll for poll in state["polls"] if poll[0] > now - _BUDGET_WINDOW]
+            reserved = next((poll for poll in polls if poll[1] == source and poll[2]), None)
+            if reserved is not None:
+                reserved[2] = 0
+            else:
+                polls.append([now, source, 0])
+            state["polls"] = polls
+
+    def take_due(self, sources: List[str], now: float = None) -> List[str]:
+        """확인할 때가 된 소스를 요청 예산 안에서 선택 (새 항목이 많을 것으로 예상되는 순서, 선택한 만큼 예산 예약)
+
+        예산은 최근 한 시간 동안의 모든 피드 요청 (고정 일정 실행 포함, 조정 저장소 사용 시 모든 노드 합)
+        """
+        now = now or time.time()
+        with self._store.update() as state:
+            recent = [poll for poll in state["polls"] if poll[0] > now - _BUDGET_WINDOW]
+            remaining = max(0, self.budget - len(recent))
+            due = []
+            for source in sources:
+                entry = state["sources"].get(source)
+                # 읽기에 실패한 소스도 한 간격은 쉬었다가 다시 시도
+                last = max(entry["last_poll"] or 0, entry.get("last_attempt") or 0) if entry else 0
+                if entry is None or entry["last_poll"] is None:
+                    if now >= last + self.min_interval:
+                        due.append((float('inf'), source))
+                    continue
+                if now < last + self._interval(entry["ema"]):
+                    continue
+                expected = (now - entry["last_poll"]) / entry["ema"] if entry["ema"] else float('inf')
+                due.append((expected, source))
+            due.sort(key=lambda pair: -pair[0])
+            selected = [source for _, source in due[:remaining]]
+            # 선택한 소스만큼 예산 예약 (실제 요청 때 charge 가 예약분을 사용)
+            state["polls"] = recent + [[now, source, 1] for source in selected]
+            for source in selected:
+                state["sources"].setdefault(source, _new_entry())["last_attempt"] = now
+        if len(due) > len(selected):
+            logger.info(f"요청 예산 초과로 다음 틱으로 미룸: {[source for _, source in due[remaining:]]}")
+        return selected
+
+    def snapshot(self) -> Dict:
+        """소스별 추정 간격/다음 확인 시각 (/status 용)"""
+        now = time.time()
+        with self._store.read() as state:
+            sources = {}
+            for source, entry in state["sources"].items():
+                next_poll = entry["last_poll"] + self._interval(entry["ema"]) if entry["last_poll"] else None
+                sources[source] = {
+                    "ema_minutes": round(entry["ema"] / 60, 1) if entry["ema"] else None,
+                    "poll_interval_minutes": round(self._interval(entry["ema"]) / 60, 1),
+                    "next_poll": datetime.fromtimestamp(next_poll).isoformat(timespec="seconds") if next_poll else None,
+                    "polls": entry["polls"],
+                    "new_items": entry["new_items"]
+                }
+            return {
+                "requests_last_hour": sum(1 for poll in state["polls"] if poll[0] > now - _BUDGET_WINDOW),
+                "budget_per_hour": self.budget,
+                "shared": isinstance(self._store, _SharedStore),
+                "sources": sources
+            }
+
+
+_feed_rates = None
+_feed_rates_lock = threading.Lock()
+
+
+def get_feed_rates() -> FeedRates:
+    global _feed_rates
+    if _feed_rates is None:
+        with _feed_rates_lock:
+            if _feed_rates is None:
+                _feed_rates = FeedRates()
+    return _feed_rates
+
+
+def charge_feed_request(source: str):
+    """피드 요청 한 건을 요청 예산에 기록 (실패해도 크롤링에는 영향 없음)"""
+    try:
+        get_feed_rates().charge(source)
+    except (OSError, sqlite3.Error) as e:
+        logger.error(f"피드 요청 예산 기록 실패 ({source}): {e}")
+
+
+def observe_feed(source: str, entries: Iterable[Tuple[str, str]]) -> int:
+    """피드 항목 (발행일 문자열, guid 또는 링크) 관측 기록 (실패해도 크롤링에는 영향 없음)"""
+    from utils.date_parser import parse_pub_date
+    try:
+        items = []
+        for pub_date, key in entries:
+            parsed = parse_pub_date(pub_date) if pub_date else None
+            items.append((parsed.timestamp() if parsed else None, key))
+        return get_feed_rates().observe(source, items)
+    except Exception as e:
+        logger.error(f"소스 갱신 주기 기록 실패 ({source}): {e}")
+        return 0
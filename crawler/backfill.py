@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+과거 기간 백필 크롤링 (재개 가능한 체크포인트)
+
+장애 등으로 빠진 기간을 날짜 단위로 다시 수집:
+- 구글 뉴스 검색(after:/before:) + 대체 RSS 소스에서 기간 내 후보 수집
+- 도메인 예절 스케줄러(robots.txt, 호스트별 속도/동시성 제한) 안에서 병렬 처리
+- 기존 중복 규칙(DB + 로컬 캐시) 적용 후 배치 단위 전송 (전송이 확인된 기사만 중복 캐시에 기록)
+- 배치/날짜마다 체크포인트 저장 (전송 실패가 있는 날짜는 완료 처리하지 않음) → 중단 후 같은 기간으로 다시 실행하면 이어서 진행
+
+사용법:
+    python -m crawler.backfill 2025-01-01 2025-01-07 [--fresh] [--sources google,연합뉴스] [--selenium]
+"""
+import argparse
+import contextvars
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+from urllib.parse import quote_plus
+
+import requests
+from bs4 import BeautifulSoup
+
+from config import (
+    BACKFILL_CHECKPOINT_FILE, BACKFILL_WORKERS, BACKFILL_CANDIDATES_PER_DAY, BACKFILL_MAX_PER_DAY, BACKFILL_BATCH_SIZE, BACKFILL_SEND_CONCURRENCY,
+    BACKFILL_MAX_DAYS, BACKFILL_USE_SELENIUM
+)
+from utils.article import Article
+from utils.crawl_settings import get_settings
+from utils.date_parser import FEED_DEFAULT_TZ
+from utils.politeness import get_scheduler, polite_get
+from utils.text_normalizer import strip_title_source, normalize_title
+from utils.run_history import record_rejection
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_SOURCE = "google"
+GOOGLE_BACKFILL_QUERY = "우주 뉴스"
+
+_run_lock = threading.Lock()
+
+
+class BackfillAlreadyRunning(RuntimeError):
+    """다른 백필이 실행 중"""
+
+
+class BackfillCheckpoint:
+    """백필 진행 상태 (완료 날짜, 전송한 제목, 통계) - 원자적 JSON 저장"""
+
+    def __init__(self, path: str, start: date, end: date, resume: bool = True):
+        self.path = path
+        self._lock = threading.Lock()
+        data = self._load() if resume else None
+        if data and data.get("start") == start.isoformat() and data.get("end") == end.isoformat():
+            self.data = data
+            logger.info(f"백필 체크포인트에서 재개: 완료 {len(data['completed_days'])}일")
+        else:
+            self.data = {
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "completed_days": [],
+                "sent_titles": [],
+                "stats": {"candidates": 0, "processed": 0, "accepted": 0, "duplicates": 0, "sent": 0, "failed": 0},
+                "started_at": datetime.now().isoformat(),
+                "updated_at": None,
+                "finished": False
+            }
+        self.completed_days = set(self.data["completed_days"])
+        self.sent_titles = set(self.data["sent_titles"])
+
+    def _load(self) -> Optional[Dict]:
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"백필 체크포인트 로드 실패: {e}")
+        return None
+
+    def add_stats(self, **counts):
+        with self._lock:
+            for key, value in counts.items():
+                self.data["stats"][key] += value
+
+    def mark_sent(self, titles: List[str]):
+        with self._lock:
+            self.sent_titles.update(normalize_title(title) for title in titles)
+
+    def mark_day(self, day: date):
+        with self._lock:
+            self.completed_days.add(day.isoformat())
+
+    def save(self, finished: bool = False):
+        with self._lock:
+            self.data["completed_days"] = sorted(self.completed_days)
+            self.data["sent_titles"] = sorted(self.sent_titles)
+            self.data["updated_at"] = datetime.now().isoformat()
+            self.data["finished"] = finished
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def parse_day(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def validate_range(start: date, end: date):
+    """기간 검증 (잘못된 입력은 ValueError)"""
+    if start > end:
+        raise ValueError("시작일이 종료일보다 늦습니다")
+    if end > date.today():
+        raise ValueError("종료일은 오늘 이후일 수 없습니다")
+    if (end - start).days + 1 > BACKFILL_MAX_DAYS:
+        raise ValueError(f"한 번에 최대 {BACKFILL_MAX_DAYS}일까지 백필할 수 있습니다")
+
+
+def list_sources() -> List[str]:
+    """백필 대상 소스 이름 (구글 뉴스 + 대체 RSS)"""
+    from crawler.optimized_news_crawler import ALTERNATIVE_RSS_SOURCES
+    return [GOOGLE_SOURCE] + [source['name'] for source in ALTERNATIVE_RSS_SOURCES]
+
+
+def _fetch_rss_items(url: str, source_name: str) -> List:
+    from crawler.adaptive_schedule import charge_feed_request
+    # 백필 요청도 시간당 피드 요청 예산에 포함 (실패한 요청 포함, 보내지 않은 요청 제외)
+    try:
+        resp = polite_get(url, timeout=get_settings(source_name).feed_timeout)
+    except requests.RequestException:
+        charge_feed_request(source_name)
+        raise
+    charge_feed_request(source_name)
+    return BeautifulSoup(resp.content, "xml").find_all("item")
+
+
+def _item_text(item, tag: str) -> str:
+    found = item.find(tag)
+    return found.get_text(strip=True) if found else ""
+
+
+def collect_google_candidates(day: date) -> List[Article]:
+    """구글 뉴스 검색의 기간 연산자로 하루치 후보 수집"""
+    query = f"{GOOGLE_BACKFILL_QUERY} after:{day.isoformat()} before:{(day + timedelta(days=1)).isoformat()}"
+    url = f"https://news.google.com/rss/search?q={quote_plus(query)}&hl=ko&gl=KR&ceid=KR:ko"
+    candidates = []
+    for item in _fetch_rss_items(url, "GoogleNews")[:BACKFILL_CANDIDATES_PER_DAY]:
+        title = _item_text(item, "title")
+        if not title:
+            continue
+        candidates.append(Article(
+            title, "GoogleNews", url=_item_text(item, "link"), outlet=_item_text(item, "source") or "구글뉴스",
+            published_at=_item_text(item, "pubDate"), description=_item_text(item, "description"),
+            guid=_item_text(item, "guid")
+        ))
+    return candidates
+
+
+def collect_feed_candidates(feed: Dict) -> List[Article]:
+    """대체 RSS 소스의 전체 항목 중 키워드가 맞는 후보 (날짜 필터는 호출하는 쪽에서)"""
+    candidates = []
+    for item in _fetch_rss_items(feed['url'], feed['name']):
+        title = _item_text(item, "title")
+        if title and any(keyword in title for keyword in feed['keywords']):
+            candidates.append(Article(title, feed['name'], url=_item_text(item, "link"),
+                                      published_at=_item_text(item, "pubDate"),
+                                      description=_item_text(item, "description"), guid=_item_text(item, "guid")))
+    return candidates
+
+
+class BackfillJob:
+    """기간 백필 실행기"""
+
+    def __init__(self, start: date, end: date, sources: List[str] = None, resume: bool = True,
+                 use_selenium: bool = BACKFILL_USE_SELENIUM, checkpoint_path: str = BACKFILL_CHECKPOINT_FILE):
+        validate_range(start, end)
+        available = list_sources()
+        self.sources = sources or available
+        unknown = [name for name in self.sources if name not in available]
+        if unknown:
+            raise ValueError(f"알 수 없는 소스: {', '.join(unknown)} (사용 가능: {', '.join(available)})")
+        self.start = start
+        self.end = end
+        self.use_selenium = use_selenium
+        self.settings = get_settings()  # 백필 동안 같은 설정 사용
+        self.checkpoint = BackfillCheckpoint(checkpoint_path, start, end, resume)
+        self._feed_items = None
+
+    def _days(self):
+        day = self.start
+        while day <= self.end:
+            yield day
+            day += timedelta(days=1)
+
+    def _feed_candidates(self) -> List[Article]:
+        """대체 RSS는 날짜 검색이 없으므로 한 번만 받아 날짜별로 나눠 사용"""
+        if self._feed_items is None:
+            from crawler.optimized_news_crawler import ALTERNATIVE_RSS_SOURCES
+            self._feed_items = []
+            for feed in ALTERNATIVE_RSS_SOURCES:
+                if feed['name'] not in self.sources:
+                    continue
+                try:
+                    self._feed_items.extend(collect_feed_candidates(feed))
+                except Exception as e:
+                    logger.error(f"{feed['name']} RSS 수집 실패: {e}")
+        return self._feed_items
+
+    def collect_candidates(self, day: date) -> List[Article]:
+        from crawler.optimized_news_crawler import is_in_date_range, is_similar_title
+        # 날짜 경계는 피드 기본 시간대(KST) 자정 기준
+        day_start = datetime.combine(day, datetime.min.time(), tzinfo=FEED_DEFAULT_TZ)
+        day_end = day_start + timedelta(days=1)
+
+        raw = []
+        if GOOGLE_SOURCE in self.sources:
+            try:
+                raw.extend(collect_google_candidates(day))
+            except Exception as e:
+                logger.error(f"구글 뉴스 백필 검색 실패 ({day}): {e}")
+        raw.extend(item for item in self._feed_candidates() if item.published_at
+                   and is_in_date_range(item.published_at, day_start, day_end))
+
+        # 실행 내 중복/유사 제목 및 이미 전송한 제목 제외 (크롤러와 같은 규칙)
+        candidates, seen_keywords = [], []
+        for item in raw:
+            if not is_in_date_range(item.published_at, day_start, day_end):
+                record_rejection(item.source, item.raw_title, "out_of_range")
+                continue
+            clean_title = strip_title_source(item.raw_title)
+            title_key = normalize_title(clean_title)
+            title_keywords = set(clean_title.lower().split())
+            if title_key in self.checkpoint.sent_titles:
+                record_rejection(item.source, clean_title, "already_sent")
+                continue
+            if not title_keywords or is_similar_title(title_keywords, seen_keywords):
+                record_rejection(item.source, clean_title, "similar_title")
+                continue
+            seen_keywords.append(title_keywords)
+            item.title = clean_title
+            candidates.append(item)
+
+        # 이미 게시한 URL/GUID/제목 (체크포인트 밖, 다른 백필/정기 실행 포함) - 본문 추출 전에 제외
+        from utils.duplicate_checker import filter_seen_articles
+        candidates, seen = filter_seen_articles(candidates)
+        for item in seen:
+            record_rejection(item.source, item.title, "already_seen")
+        return candidates
+
+    def _process(self, candidate: Article) -> Optional[Article]:
+        from crawler.optimized_news_crawler import process_news_item
+        return process_news_item(candidate, use_selenium=self.use_selenium, settings=self.settings)
+
+    def _send_batch(self, batch: List[Article], pool: ThreadPoolExecutor) -> int:
+        from crawler.news_only_crawler import send_news_to_spring
+        from utils.duplicate_checker import remember_links, remember_titles
+        from utils.run_history import record_item
+
+        def send(article):
+            sent = send_news_to_spring(article)
+            record_item(source=article.source, title=article.title, decision="accepted",
+                        dedup="new", sent=sent, **(article.metrics or {}))
+            return sent
+
+        results = list(pool.map(lambda article: contextvars.copy_context().run(send, article), batch))
+        sent_titles = [article.title for article, ok in zip(batch, results) if ok]
+        # 전송이 확인된 기사만 중복 캐시에 기록 (실패한 기사는 다음 실행에서 다시 시도)
+        if sent_titles:
+            remember_titles(sent_titles)
+        remember_links([article for article, ok in zip(batch, results) if ok])
+        self.checkpoint.mark_sent(sent_titles)
+        self.checkpoint.add_stats(sent=len(sent_titles), failed=len(batch) - len(sent_titles))
+        self.checkpoint.save()
+        return len(sent_titles)
+
+    def run_day(self, day: date, send_pool: ThreadPoolExecutor) -> int:
+        from utils.duplicate_checker import filter_duplicate_articles
+
+        candidates = self.collect_candidates(day)
+        self.checkpoint.add_stats(candidates=len(candidates))
+
+        # 같은 호스트 후보는 한 작업자에서 이어서 처리 (커넥션 재사용, 호스트별 속도 제한은 스케줄러가 적용)
+        results = get_scheduler().run_batched(candidates, lambda candidate: candidate.url, self._process,
+                                              max_workers=BACKFILL_WORKERS)
+        articles = [article for article in results if article]
+        articles = articles[:BACKFILL_MAX_PER_DAY]
+
+        new_articles = filter_duplicate_articles(articles, remember=False)
+        kept = {id(article) for article in new_articles}
+        for article in articles:
+            if id(article) not in kept:
+                record_rejection(article.source, article.title, "duplicate", dedup="duplicate",
+                                 **(article.metrics or {}))
+        self.checkpoint.add_stats(processed=len(candidates), accepted=len(new_articles),
+                                  duplicates=len(articles) - len(new_articles))
+
+        sent = 0
+        for index in range(0, len(new_articles), BACKFILL_BATCH_SIZE):
+            sent += self._send_batch(new_articles[index:index + BACKFILL_BATCH_SIZE], send_pool)
+
+        # 전송 실패가 있으면 완료 처리하지 않음 (다음 실행에서 보내지 못한 기사만 다시 시도)
+        if sent == len(new_articles):
+            self.checkpoint.mark_day(day)
+        else:
+            logger.warning(f"백필 {day}: 전송 실패 {len(new_articles) - sent}개, 다음 실행에서 다시 시도")
+        self.checkpoint.save()
+        logger.info(f"백필 {day}: 후보 {len(candidates)}개 → 수락 {len(new_articles)}개 → 전송 {sent}개")
+        return sent
+
+    def run(self) -> Dict:
+        pending = [day for day in self._days() if day.isoformat() not in self.checkpoint.completed_days]
+        logger.info(f"백필 시작: {self.start} ~ {self.end} (남은 {len(pending)}일, 소스 {', '.join(self.sources)})")
+
+        with ThreadPoolExecutor(max_workers=BACKFILL_SEND_CONCURRENCY, thread_name_prefix="backfill-send") as send_pool:
+            for day in pending:
+                try:
+                    self.run_day(day, send_pool)
+                except Exception as e:
+                    # 실패한 날짜는 완료 처리하지 않으므로 다음 실행에서 다시 시도
+                    logger.error(f"백필 {day} 실패: {e}")
+
+        finished = all(day.isoformat() in self.checkpoint.completed_days for day in self._days())
+        self.checkpoint.save(finished=finished)
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "completed_days": len(self.checkpoint.completed_days),
+            "total_days": (self.end - self.start).days + 1,
+            "finished": finished,
+            **self.checkpoint.data["stats"]
+        }
+
+
+def run_backfill(start: date, end: date, sources: List[str] = None, resume: bool = True,
+                 use_selenium: bool = BACKFILL_USE_SELENIUM) -> Dict:
+    """백필 실행 (동시에 하나만)"""
+    from utils.logger_setup import new_run_id
+    from utils.run_history import start_run
+
+    job = BackfillJob(start, end, sources=sources, resume=resume, use_selenium=use_selenium)
+    if not _run_lock.acquire(blocking=False):
+        raise BackfillAlreadyRunning("이미 백필이 실행 중입니다")
+    try:
+        run_id = new_run_id("backfill")
+        recorder = start_run(run_id, "backfill")
+        result = job.run()
+        recorder.finish(result["accepted"], result["sent"])
+        return {**result, "run_id": run_id}
+    finally:
+        _run_lock.release()
+
+
+def is_backfill_running() -> bool:
+    return _run_lock.locked()
+
+
+def get_backfill_status(checkpoint_path: str = BACKFILL_CHECKPOINT_FILE) -> Dict:
+    """실행 여부와 마지막 체크포인트 요약"""
+    status = {"running": is_backfill_running(), "checkpoint": None}
+    try:
+        if os.path.exists(checkpoint_path):
+            with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            status["checkpoint"] = {
+                key: data.get(key) for key in ("start", "end", "completed_days", "stats", "updated_at", "finished")
+            }
+    except Exception as e:
+        logger.error(f"백필 체크포인트 조회 실패: {e}")
+    return status
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="과거 기간 우주 뉴스 백필")
+    arg_parser.add_argument("start", type=parse_day, help="시작일 (YYYY-MM-DD)")
+    arg_parser.add_argument("end", type=parse_day, help="종료일 (YYYY-MM-DD, 포함)")
+    arg_parser.add_argument("--sources", help="쉼표로 구분한 소스 (기본: 전체)")
+    arg_parser.add_argument("--fresh", action="store_true", help="체크포인트를 무시하고 처음부터")
+    arg_parser.add_argument("--selenium", action="store_true", help="Selenium 본문 개선 사용")
+    args = arg_parser.parse_args()
+
+    from utils.logger_setup import setup_logger
+    setup_logger()
+
+    sources = [name.strip() for name in args.sources.split(",")] if args.sources else None
+    try:
+        result = run_backfill(args.start, args.end, sources=sources, resume=not args.fresh,
+                              use_selenium=args.selenium or BACKFILL_USE_SELENIUM)
+    except ValueError as e:
+        arg_parser.error(str(e))
+    finally:
+        from utils.seen_filter import shutdown_seen_filter
+        shutdown_seen_filter()
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+우주 전시회 / 천문대 일정 크롤링
+
+- 기관별 목록 페이지는 data/exhibition_sources.json 에서 관리 (셀렉터가 없으면 링크 전체에서 제목 키워드로 추림)
+- 목록 페이지는 조건부 요청(ETag / Last-Modified) 후 항목 목록의 해시를 비교해 바뀐 페이지만 처리
+- 상세 페이지 수집/본문 추출/중복 체크/전송은 뉴스 크롤러와 같은 계층 사용
+  (도메인 예절 스케줄러, 상한 수집, extract_article_from_html, filter_duplicate_articles, Admin 전송)
+- 새 일정은 아웃박스에 저장 후 디스패처가 재시도하며 전송, 저장하지 못한 일정이 있으면
+  그 목록 페이지의 해시를 갱신하지 않아 다음 실행에서 다시 시도
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+from config import (
+    EVENT_API_KEY, EXHIBITION_AUTHOR_ID, EXHIBITION_SOURCES_FILE, EXHIBITION_STATE_FILE, EXHIBITION_ENDPOINT,
+    EXHIBITION_MAX_EVENTS_PER_RUN, EXHIBITION_WORKERS, EXHIBITION_SENT_RETENTION_DAYS
+)
+from utils.crawl_settings import get_settings
+from utils.duplicate_checker import create_title_hash
+from utils.politeness import get_scheduler, polite_get, PolitenessError
+from utils.run_history import record_rejection
+from utils.text_normalizer import normalize_title
+
+logger = logging.getLogger(__name__)
+
+# 2025.01.06 / 2025-1-6 / 2025년 1월 6일 형태의 날짜
+EVENT_DATE_PATTERN = re.compile(r'(20\d{2})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})')
+
+KIND_LABELS = {"exhibition": "전시", "observatory": "천문대 프로그램"}
+
+
+def event_id(source_name: str, title: str) -> str:
+    """일정 식별자 (같은 기관의 같은 제목이면 같은 일정)"""
+    return create_title_hash(f"{source_name}:{normalize_title(title)}")
+
+
+def parse_event_period(text: str) -> Tuple[Optional[date], Optional[date]]:
+    """본문/목록 텍스트에서 (시작일, 종료일) 추출 - 날짜가 하나면 당일 일정"""
+    found = []
+    for year, month, day in EVENT_DATE_PATTERN.findall(text or ""):
+        try:
+            found.append(date(int(year), int(month), int(day)))
+        except ValueError:
+            continue
+        if len(found) == 2:
+            break
+    if not found:
+        return None, None
+    return found[0], found[-1]
+
+
+def is_event_active(event: Dict, today: date = None) -> bool:
+    """종료일이 지나지 않은 일정인지 (날짜를 모르면 진행 중으로 간주)"""
+    return not event["end"] or date.fromisoformat(event["end"]) >= (today or date.today())
+
+
+def load_sources(path: str = EXHIBITION_SOURCES_FILE) -> Dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"전시회 소스 파일 로드 실패 ({path}): {e}")
+        return {"keywords": [], "sources": []}
+
+
+class ExhibitionState:
+    """목록 페이지별 해시/캐시 검증자와 전송한 일정 기록 (JSON, 원자적 저장)"""
+
+    def __init__(self, path: str = EXHIBITION_STATE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.data = {"listings": {}, "sent": {}}
+        try:
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.data.update(json.load(f))
+        except Exception as e:
+            logger.error(f"전시회 상태 로드 실패: {e}")
+
+    def listing(self, url: str) -> Dict:
+        return self.data["listings"].get(url, {})
+
+    def update_listing(self, url: str, **fields):
+        with self._lock:
+            entry = self.data["listings"].setdefault(url, {})
+            entry.update(fields, checked_at=datetime.now().isoformat())
+
+    def is_sent(self, eid: str) -> bool:
+        return eid in self.data["sent"]
+
+    def mark_sent(self, eid: str):
+        with self._lock:
+            self.data["sent"][eid] = datetime.now().isoformat()
+
+    def save(self):
+        cutoff = (datetime.now() - timedelta(days=EXHIBITION_SENT_RETENTION_DAYS)).isoformat()
+        with self._lock:
+            self.data["sent"] = {eid: sent_at for eid, sent_at in self.data["sent"].items() if sent_at >= cutoff}
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def parse_listing(html, source: Dict, keywords: List[str]) -> List[Dict]:
+    """목록 페이지에서 우주 관련 일정 항목 추출 (네트워크 없음)
+
+    키워드는 제목에서만 찾음 (항목 전체 문구에는 메뉴/안내 문구가 섞임), 한 글자 키워드는 무시
+    ("별"/"달" 은 "특별전", "전달" 같은 낱말에도 들어 있음)
+    """
+    keywords = [keyword for keyword in keywords if len(keyword) >= 2]
+    soup = BeautifulSoup(html, "html.parser")
+    items, seen_links = [], set()
+
+    for container in soup.select(source.get("item_selector") or "a[href]"):
+        anchor = container if container.name == "a" else container.select_one(source.get("link_selector") or "a[href]")
+        if anchor is None or not anchor.get("href") or anchor["href"].startswith(("#", "javascript:")):
+            continue
+        title_tag = container.select_one(source["title_selector"]) if source.get("title_selector") else None
+        title = (title_tag or anchor).get_text(" ", strip=True)
+        date_tag = container.select_one(source["date_selector"]) if source.get("date_selector") else None
+        text = (date_tag or container).get_text(" ", strip=True)
+
+        if len(title) < 4 or not any(keyword in title for keyword in keywords):
+            continue
+        link = urljoin(source["url"], anchor["href"])
+        if link in seen_links:
+            continue
+        seen_links.add(link)
+
+        start, end = parse_event_period(text)
+        items.append({
+            "title": title,
+            "link": link,
+            "start": start.isoformat() if start else "",
+            "end": end.isoformat() if end else ""
+        })
+    return items
+
+
+def listing_hash(items: List[Dict]) -> str:
+    """목록 항목 기준 해시 (페이지의 광고/토큰 등 무관한 변화는 무시)"""
+    key = json.dumps(sorted((item["title"], item["link"], item["start"], item["end"]) for item in items),
+                     ensure_ascii=False)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def fetch_listing(source: Dict, state: ExhibitionState, keywords: List[str]) -> Optional[Dict]:
+    """목록 페이지를 받아 바뀐 경우에만 항목 반환 (변화 없으면 None)"""
+    previous = state.listing(source["url"])
+    headers = {}
+    if previous.get("etag"):
+        headers["If-None-Match"] = previous["etag"]
+    if previous.get("last_modified"):
+        headers["If-Modified-Since"] = previous["last_modified"]
+
+    resp = polite_get(source["url"], headers=headers, timeout=get_settings(source["name"]).feed_timeout)
+    if resp.status_code == 304:
+        logger.info(f"{source['name']}: 목록 변화 없음 (304)")
+        state.update_listing(source["url"])
+        return None
+    resp.raise_for_status()
+
+    items = parse_listing(resp.content, source, keywords)
+    digest = listing_hash(items)
+    validators = {"etag": resp.headers.get("ETag", ""), "last_modified": resp.headers.get("Last-Modified", "")}
+    if digest == previous.get("hash"):
+        logger.info(f"{source['name']}: 목록 변화 없음 (해시 동일, {len(items)}개 항목)")
+        state.update_listing(source["url"], **validators)
+        return None
+
+    logger.info(f"{source['name']}: 목록 변경 감지 ({len(items)}개 항목)")
+    return {"source": source, "items": items, "hash": digest, **validators}
+
+
+def fetch_event_detail(event: Dict) -> Tuple[str, str]:
+    """상세 페이지 본문과 대표 이미지 (robots.txt 금지/실패 시 빈 값)"""
+    from crawler.optimized_news_crawler import extract_article_from_html
+    from utils.bounded_fetch import fetch_bounded_html
+    from utils.image_resolver import resolve_best_image
+
+    if not get_scheduler().is_allowed(event["link"]):
+        return "", ""
+    page = fetch_bounded_html(event["link"], timeout=get_settings(event["source"]).article_timeout)
+    content, image_candidates = extract_article_from_html(page["html"], page["url"])
+    return content, resolve_best_image(image_candidates)
+
+
+def build_event_content(event: Dict) -> str:
+    """게시글 본문 생성"""
+    label = KIND_LABELS.get(event["kind"], "행사")
+    lines = [f"{event['source']}의 우주 관련 {label} 소식입니다.", ""]
+    if event["start"]:
+        period = event["start"] if event["start"] == event["end"] else f"{event['start']} ~ {event['end']}"
+        lines.append(f"📅 기간: {period}")
+    lines.append(f"📍 기관: {event['source']}")
+    if event.get("content"):
+        lines += ["", f"📝 소개:\n{event['content']}"]
+    if event.get("image_url"):
+        lines += ["", f"🖼️ 이미지: {event['image_url']}"]
+    lines += ["", f"🔗 자세히 보기: {event['link']}"]
+    return "\n".join(lines)
+
+
+def build_event_payload(title: str, content: str, source: str) -> Dict:
+    """일정 게시글 전송 데이터"""
+    if len(content) > 2000:
+        content = content[:1997] + "..."
+
+    return {
+        "title": title,
+        "content": content,
+        "type": "EVENT",
+        "authorId": EXHIBITION_AUTHOR_ID,
+        "category": "EVENT",
+        "source": source
+    }
+
+
+def send_event_to_spring(title: str, content: str, source: str) -> bool:
+    """전시회/천문대 일정을 스프링 서버로 바로 전송 (Admin API, 전시회용 키)"""
+    from utils.simple_sender import send_to_spring_admin
+    return send_to_spring_admin(build_event_payload(title, content, source), EXHIBITION_ENDPOINT, source,
+                                api_key=EVENT_API_KEY)
+
+
+def queue_event(event: Dict, run_id: str, item_id: Optional[int]) -> bool:
+    """일정을 아웃박스에 저장 - 이미 있거나 다른 노드가 선점했으면 False, 저장할 수 없으면 바로 전송"""
+    from utils.outbox import get_outbox
+
+    content = build_event_content(event)
+    try:
+        return get_outbox().enqueue("event", EXHIBITION_ENDPOINT,
+                                    build_event_payload(event["title"], content, event["source"]),
+                                    event["source"], run_id=run_id, item_id=item_id)
+    except Exception as e:
+        logger.error(f"아웃박스 저장 실패, 직접 전송: {e}")
+        return send_event_to_spring(event["title"], content, event["source"])
+
+
+def run_exhibition_crawl(recorder) -> Dict:
+    """목록 확인 → 새 일정 상세 수집 → 중복 체크 → 전송 (동기, 스레드에서 실행)"""
+    from utils.duplicate_checker import filter_duplicate_articles
+
+    catalog = load_sources()
+    keywords = catalog.get("keywords", [])
+    sources = [source for source in catalog.get("sources", []) if get_settings(source["name"]).enabled]
+    # 다중 인스턴스: 도메인별 담당 노드만 처리 (호스트별 요청 예절도 한 노드 안에서 지켜짐)
+    from utils.coordination import get_coordinator
+    sources = get_coordinator().partition(sources, key=lambda source: urlparse(source["url"]).netloc)
+    state = ExhibitionState()
+    scheduler = get_scheduler()
+
+    def check_listing(source):
+        try:
+            return fetch_listing(source, state, keywords)
+        except PolitenessError as e:
+            logger.info(f"{source['name']}: 목록 요청 생략 ({e})")
+        except Exception as e:
+            logger.error(f"{source['name']} 목록 수집 실패: {e}")
+        return None
+
+    with recorder.timed("listings"):
+        listings = [listing for listing in scheduler.run_batched(sources, lambda source: source["url"],
+                                                                  check_listing, EXHIBITION_WORKERS) if listing]
+
+    # 바뀐 목록에서 아직 보내지 않은 진행 중 일정만 후보로
+    today = date.today()
+    candidates = []
+    for listing in listings:
+        source = listing["source"]
+        for item in listing["items"]:
+            eid = event_id(source["name"], item["title"])
+            if state.is_sent(eid):
+                continue
+            if not is_event_active(item, today):
+                record_rejection(source["name"], item["title"], "event_ended")
+                continue
+            candidates.append({**item, "id": eid, "source": source["name"], "kind": source.get("kind", "exhibition"),
+                               "listing_url": source["url"]})
+    # 할당량을 넘어 남은 후보가 있는 목록은 해시를 갱신하지 않아 다음 실행에서 이어서 처리
+    deferred_listings = {event["listing_url"] for event in candidates[EXHIBITION_MAX_EVENTS_PER_RUN:]}
+    candidates = candidates[:EXHIBITION_MAX_EVENTS_PER_RUN]
+
+    def load_detail(event):
+        try:
+            event["content"], event["image_url"] = fetch_event_detail(event)
+        except Exception as e:
+            logger.warning(f"상세 페이지 수집 실패 ({event['link'][:60]}...): {e}")
+            event["content"], event["image_url"] = "", ""
+        if not event["start"]:
+            # 목록에 날짜가 없으면 상세 본문에서 찾음
+            start, end = parse_event_period(event["content"])
+            event["start"], event["end"] = (start.isoformat(), end.isoformat()) if start else ("", "")
+        return event
+
+    with recorder.timed("details"):
+        events = [event for event in scheduler.run_batched(candidates, lambda event: event["link"], load_detail,
+                                                           EXHIBITION_WORKERS) if event]
+
+    active_events = []
+    for event in events:
+        if is_event_active(event, today):
+            active_events.append(event)
+        else:
+            state.mark_sent(event["id"])  # 끝난 일정은 다시 확인하지 않음
+            record_rejection(event["source"], event["title"], "event_ended")
+    events = active_events
+
+    with recorder.timed("dedup"):
+        new_events = filter_duplicate_articles(events, category="EVENT", remember=False)
+    kept = {event["id"] for event in new_events}
+    for event in events:
+        if event["id"] not in kept:
+            # 이미 게시된 일정이므로 다시 보지 않도록 전송 처리
+            state.mark_sent(event["id"])
+            recorder.item(source=event["source"], title=event["title"], decision="rejected",
+                          reason="duplicate", dedup="duplicate")
+
+    # 이 노드가 아웃박스에 저장한 일정만 처리 완료로 봄 (디스패처가 재시도)
+    # 이미 있거나 다른 노드가 선점한 일정은 목록 해시를 갱신하지 않아 다음 실행에서 다시 확인 (게시되면 중복 체크에서 빠짐)
+    success_count = 0
+    failed_listings = set()
+    for event in new_events:
+        item_id = recorder.item(source=event["source"], title=event["title"], decision="accepted", dedup="new")
+        if queue_event(event, recorder.run_id, item_id):
+            success_count += 1
+            state.mark_sent(event["id"])
+        else:
+            failed_listings.add(event["listing_url"])
+    from utils.outbox import get_dispatcher
+    get_dispatcher().wake()
+
+    # 저장 실패나 남은 후보가 없는 목록만 해시 갱신
+    for listing in listings:
+        url = listing["source"]["url"]
+        if url in failed_listings or url in deferred_listings:
+            continue
+        state.update_listing(url, hash=listing["hash"], etag=listing["etag"], last_modified=listing["last_modified"])
+    try:
+        state.save()
+    except Exception as e:
+        logger.error(f"전시회 상태 저장 실패: {e}")
+
+    recorder.finish(len(new_events), success_count)
+    return {
+        "total_events": len(new_events),
+        "success": success_count,
+        "observatories": [source["name"] for source in sources],
+        "changed_listings": [listing["source"]["name"] for listing in listings]
+    }
+
+
+async def crawl_space_exhibitions():
+    """우주 전시회 / 천문대 일정 크롤링 (오전 10시)"""
+    from utils.logger_setup import new_run_id
+    from utils.run_history import start_run
+
+    run_id = new_run_id("exhibitions")
+    recorder = start_run(run_id, "exhibitions")
+    logger.info(f"우주 전시회 크롤링 시작: {datetime.now()}")
+
+    # 네트워크 작업은 스레드에서 (실행 ID/기록기 컨텍스트는 to_thread 가 복사)
+    result = await asyncio.to_thread(run_exhibition_crawl, recorder)
+    result["run_id"] = run_id
+    logger.info(f"우주 전시회 크롤링 완료: 총 {result['total_events']}개 중 {result['success']}개 전송 성공")
+    return result
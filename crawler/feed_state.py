@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+뉴스 피드 변화 감지 (조건부 요청 + 항목 목록 해시 + 처리한 항목 GUID + 남은 후보 목록)
+
+- 피드별로 ETag/Last-Modified, 항목 목록 해시, 처리한 항목 키(GUID, 없으면 링크), 남은 후보(backlog)를 따로 기록
+- 304 이거나 항목 목록 해시가 같으면 피드 항목은 다시 다루지 않고, 저장해 둔 남은 후보만 이어서 처리
+  → 남은 후보가 없으면 그 피드는 이후 단계(본문 추출, 평가, 중복 체크)를 모두 건너뜀
+- 바뀐 피드는 처리한 적 없는 항목 + 남은 후보를 후보로 넘김
+- 할당량/표본 추출 등으로 이번에 다루지 못한 후보는 defer_articles 로 후보 내용째 남겨 다음 실행에서 이어서 처리
+  (검증자/해시는 남은 후보와 상관없이 매번 갱신 → 바뀌지 않은 피드는 다시 받거나 다시 해석하지 않음)
+
+FeedState 는 수집 한 번마다 새로 만들고, 수집이 끝나면 commit 으로 이번 실행의 변경분만 파일에 반영
+(동시에 돈 다른 실행의 기록은 다시 읽어 합침)
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from config import FEED_CHANGE_DETECTION, FEED_STATE_FILE, FEED_STATE_RETENTION_DAYS
+from utils.article import Article
+
+logger = logging.getLogger(__name__)
+
+_file_lock = threading.Lock()
+
+# 남은 후보로 저장하는 기사 필드 (RSS 에서 얻은 값만, 본문 추출/평가 결과는 다음 실행에서 다시)
+_CANDIDATE_FIELDS = ("title", "raw_title", "url", "outlet", "published_at", "description", "guid")
+
+
+def item_key(value: str) -> str:
+    return hashlib.blake2b(value.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def items_hash(fingerprints: Iterable[str]) -> str:
+    """항목 목록 기준 해시 (항목 순서나 채널 메타데이터 변화는 무시)"""
+    return hashlib.sha256("\n".join(sorted(fingerprints)).encode('utf-8')).hexdigest()
+
+
+def _load(path: str) -> Dict:
+    try:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            data.setdefault("feeds", {})
+            return data
+    except Exception as e:
+        logger.error(f"피드 상태 로드 실패: {e}")
+    return {"feeds": {}}
+
+
+class FeedState:
+    """수집 한 번 동안의 피드 상태 (시작 시 로드, commit 으로 저장)"""
+
+    def __init__(self, path: str = FEED_STATE_FILE, retention_days: int = FEED_STATE_RETENTION_DAYS):
+        self.path = path
+        self.retention_days = retention_days
+        self.feeds = _load(path)["feeds"]
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict] = {}
+
+    def _begin(self, feed: str, validators: Dict = None) -> Dict:
+        """이번 실행에서 읽은 피드 등록 (validators 가 None 이면 저장된 검증자/해시 유지)"""
+        with self._lock:
+            pending = self._pending.setdefault(feed, {"validators": None, "keys": set(), "deferred": {}})
+            if validators is not None:
+                pending["validators"] = validators
+            return pending
+
+    def request_headers(self, feed: str) -> Dict:
+        """조건부 요청 헤더 (이전 응답의 검증자)"""
+        entry = self.feeds.get(feed, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def not_modified(self, feed: str, response) -> bool:
+        if response.status_code != 304:
+            return False
+        self._begin(feed)
+        logger.info(f"{feed}: 피드 변화 없음 (304, 남은 후보 {len(self.feeds.get(feed, {}).get('backlog', {}))}개)")
+        return True
+
+    def changed_items(self, feed: str, items: List, keys: List[str], fingerprints: List[str], response) -> List:
+        """처리한 적 없는 항목만 반환 (항목 목록 해시가 이전과 같으면 빈 목록)"""
+        entry = self.feeds.get(feed, {})
+        digest = items_hash(fingerprints)
+        pending = self._begin(feed, {
+            "hash": digest, "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", "")
+        })
+        if digest == entry.get("hash"):
+            logger.info(f"{feed}: 피드 변화 없음 (해시 동일, {len(items)}개 항목, 남은 후보 {len(entry.get('backlog', {}))}개)")
+            return []
+
+        seen = entry.get("seen", {})
+        backlog = entry.get("backlog", {})
+        fresh = []
+        for item, key in zip(items, keys):
+            hashed = item_key(key) if key else None
+            # 남은 후보는 backlog 로 넘김 (같은 항목을 두 번 후보로 만들지 않도록)
+            if hashed and (hashed in seen or hashed in backlog):
+                continue
+            fresh.append(item)
+            if hashed:
+                with self._lock:
+                    pending["keys"].add(hashed)
+        logger.info(f"{feed}: 피드 변경 감지 (항목 {len(items)}개 중 새 항목 {len(fresh)}개)")
+        return fresh
+
+    def backlog(self, feed: str) -> List[Article]:
+        """이전 실행에서 남긴 후보 (다시 남기지 않으면 이번 실행에서 처리한 것으로 기록)"""
+        stored = self.feeds.get(feed, {}).get("backlog", {})
+        if not stored:
+            return []
+        pending = self._begin(feed)
+        with self._lock:
+            pending["keys"].update(stored)
+        return [Article(source=feed, **{field: data.get(field, "") for field in _CANDIDATE_FIELDS})
+                for data in stored.values()]
+
+    def defer_articles(self, articles: Iterable):
+        """이번에 다루지 못한 후보 (후보 내용째 남겨 다음 실행에서 다시 처리)"""
+        with self._lock:
+            for article in articles:
+                pending = self._pending.get(article.source)
+                key = article.guid or article.url
+                if pending is None or not key:
+                    continue
+                pending["deferred"][item_key(key)] = {field: getattr(article, field) for field in _CANDIDATE_FIELDS}
+
+    def commit(self):
+        """이번 실행의 변경분 저장 (검증자/해시 갱신, 처리한 항목 키 추가, 남은 후보 교체)"""
+        with self._lock:
+            pending_feeds, self._pending = self._pending, {}
+        if not pending_feeds:
+            return
+        now = time.time()
+        cutoff = now - self.retention_days * 86400
+        with _file_lock:
+            data = _load(self.path)
+            for feed, pending in pending_feeds.items():
+                entry = data["feeds"].setdefault(feed, {})
+                if pending["validators"] is not None:
+                    entry.update(pending["validators"])
+                deferred = pending["deferred"]
+                seen = entry.get("seen", {})
+                seen.update((key, now) for key in pending["keys"] if key not in deferred)
+                entry["seen"] = {key: ts for key, ts in seen.items() if ts >= cutoff}
+                # 처음 남긴 시각 기준으로 보관 기간 적용 (계속 밀리는 후보가 영원히 남지 않도록)
+                previous = entry.get("backlog", {})
+                backlog = {key: item for key, item in previous.items()
+                           if key not in pending["keys"] and item.get("deferred_at", now) >= cutoff}
+                for key, item in deferred.items():
+                    item["deferred_at"] = previous.get(key, {}).get("deferred_at", now)
+                    if item["deferred_at"] >= cutoff:
+                        backlog[key] = item
+                entry["backlog"] = backlog
+                entry["checked_at"] = datetime.now().isoformat()
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        self.feeds = data["feeds"]
+
+
+def new_feed_state():
+    """수집 한 번에 쓸 피드 상태 (FEED_CHANGE_DETECTION 이 꺼져 있으면 None = 모든 항목 처리)"""
+    return FeedState() if FEED_CHANGE_DETECTION else None
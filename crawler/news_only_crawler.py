@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime
 
@@ -5,26 +6,91 @@ logger = logging.getLogger(__name__)
 
 
 
-def send_news_to_spring(title: str, content: str, source: str) -> bool:
-    """뉴스를 스프링 서버로 전송 (Admin API)"""
-    from utils.simple_sender import send_to_spring_admin
-    
+NEWS_ENDPOINT = "/api/admin/crawler/news"
+
+def build_news_payload(article) -> dict:
+    """뉴스 게시글 전송 데이터 (본문은 이 시점에 템플릿으로 조립)"""
+    content = article.content
     if len(content) > 2000:
         content = content[:1997] + "..."
     
-    payload = {
-        "title": title, 
+    return {
+        "title": article.title, 
         "content": content,
         "type": "NEWS",
         "authorId": "newsbot",
         "category": "NEWS",
-        "source": source
+        "source": article.source
     }
+
+def send_news_to_spring(article) -> bool:
+    """뉴스를 스프링 서버로 바로 전송 (Admin API)"""
+    from utils.simple_sender import send_to_spring_admin
+    return send_to_spring_admin(build_news_payload(article), NEWS_ENDPOINT, article.source)
+
+def _enqueue_articles(articles, recorder, run_id):
+    """수락 기록 후 아웃박스에 등록 (SQLite 쓰기 - 이벤트 루프 밖 스레드에서 호출), 반환: 등록한 기사 목록"""
+    from utils.outbox import get_outbox
+    outbox = get_outbox()
+    queued = []
+    for article in articles:
+        item_id = recorder.item(source=article.source, title=article.title, decision="accepted",
+                                dedup="new", **(article.metrics or {}))
+        payload = build_news_payload(article)
+        try:
+            if outbox.enqueue("news", NEWS_ENDPOINT, payload, article.source, run_id=run_id, item_id=item_id):
+                queued.append(article)
+        except Exception as e:
+            # 아웃박스를 쓸 수 없으면 바로 전송 (재시도 없음)
+            logger.error(f"아웃박스 저장 실패, 직접 전송: {e}")
+            if send_news_to_spring(article):
+                queued.append(article)
+    return queued
+
+def _timed(recorder, stage, func, *args, **kwargs):
+    """작업 스레드 안에서 단계 시간 기록 (이벤트 루프 스레드에서 재면 CPU 시간이 작업을 반영하지 않음)"""
+    with recorder.timed(stage):
+        return func(*args, **kwargs)
+
+async def publish_articles(all_articles, recorder, run_id):
+    """중복 필터링 후 아웃박스에 등록 (반환: 중복을 뺀 기사 목록, 등록 수)"""
+    # DB 기반 중복 체크 및 필터링
+    candidates = all_articles
+    try:
+        from utils.duplicate_checker import filter_duplicate_articles
+        # 제목은 전송이 확인된 뒤 아웃박스가 로컬 캐시에 기록
+        filtered_articles = await asyncio.to_thread(_timed, recorder, "dedup", filter_duplicate_articles,
+                                                    all_articles, remember=False)
+        logger.info(f"중복 필터링: {len(all_articles)}개 → {len(filtered_articles)}개")
+        all_articles = filtered_articles
+    except Exception as e:
+        logger.error(f"중복 체크 실패: {e}")
+    
+    # 중복으로 제외된 후보 기록
+    kept = {id(article) for article in all_articles}
+    for article in candidates:
+        if id(article) not in kept:
+            recorder.item(source=article.source, title=article.title, decision="rejected",
+                          reason="duplicate", dedup="duplicate", **(article.metrics or {}))
     
-    return send_to_spring_admin(payload, "/api/admin/crawler/news", source)
+    # 아웃박스에 저장 후 백그라운드 디스패처가 전송 (전송 결과는 실행 이력에 나중에 반영)
+    from utils.outbox import get_dispatcher
+    queued = await asyncio.to_thread(_enqueue_articles, all_articles, recorder, run_id)
+    await asyncio.to_thread(get_dispatcher().wake)
+    
+    # 대기열에 넣은 기사 URL/GUID 기록 (제목은 전송 확인 후 아웃박스가 기록)
+    if queued:
+        from utils.duplicate_checker import remember_links
+        await asyncio.to_thread(remember_links, queued)
+    return all_articles, len(queued)
 
 async def crawl_news_only():
     """우주 뉴스만 크롤링 (하루 2회: 오전 6시, 오후 12시) - 5개 사이트 중 랜덤 선택"""
+    from utils.logger_setup import new_run_id
+    from utils.run_history import RunRecorder, use_run
+    run_id = new_run_id("news")
+    # 실행 이력 SQLite 작업과 수집(예절 대기, 셀레니움)은 스레드에서 (이벤트 루프를 막지 않도록)
+    recorder = use_run(await asyncio.to_thread(RunRecorder, run_id, "news"))
     logger.info(f"우주 뉴스 크롤링 시작: {datetime.now()}")
     
     all_articles = []
@@ -33,7 +99,7 @@ async def crawl_news_only():
     # 최적화된 뉴스 크롤링 사용
     try:
         from crawler.optimized_news_crawler import get_optimized_space_news
-        articles = get_optimized_space_news()
+        articles = await asyncio.to_thread(_timed, recorder, "collect", get_optimized_space_news)
         all_articles.extend(articles)
         selected_site = "최신뉴스크롤링"
         logger.info(f"최신 뉴스 크롤링에서 {len(articles)}개 뉴스 수집")
@@ -41,26 +107,46 @@ async def crawl_news_only():
         logger.error(f"뉴스 크롤링 실패: {e}")
         selected_site = "실패"
     
-    # DB 기반 중복 체크 및 필터링
-    try:
-        from utils.duplicate_checker import filter_duplicate_articles
-        filtered_articles = filter_duplicate_articles(all_articles)
-        logger.info(f"중복 필터링: {len(all_articles)}개 → {len(filtered_articles)}개")
-        all_articles = filtered_articles
-    except Exception as e:
-        logger.error(f"중복 체크 실패: {e}")
-    
-    # 스프링 서버로 전송 (중복 제거된 기사만)
-    success_count = 0
-    for article in all_articles:
-        if send_news_to_spring(article["title"], article["content"], article["source"]):
-            success_count += 1
+    all_articles, success_count = await publish_articles(all_articles, recorder, run_id)
     
-    logger.info(f"우주 뉴스 크롤링 완료: 총 {len(all_articles)}개 중 {success_count}개 전송 성공")
+    await asyncio.to_thread(recorder.finish, len(all_articles), success_count)
+    logger.info(f"우주 뉴스 크롤링 완료: 총 {len(all_articles)}개 중 {success_count}개 전송 대기열 등록")
     
     return {
         "total": len(all_articles), 
         "success": success_count,
+        "queued": success_count,
         "selected_site": selected_site,
+        "run_id": run_id,
         "sources": ["구글뉴스RSS", "최신뉴스필터링"]
-    }
\ No newline at end of file
+    }
+
+async def crawl_news_adaptive():
+    """적응형 폴링 틱: 확인할 때가 된 소스만 읽어 새 기사 게시 (요청 예산 안에서, 없으면 아무것도 안 함)"""
+    from crawler.adaptive_schedule import get_feed_rates
+    from crawler.optimized_news_crawler import ALTERNATIVE_RSS_SOURCES, get_due_source_news
+    from utils.crawl_settings import get_settings
+    names = [name for name in ["GoogleNews"] + [source['name'] for source in ALTERNATIVE_RSS_SOURCES]
+             if get_settings(name).enabled]
+    try:
+        due = await asyncio.to_thread(get_feed_rates().take_due, names)
+    except Exception as e:
+        logger.error(f"적응형 일정 확인 실패: {e}")
+        due = []
+    if not due:
+        return {"total": 0, "success": 0, "polled": []}
+    
+    from utils.logger_setup import new_run_id
+    from utils.run_history import RunRecorder, use_run
+    run_id = new_run_id("news_adaptive")
+    recorder = use_run(await asyncio.to_thread(RunRecorder, run_id, "news_adaptive"))
+    logger.info(f"적응형 뉴스 확인: {due}")
+    try:
+        articles = await asyncio.to_thread(_timed, recorder, "collect", get_due_source_news, due)
+    except Exception as e:
+        logger.error(f"적응형 뉴스 수집 실패: {e}")
+        articles = []
+    
+    articles, success_count = await publish_articles(articles, recorder, run_id)
+    await asyncio.to_thread(recorder.finish, len(articles), success_count)
+    return {"total": len(articles), "success": success_count, "queued": success_count, "polled": due, "run_id": run_id}
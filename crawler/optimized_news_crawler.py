@@ -2,28 +2,84 @@
 """
 최적화된 우주 뉴스 크롤링 (날짜 필터링 포함)
 """
-import requests
 from bs4 import BeautifulSoup
 import logging
-from datetime import datetime, timedelta
-from dateutil import parser
+import requests
+from datetime import datetime, timedelta, timezone
 import re
+import time
+from config import BOUNDED_FETCH_ENABLED
+from utils.article import Article
+from utils.bounded_fetch import fetch_bounded_html
+from utils.crawl_settings import get_settings
+from utils.date_parser import parse_pub_date
+from utils.politeness import get_scheduler, polite_get
+from utils.logger_setup import log_sampled
+from utils.run_history import record_rejection
+from utils.snapshot_store import record_snapshot
+from utils.text_normalizer import (
+    strip_title_source, clean_rss_description, strip_trailing_phrase,
+    PARAGRAPH_BOILERPLATE, AGGREGATOR_BOILERPLATE
+)
 
 logger = logging.getLogger(__name__)
 
+# 구글 뉴스 리다이렉트 페이지에서 실제 기사 URL 추출용 패턴
+URL_IN_TEXT_PATTERN = re.compile(r'https?://[^\s<>"]+')
+EMBEDDED_URL_PATTERNS = [
+    re.compile(r'"(https?://[^"]+\.co\.kr[^"]*?)"'),
+    re.compile(r'"(https?://[^"]+\.com[^"]*?)"'),
+    re.compile(r'href="(https?://[^"]+?)"'),
+    re.compile(r'url=(https?://[^&\s]+)')
+]
+
+# 다양한 우주 관련 RSS 소스 (백필에서도 사용)
+ALTERNATIVE_RSS_SOURCES = [
+    {
+        'name': '사이언스타임즈',
+        'url': 'https://www.sciencetimes.co.kr/rss/S1N8.xml',
+        'keywords': ['우주', '로켓', '인공위성', 'NASA', '탐사']
+    },
+    {
+        'name': '연합뉴스',
+        'url': 'https://www.yna.co.kr/rss/science.xml',
+        'keywords': ['우주', '항공', '로켓', '인공위성']
+    },
+    {
+        'name': 'IT조선',
+        'url': 'https://rss.itchosun.com/itchosun_news.xml',
+        'keywords': ['우주', '위성', '로켓', '항공']
+    }
+]
+
 def is_recent_news(pub_date_str, max_days=7):
-    """뉴스가 최근 N일 이내인지 확인"""
-    try:
-        if not pub_date_str:
-            return True  # 날짜 정보가 없으면 포함
-        
-        # 다양한 날짜 형식 파싱
-        pub_date = parser.parse(pub_date_str)
-        cutoff_date = datetime.now() - timedelta(days=max_days)
-        
-        return pub_date.replace(tzinfo=None) >= cutoff_date
-    except:
-        return True  # 파싱 실패시 포함
+    """뉴스가 최근 N일 이내인지 확인 (UTC 기준 비교)"""
+    if not pub_date_str:
+        return True  # 날짜 정보가 없으면 포함
+    
+    pub_date = parse_pub_date(pub_date_str)
+    if pub_date is None:
+        return False  # 해석할 수 없는 날짜는 제외 (건수는 date_parser 통계에 집계)
+    
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=max_days)
+    return pub_date >= cutoff_date
+
+def is_in_date_range(pub_date_str, start, end):
+    """발행일이 [start, end) 구간에 있는지 확인 (백필용, start/end 는 aware datetime)"""
+    if not pub_date_str:
+        return True  # 날짜 정보가 없으면 포함 (검색 쿼리에서 이미 기간 제한)
+    pub_date = parse_pub_date(pub_date_str)
+    return pub_date is not None and start <= pub_date < end
+
+def is_similar_title(title_keywords, seen_keywords, ratio=None):
+    """이미 본 제목들과 키워드가 ratio(기본: similar_title_ratio 설정) 넘게 겹치는지 확인"""
+    if ratio is None:
+        ratio = get_settings().similar_title_ratio
+    for seen_keyword_set in seen_keywords:
+        common_words = title_keywords & seen_keyword_set
+        if len(common_words) >= 2 and len(common_words) / len(title_keywords) > ratio:
+            return True
+    return False
 
 def is_valid_content(title, content):
     """유효한 뉴스 콘텐츠인지 확인"""
@@ -33,190 +89,123 @@ def is_valid_content(title, content):
         return False
     return True
 
-def crawl_google_news_optimized():
-    """최적화된 구글 뉴스 크롤링"""
-    try:
-        import random
-        import time
+def collect_google_candidates(settings=None, feed_state=None):
+    """구글 뉴스 RSS 후보 수집 (날짜/같은 제목만 거름, 본문 추출 전, feed_state 가 있으면 새 항목만)"""
+    settings = settings or get_settings("GoogleNews")
+    # 고정 User-Agent + 도메인 예절 스케줄러 (캐시 무력화 파라미터 없음)
+    url = "https://news.google.com/rss/search?q=우주+뉴스&hl=ko&gl=KR&ceid=KR:ko"
+    resp = fetch_feed("GoogleNews", url, settings, feed_state)
+    if resp is None:
+        return []
+    
+    candidates = []
+    seen_titles = set()  # 중복 제거용
+    for item in parse_changed_items("GoogleNews", resp, settings, feed_state):
+        title_tag = item.find("title")
+        link_tag = item.find("link")
+        source_tag = item.find("source")
+        pub_date_tag = item.find("pubDate")
+        description_tag = item.find("description")  # RSS 설명 추가
+        guid_tag = item.find("guid")
         
-        # 캐시 방지를 위한 랜덤 파라미터 추가
-        cache_buster = int(time.time()) + random.randint(1, 1000)
-        url = f"https://news.google.com/rss/search?q=우주+뉴스&hl=ko&gl=KR&ceid=KR:ko&_cb={cache_buster}"
-        headers = {
-            'User-Agent': f'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{random.randint(100,120)}.0.0.0 Safari/537.36',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache'
-        }
+        if not title_tag:
+            continue
+            
+        title = title_tag.get_text(strip=True)
+        pub_date = pub_date_tag.get_text(strip=True) if pub_date_tag else ""
+        rss_description = description_tag.get_text(strip=True) if description_tag else ""
         
-        resp = requests.get(url, headers=headers, timeout=15)
-        soup = BeautifulSoup(resp.content, "xml")
+        # 날짜 필터링 (최근 recent_days일)
+        if not is_recent_news(pub_date, max_days=settings.recent_days):
+            log_sampled(logger, logging.DEBUG, "old_news", f"오래된 뉴스 제외: {title[:30]}...")
+            record_rejection("GoogleNews", title, "old_news")
+            continue
         
-        articles = []
-        seen_titles = set()  # 중복 제거용
-        seen_keywords = []  # 유사 내용 제거용
+        # 제목에서 출처 완전 제거 (예: [한국대학신문], - 한국대학신문 등)
+        clean_title = strip_title_source(title)
         
-        for item in soup.find_all("item")[:10]:
-            title_tag = item.find("title")
-            link_tag = item.find("link")
-            source_tag = item.find("source")
-            pub_date_tag = item.find("pubDate")
-            description_tag = item.find("description")  # RSS 설명 추가
-            
-            if not title_tag:
-                continue
-                
-            title = title_tag.get_text(strip=True)
-            pub_date = pub_date_tag.get_text(strip=True) if pub_date_tag else ""
-            rss_description = description_tag.get_text(strip=True) if description_tag else ""
-            
-            # 날짜 필터링 (최근 7일)
-            if not is_recent_news(pub_date, max_days=7):
-                logger.debug(f"오래된 뉴스 제외: {title[:30]}...")
-                continue
-            
-            # 제목에서 출처 완전 제거 (예: [한국대학신문], - 한국대학신문 등)
-            clean_title = re.sub(r'^\[.*?\]\s*', '', title).strip()
-            clean_title = re.sub(r'\s*-\s*[가-힣A-Za-z0-9\s]+$', '', clean_title).strip()
-            
-            # 중복 및 유사 제목 제거
-            if clean_title in seen_titles:
-                continue
-            
-            # 유사 제목 검사 (NASA, 넷플릭스 등 키워드 기반)
-            title_keywords = set(clean_title.lower().split())
-            is_similar = False
-            for seen_keyword_set in seen_keywords:
-                # 50% 이상 공통 키워드가 있으면 유사한 것으로 판단
-                common_words = title_keywords & seen_keyword_set
-                if len(common_words) >= 2 and len(common_words) / len(title_keywords) > 0.5:
-                    is_similar = True
-                    logger.debug(f"유사 제목 제외: {clean_title[:30]}...")
-                    break
-            
-            if is_similar:
-                continue
-                
-            seen_titles.add(clean_title)
-            seen_keywords.append(title_keywords)
-            
-            link = link_tag.get_text(strip=True) if link_tag else ""
-            source = source_tag.get_text(strip=True) if source_tag else "구글뉴스"
-            
-            # 상세 내용 추출 (강화된 방법)
-            content, image_url = get_article_content(link, rss_description, clean_title)
-            
-            # 모든 기사에서 Selenium 품질 개선 시도 (강화)
-            selenium_attempted = False
-            if True:
-                try:
-                    from crawler.selenium_enhancer import enhance_article_with_selenium, is_selenium_available
-                    if is_selenium_available():
-                        logger.info(f"Selenium으로 품질 개선 시도: {clean_title[:30]}...")
-                        enhanced_content, enhanced_image = enhance_article_with_selenium(link, clean_title)
-                        selenium_attempted = True
-                        
-                        # 더 엄격한 품질 기준 적용
-                        if enhanced_content and len(str(enhanced_content)) > 500:
-                            logger.info(f"Selenium 성공: {len(enhanced_content)}자 추출 (기존: {len(content if content else '')}자)")
-                            content = enhanced_content
-                            if enhanced_image:
-                                image_url = enhanced_image
-                        elif enhanced_content and len(str(enhanced_content)) > len(str(content) if content else 0):
-                            logger.info(f"Selenium 부분 성공: {len(enhanced_content)}자 추출")
-                            content = enhanced_content
-                            if enhanced_image:
-                                image_url = enhanced_image
-                        else:
-                            logger.warning(f"Selenium 결과 부족: {len(enhanced_content if enhanced_content else 0)}자")
-                except Exception as e:
-                    logger.error(f"Selenium 오류: {e}")
-                    selenium_attempted = True
-            
-            # 무의미한 콘텐츠 필터링
-            if content and any(skip_text in content for skip_text in [
-                'Google 뉴스가 전세계', '전세계 매체로부터', 
-                '종합한 최신 뉴스', '뉴스 소스', '뉴스 제공업체'
-            ]):
-                content = ""  # 무의미한 콘텐츠 제거
-            
-            # 콘텐츠 유효성 검사 (너무 엄격하지 않게)
-            if not clean_title or len(clean_title.strip()) < 5:
-                logger.debug(f"유효하지 않은 제목 제외: {title[:30]}...")
-                continue
-            
-            # AI 평가 및 요약
-            from ai.news_evaluator import evaluate_news_article
-            evaluation = evaluate_news_article(clean_title, content, link)
-            
-            if evaluation["evaluation"] == "REJECT":
-                logger.debug(f"AI 평가 거부: {title[:30]}... - {evaluation.get('reason', '')}")
-                continue
-            
-            # 풍부한 콘텐츠 생성 (개선된 버전)
-            full_content = f"{source}에서 보도한 우주 관련 최신 뉴스입니다.\n\n"
-            
-            # 실제 기사 내용 우선 배치 (품질 개선)
-            if content and len(content.strip()) > 800:
-                # 고품질 내용 (전체 표시)
-                full_content += f"📰 기사 내용:\n{content}\n\n"
-            elif content and len(content.strip()) > 400:
-                # 중간 품질 내용
-                full_content += f"📰 기사 내용:\n{content}\n\n"
-            elif content and len(content.strip()) > 200:
-                # 기본 품질 내용
-                full_content += f"📰 기사 내용:\n{content}\n\n"
-            elif content and len(content.strip()) > 100:
-                # 짧은 내용
-                clean_content = content.replace(clean_title, '').replace(source, '').strip()
-                if len(clean_content) > 50:
-                    full_content += f"📰 기사 요약: {clean_content}\n\n"
-                else:
-                    full_content += f"📰 기사 내용: {content}\n\n"
-            else:
-                # 내용이 부족할 때 AI 요약 활용
-                if evaluation.get("summary") and len(evaluation["summary"]) > 50:
-                    full_content += f"📰 기사 내용: {evaluation['summary']}\n\n"
-                else:
-                    # 제목 기반 설명 생성
-                    if '보령' in clean_title and '대표' in clean_title:
-                        full_content += f"📰 기사 내용: 보령 김정균 대표가 우주 사업 확장에 대한 포부를 밝혔습니다. 한국의 우주 산업 발전에 대한 의지를 표명한 것으로 보입니다.\n\n"
-                    elif 'NASA' in clean_title and '넷플릭스' in clean_title:
-                        full_content += f"📰 기사 내용: NASA가 넷플릭스와 협력하여 우주 영상 콘텐츠를 제공하기로 했습니다. 일반인들이 우주 탐사의 짜릿함을 더 쉽게 느낄 수 있게 될 것으로 기대됩니다.\n\n"
-                    elif '초등생' in clean_title and 'ISS' in clean_title:
-                        full_content += f"📰 기사 내용: 한국 초등생의 우주 꿈이 국제우주정거장(ISS)에서 생중계되었습니다. 어린이들의 우주에 대한 꿈과 희망을 보여주는 의미 있는 사건입니다.\n\n"
-                    else:
-                        full_content += f"📰 기사 주제: {clean_title}에 대한 우주 과학 소식입니다. 자세한 내용은 원문에서 확인하세요.\n\n"
-            
-            # AI 요약 추가 (보조적 역할)
-            if evaluation.get("summary") and len(evaluation["summary"]) > 30 and not content:
-                full_content += f"🤖 AI 요약: {evaluation['summary']}\n\n"
-            
-            # 이미지 추가
-            if image_url:
-                full_content += f"🖼️ 관련 이미지: {image_url}\n\n"
-            
-            if pub_date:
-                full_content += f"📅 발행일: {pub_date}\n"
-            
-            # AI 키워드 추가
-            if evaluation.get("keywords") and len(evaluation["keywords"]) > 0:
-                keywords_str = ", ".join(evaluation["keywords"][:3])
-                full_content += f"🏷️ 핵심 키워드: {keywords_str}\n"
-            
-            full_content += f"🔗 원문 링크: {link}\n🌌 출처: {source}"
-            
-            articles.append({
-                "title": clean_title,
-                "content": full_content,
-                "source": "GoogleNews",
-                "published_at": pub_date,
-                "url": link,
-                "ai_evaluation": evaluation
-            })
-            
-            if len(articles) >= 3:  # 최대 3개
-                break
+        if clean_title in seen_titles:
+            record_rejection("GoogleNews", clean_title, "same_title")
+            continue
+        seen_titles.add(clean_title)
         
+        candidates.append(Article(
+            clean_title, "GoogleNews", raw_title=title,
+            url=link_tag.get_text(strip=True) if link_tag else "",
+            outlet=source_tag.get_text(strip=True) if source_tag else "구글뉴스",
+            published_at=pub_date, description=rss_description,
+            guid=guid_tag.get_text(strip=True) if guid_tag else ""
+        ))
+    
+    # 이전 실행에서 남긴 후보 (피드가 그대로여도 다시 받거나 해석하지 않고 이어서 처리)
+    for article in feed_state.backlog("GoogleNews") if feed_state else []:
+        if not is_recent_news(article.published_at, max_days=settings.recent_days):
+            record_rejection("GoogleNews", article.title, "old_news")
+            continue
+        if article.title in seen_titles:
+            record_rejection("GoogleNews", article.title, "same_title")
+            continue
+        seen_titles.add(article.title)
+        candidates.append(article)
+    
+    return candidates
+
+def candidate_richness(article):
+    """묶음 대표 선택 기준: RSS 설명에서 제목/출처를 뺀 길이"""
+    return len(clean_rss_description(article.description, article.title))
+
+def drop_seen_candidates(items):
+    """이미 게시한 URL/GUID/제목 후보 제외 (본문 추출 전, Bloom 필터라 대부분 디스크 조회 없음)"""
+    from utils.duplicate_checker import filter_seen_articles
+    fresh, seen = filter_seen_articles(items)
+    for item in seen:
+        log_sampled(logger, logging.DEBUG, "already_seen", f"이미 게시한 후보 제외: {item.title[:30]}...")
+        record_rejection(item.source, item.title, "already_seen")
+    return fresh
+
+def select_story_representatives(items, settings=None):
+    """같은 사건을 다룬 항목은 내용이 가장 풍부한 하나만 남김 (본문 추출 전에 호출)"""
+    from utils.story_clustering import cluster_stories
+    clusters = cluster_stories(
+        items, (settings or get_settings()).story_similarity,
+        title=lambda article: article.title, richness=candidate_richness
+    )
+    representatives = []
+    for representative, others in clusters:
+        representatives.append(representative)
+        for item in others:
+            log_sampled(logger, logging.DEBUG, "same_story",
+                        f"같은 사건 제외: {item.title[:30]}... (대표: {representative.title[:30]}...)")
+            record_rejection(item.source, item.title, "same_story")
+    if len(representatives) < len(items):
+        logger.info(f"사건별 묶음: 후보 {len(items)}개 → {len(representatives)}개")
+    return representatives
+
+def process_google_candidates(candidates, max_articles, feed_state=None, settings=None):
+    """구글 뉴스 후보를 순서대로 처리해 max_articles개까지 게시글 생성 (본문 추출/셀레니움/AI 평가)"""
+    articles = []
+    for index, candidate in enumerate(candidates):
+        article = process_news_item(candidate, settings=settings)
+        if article:
+            articles.append(article)
+        if len(articles) >= max_articles:
+            # 처리하지 않은 후보는 다음 실행으로
+            if feed_state:
+                feed_state.defer_articles(candidates[index + 1:])
+            break
+    return articles
+
+def crawl_google_news_optimized():
+    """최적화된 구글 뉴스 크롤링 (같은 사건은 대표 기사만 본문 추출)"""
+    base_settings = get_settings()
+    settings = base_settings.for_source("GoogleNews")
+    if not settings.enabled:
+        logger.info("구글 뉴스 소스 비활성화됨 (크롤링 설정)")
+        return []
+    try:
+        candidates = select_story_representatives(drop_seen_candidates(collect_google_candidates(settings)),
+                                                  base_settings)
+        articles = process_google_candidates(candidates, settings.google_max_articles, settings=base_settings)
         logger.info(f"구글 뉴스 최신 우주 뉴스 {len(articles)}개 수집")
         return articles
         
@@ -224,8 +213,83 @@ def crawl_google_news_optimized():
         logger.error(f"구글 뉴스 크롤링 실패: {e}")
         return []
 
-def get_article_content(url, rss_description="", clean_title=""):
-    """기사 URL에서 상세 내용 추출 (강화버전)"""
+def process_news_item(candidate, use_selenium=True, settings=None):
+    """후보 기사 하나를 본문 추출 → (Selenium 개선) → AI 평가까지 처리 (거부 시 None)
+
+    통과하면 같은 레코드에 결과를 채워 반환 (게시글 본문은 전송 시점에 템플릿으로 조립)
+    settings: 실행 시작 때 잡은 설정 (없으면 현재 설정), 후보 소스의 덮어쓰기를 적용해 사용
+    """
+    title, clean_title, link, rss_description = candidate.raw_title, candidate.title, candidate.url, candidate.description
+    source_name = candidate.source
+    settings = (settings or get_settings()).for_source(source_name)
+    # 상세 내용 추출 (강화된 방법) - 단계별 시간(벽시계/이 스레드 CPU)/바이트는 실행 이력에 기록
+    metrics = {"stages": {}, "cpu": {}, "bytes": 0, "selenium": False, "selenium_ok": False}
+    stage_started, cpu_started = time.perf_counter(), time.thread_time()
+    content, image_url = get_article_content(link, rss_description, clean_title, metrics=metrics, settings=settings)
+    metrics["stages"]["fetch"] = (time.perf_counter() - stage_started) * 1000
+    metrics["cpu"]["fetch"] = (time.thread_time() - cpu_started) * 1000
+
+    # 모든 기사에서 Selenium 품질 개선 시도 (강화)
+    stage_started, cpu_started = time.perf_counter(), time.thread_time()
+    if use_selenium and settings.selenium_enabled:
+        try:
+            from utils.plugin_registry import is_plugin_available, resolve_plugin
+            if is_plugin_available("selenium"):
+                enhance_article_with_selenium = resolve_plugin("selenium")
+                logger.info(f"Selenium으로 품질 개선 시도: {clean_title[:30]}...")
+                # 호스트 슬롯은 렌더러가 페이지를 읽는 동안만 잡음 (selenium_enhancer)
+                enhanced_content, enhanced_image = enhance_article_with_selenium(link, clean_title)
+                metrics["selenium"] = True
+
+                # 더 엄격한 품질 기준 적용
+                if enhanced_content and len(str(enhanced_content)) > settings.selenium_min_content:
+                    logger.info(f"Selenium 성공: {len(enhanced_content)}자 추출 (기존: {len(content if content else '')}자)")
+                    metrics["selenium_ok"] = True
+                    content = enhanced_content
+                    if enhanced_image:
+                        image_url = enhanced_image
+                elif enhanced_content and len(str(enhanced_content)) > len(str(content) if content else 0):
+                    logger.info(f"Selenium 부분 성공: {len(enhanced_content)}자 추출")
+                    metrics["selenium_ok"] = True
+                    content = enhanced_content
+                    if enhanced_image:
+                        image_url = enhanced_image
+                else:
+                    logger.warning(f"Selenium 결과 부족: {len(enhanced_content if enhanced_content else 0)}자")
+        except Exception as e:
+            logger.error(f"Selenium 오류: {e}")
+            metrics["selenium"] = True
+    if metrics["selenium"]:
+        metrics["stages"]["selenium"] = (time.perf_counter() - stage_started) * 1000
+        metrics["cpu"]["selenium"] = (time.thread_time() - cpu_started) * 1000
+
+    # 무의미한 콘텐츠 필터링
+    if content and AGGREGATOR_BOILERPLATE.matches(content):
+        content = ""  # 무의미한 콘텐츠 제거
+
+    # 콘텐츠 유효성 검사 (너무 엄격하지 않게)
+    if not clean_title or len(clean_title.strip()) < 5:
+        logger.debug(f"유효하지 않은 제목 제외: {title[:30]}...")
+        record_rejection(source_name, title, "invalid_title", **metrics)
+        return None
+
+    # AI 평가 및 요약
+    from ai.news_evaluator import evaluate_news_article
+    stage_started, cpu_started = time.perf_counter(), time.thread_time()
+    evaluation = evaluate_news_article(clean_title, content, link)
+    metrics["stages"]["evaluate"] = (time.perf_counter() - stage_started) * 1000
+    metrics["cpu"]["evaluate"] = (time.thread_time() - cpu_started) * 1000
+
+    if evaluation["evaluation"] == "REJECT":
+        logger.debug(f"AI 평가 거부: {title[:30]}... - {evaluation.get('reason', '')}")
+        record_rejection(source_name, clean_title, f"ai_reject:{evaluation.get('reason', '')}", **metrics)
+        return None
+
+    return candidate.evaluated(content, image_url, evaluation, metrics)
+
+def get_article_content(url, rss_description="", clean_title="", metrics=None, settings=None):
+    """기사 URL에서 상세 내용 추출 (강화버전) - metrics 를 주면 수집 바이트 기록, settings 는 소스별 설정"""
+    settings = settings or get_settings()
     try:
         import time
         import urllib.parse
@@ -255,8 +319,7 @@ def get_article_content(url, rss_description="", clean_title=""):
                         try:
                             decoded = base64.b64decode(article_id + '==').decode('utf-8', errors='ignore')
                             if 'http' in decoded:
-                                import re
-                                urls = re.findall(r'https?://[^\s<>"]+', decoded)
+                                urls = URL_IN_TEXT_PATTERN.findall(decoded)
                                 if urls:
                                     url = urls[0]
                                     logger.info(f"Base64 디코딩에서 URL 추출: {url[:100]}...")
@@ -265,64 +328,35 @@ def get_article_content(url, rss_description="", clean_title=""):
                 except:
                     pass
             
-            # 방법 3: 강화된 리다이렉트 추적
+            # 방법 3: 리다이렉트 추적 (한 번만 요청, 호스트별 속도 제한 적용)
             if 'news.google.com' in url:
                 try:
-                    # 다양한 User-Agent 시도
-                    user_agents = [
-                        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                    ]
+                    headers = {
+                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                        'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+                        'Referer': 'https://www.google.com/'
+                    }
                     
-                    import random
-                    for ua in user_agents:
-                        try:
-                            headers = {
-                                'User-Agent': ua,
-                                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                                'Referer': 'https://www.google.com/'
-                            }
-                            
-                            resp = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-                            if resp.url != url and 'news.google.com' not in resp.url:
-                                url = resp.url
-                                logger.info(f"리다이렉트로 URL 발견: {url[:100]}...")
-                                break
-                            
-                            # HTML에서 직접 URL 찾기
-                            if 'http' in resp.text:
-                                import re
-                                # 더 정교한 패턴으로 URL 추출
-                                url_patterns = [
-                                    r'"(https?://[^"]+\.co\.kr[^"]*?)"',
-                                    r'"(https?://[^"]+\.com[^"]*?)"',
-                                    r'href="(https?://[^"]+?)"',
-                                    r'url=(https?://[^&\s]+)'
-                                ]
-                                
-                                for pattern in url_patterns:
-                                    matches = re.findall(pattern, resp.text)
-                                    for match in matches:
-                                        if ('news.google.com' not in match and 
-                                            'googleusercontent.com' not in match and
-                                            'googleapis.com' not in match and
-                                            len(match) > 30 and 
-                                            any(domain in match for domain in ['.co.kr', '.com', '.net']) and
-                                            any(news_site in match for news_site in ['news', 'article', 'www'])):
-                                            url = match
-                                            logger.info(f"HTML에서 URL 추출: {url[:100]}...")
-                                            break
-                                    if url != original_url:
-                                        break
-                            
+                    resp = polite_get(url, headers=headers, timeout=settings.article_timeout, allow_redirects=True)
+                    if resp.url != url and 'news.google.com' not in resp.url:
+                        url = resp.url
+                        logger.info(f"리다이렉트로 URL 발견: {url[:100]}...")
+                    elif 'http' in resp.text:
+                        # HTML에서 직접 URL 찾기 (더 정교한 패턴으로 URL 추출)
+                        for pattern in EMBEDDED_URL_PATTERNS:
+                            matches = pattern.findall(resp.text)
+                            for match in matches:
+                                if ('news.google.com' not in match and 
+                                    'googleusercontent.com' not in match and
+                                    'googleapis.com' not in match and
+                                    len(match) > 30 and 
+                                    any(domain in match for domain in ['.co.kr', '.com', '.net']) and
+                                    any(news_site in match for news_site in ['news', 'article', 'www'])):
+                                    url = match
+                                    logger.info(f"HTML에서 URL 추출: {url[:100]}...")
+                                    break
                             if url != original_url:
                                 break
-                                
-                        except Exception as e:
-                            logger.debug(f"User-Agent {ua[:20]}... 실패: {e}")
-                            continue
                             
                 except Exception as e:
                     logger.debug(f"리다이렉트 실패: {e}")
@@ -330,14 +364,7 @@ def get_article_content(url, rss_description="", clean_title=""):
         # RSS 설명을 기본 콘텐츠로 사용 (정제 후)
         if url == original_url and rss_description:
             # RSS 설명에서 제목과 출처 제거
-            clean_desc = rss_description
-            # 제목 제거
-            if clean_title in clean_desc:
-                clean_desc = clean_desc.replace(clean_title, '').strip()
-            # 출처 제거
-            import re
-            clean_desc = re.sub(r'[가-힣A-Za-z0-9]+\s*$', '', clean_desc).strip()
-            clean_desc = re.sub(r'\s*-\s*[가-힣A-Za-z0-9\s]+$', '', clean_desc).strip()
+            clean_desc = clean_rss_description(rss_description, clean_title)
             
             if len(clean_desc) > 30:
                 logger.info(f"RSS 설명 정제 후 사용: {len(clean_desc)}자")
@@ -348,6 +375,11 @@ def get_article_content(url, rss_description="", clean_title=""):
         elif url == original_url:
             logger.warning(f"실제 URL 추출 실패, 원본 URL 사용: {url[:100]}...")
         
+        # robots.txt 에서 금지된 기사 페이지는 가져오지 않고 RSS 설명 사용
+        if not get_scheduler().is_allowed(url):
+            log_sampled(logger, logging.INFO, "robots_disallowed", f"robots.txt 금지로 본문 수집 생략: {url[:100]}...")
+            return (clean_rss_description(rss_description, clean_title)[:800] if rss_description else ""), ""
+        
         # 강화된 헤더
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -362,116 +394,33 @@ def get_article_content(url, rss_description="", clean_title=""):
             'Referer': 'https://www.google.com/'
         }
         
-        resp = requests.get(url, headers=headers, timeout=15)
-        resp.encoding = 'utf-8'
-        soup = BeautifulSoup(resp.content, "html.parser")
-        
-        # 광고/노이즈 제거
-        for unwanted in soup.select('script, style, nav, header, footer, .ad, .advertisement, .social-share'):
-            unwanted.decompose()
-        
-        # 한국 주요 언론사별 특화 셀렉터
-        content_selectors = [
-            # 헬로디디 특화
-            ".article_txt p", ".article_content p", ".view_txt p",
-            # 주요 일간지
-            ".article_body p", ".news_body p", ".article-body p", ".news-body p",
-            ".view_content p", ".article_view p", ".news_view p",
-            "#article_body p", "#news_body p", "#articleBody p",
-            # 인터넷 매체
-            ".content_area p", ".article_content p", ".news_content p",
-            ".article_txt p", ".news_txt p", ".txt_area p",
-            # 방송사
-            ".article_wrap p", ".news_wrap p", ".content_wrap p",
-            ".view_area p", ".read_body p", ".article_area p",
-            # IT/과학 매체
-            ".post_content p", ".entry_content p", ".article_detail p",
-            ".content_body p", ".main_content p", ".detail_content p",
-            # 일반적인 셀렉터
-            "article p", ".article-content p", ".post-content p",
-            ".entry-content p", ".story-body p", ".article-text p",
-            # 백업 셀렉터
-            "main p", ".main-content p", "[class*='content'] p",
-            "[class*='article'] p", "[class*='news'] p", "[class*='body'] p",
-            ".container p", ".wrapper p", "section p", "div p"
-        ]
+        if BOUNDED_FETCH_ENABLED:
+            # 상한까지만 스트리밍으로 읽어 기사당 메모리 사용량을 일정하게 유지
+            page = fetch_bounded_html(url, headers=headers, timeout=settings.article_timeout)
+            html, base_url = page["html"], page["url"]
+            if metrics is not None:
+                metrics["bytes"] = page["bytes"]
+            record_snapshot("fetch", url, html, final_url=base_url, status=page["status"],
+                            truncated=page["truncated"], title=clean_title, rss_description=rss_description)
+        else:
+            resp = polite_get(url, headers=headers, timeout=settings.article_timeout)
+            resp.encoding = 'utf-8'
+            html, base_url = resp.content, url
+            if metrics is not None:
+                metrics["bytes"] = len(resp.content)
+            record_snapshot("fetch", url, resp.content, final_url=resp.url, status=resp.status_code,
+                            title=clean_title, rss_description=rss_description)
         
-        content = ""
-        for selector in content_selectors:
-            paragraphs = soup.select(selector)
-            if len(paragraphs) >= 2:  # 최소 2개 문단 이상
-                valid_paragraphs = []
-                for p in paragraphs[:8]:  # 최대 8개 문단
-                    text = p.get_text(strip=True)
-                    # 더 엄격한 필터링
-                    if (len(text) > 30 and 
-                        not any(skip in text.lower() for skip in [
-                            '광고', '구독', '로그인', '회원가입', '댓글', '공유하기',
-                            '이메일', '페이스북', '트위터', '카카오톡', '라인',
-                            'copyright', 'ⓒ', '©', '저작권', '무단전재'
-                        ]) and
-                        not text.startswith(('사진=', '이미지=', '출처=', '기자='))):
-                        valid_paragraphs.append(text)
-                
-                if len(valid_paragraphs) >= 2:
-                    content = "\n\n".join(valid_paragraphs[:5])  # 최대 5개 문단
-                    logger.info(f"기사 내용 추출 성공: {len(content)}자")
-                    break
+        content, image_candidates = extract_article_from_html(html, base_url, settings)
         
-        # 본문이 없으면 메타 설명 사용
-        if not content or len(content) < 100:
-            meta_desc = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
-            if meta_desc and meta_desc.get('content'):
-                desc = meta_desc.get('content').strip()
-                if len(desc) > 50:
-                    content = desc
-                    logger.info(f"메타 설명에서 내용 추출: {len(content)}자")
-        
-        # 이미지 추출 강화
-        image_url = ""
-        img_selectors = [
-            # 메타 태그 우선
-            "meta[property='og:image']", "meta[name='twitter:image']",
-            # 기사 내 이미지
-            ".article_body img[src]", ".news_body img[src]", ".article-body img[src]",
-            ".view_content img[src]", ".article_view img[src]", ".content img[src]",
-            "article img[src]", ".article-content img[src]", "main img[src]"
-        ]
-        
-        for selector in img_selectors:
-            if 'meta' in selector:
-                meta_img = soup.select_one(selector)
-                if meta_img and meta_img.get('content'):
-                    src = meta_img.get('content')
-                    if src and (src.startswith('http') or src.startswith('/')):
-                        if not src.startswith('http'):
-                            from urllib.parse import urljoin
-                            src = urljoin(url, src)
-                        if any(ext in src.lower() for ext in ['.jpg', '.png', '.jpeg', '.webp', '.gif']):
-                            image_url = src
-                            logger.info(f"이미지 발견: {src[:100]}...")
-                            break
-            else:
-                img = soup.select_one(selector)
-                if img and img.get('src'):
-                    src = img.get('src')
-                    if src and (src.startswith('http') or src.startswith('/')):
-                        if not src.startswith('http'):
-                            from urllib.parse import urljoin
-                            src = urljoin(url, src)
-                        if any(ext in src.lower() for ext in ['.jpg', '.png', '.jpeg', '.webp', '.gif']):
-                            image_url = src
-                            logger.info(f"이미지 발견: {src[:100]}...")
-                            break
+        # 이미지 후보 병렬 검증 (확장자 없는 OG 이미지 포함)
+        from utils.image_resolver import resolve_best_image
+        image_url = resolve_best_image(image_candidates)
         
         # 콘텐츠가 없거나 너무 짧으면 RSS 설명 사용
         if (not content or len(content.strip()) < 100) and rss_description:
-            # RSS 설명 정제
-            clean_desc = rss_description
-            # 제목 제거 (함수 파라미터에서 받은 clean_title 사용 불가)
-            import re
-            # 제목과 비슷한 부분 제거
-            clean_desc = re.sub(r'[가-힣A-Za-z0-9\s\'"\-’]+\s*$', '', clean_desc).strip()
+            # RSS 설명 정제 (제목과 비슷한 끝부분 제거)
+            clean_desc = strip_trailing_phrase(rss_description)
             if len(clean_desc) > 50:
                 content = clean_desc
                 logger.info(f"RSS 설명을 콘텐츠로 사용: {len(content)}자")
@@ -485,180 +434,287 @@ def get_article_content(url, rss_description="", clean_title=""):
         logger.error(f"기사 내용 추출 실패 ({url[:50]}...): {e}")
         return "", ""
 
-def crawl_alternative_sources():
-    """다양한 대체 뉴스 소스 크롤링"""
+def extract_article_from_html(html, url, settings=None):
+    """HTML에서 본문과 이미지 후보 추출 (네트워크 없음)"""
+    soup = BeautifulSoup(html, "html.parser")
+    
+    # 광고/노이즈 제거
+    for unwanted in soup.select('script, style, nav, header, footer, .ad, .advertisement, .social-share'):
+        unwanted.decompose()
+    
+    # 한국 주요 언론사별 특화 셀렉터
+    content_selectors = [
+        # 헬로디디 특화
+        ".article_txt p", ".article_content p", ".view_txt p",
+        # 주요 일간지
+        ".article_body p", ".news_body p", ".article-body p", ".news-body p",
+        ".view_content p", ".article_view p", ".news_view p",
+        "#article_body p", "#news_body p", "#articleBody p",
+        # 인터넷 매체
+        ".content_area p", ".article_content p", ".news_content p",
+        ".article_txt p", ".news_txt p", ".txt_area p",
+        # 방송사
+        ".article_wrap p", ".news_wrap p", ".content_wrap p",
+        ".view_area p", ".read_body p", ".article_area p",
+        # IT/과학 매체
+        ".post_content p", ".entry_content p", ".article_detail p",
+        ".content_body p", ".main_content p", ".detail_content p",
+        # 일반적인 셀렉터
+        "article p", ".article-content p", ".post-content p",
+        ".entry-content p", ".story-body p", ".article-text p",
+        # 백업 셀렉터
+        "main p", ".main-content p", "[class*='content'] p",
+        "[class*='article'] p", "[class*='news'] p", "[class*='body'] p",
+        ".container p", ".wrapper p", "section p", "div p"
+    ]
+    
+    content = ""
+    for selector in (*(settings or get_settings()).extra_article_selectors, *content_selectors):
+        paragraphs = soup.select(selector)
+        if len(paragraphs) >= 2:  # 최소 2개 문단 이상
+            # 최대 8개 문단, 금지어/접두어는 한 번의 정규식 탐색으로 필터링
+            valid_paragraphs = PARAGRAPH_BOILERPLATE.filter(
+                (p.get_text(strip=True) for p in paragraphs[:8]), min_length=30
+            )
+            
+            if len(valid_paragraphs) >= 2:
+                content = "\n\n".join(valid_paragraphs[:5])  # 최대 5개 문단
+                logger.info(f"기사 내용 추출 성공: {len(content)}자")
+                break
+    
+    # 본문이 없으면 메타 설명 사용
+    if not content or len(content) < 100:
+        meta_desc = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
+        if meta_desc and meta_desc.get('content'):
+            desc = meta_desc.get('content').strip()
+            if len(desc) > 50:
+                content = desc
+                logger.info(f"메타 설명에서 내용 추출: {len(content)}자")
+    
+    # 이미지 후보 수집 (검증은 호출하는 쪽에서)
+    img_selectors = [
+        # 메타 태그 우선
+        "meta[property='og:image']", "meta[name='twitter:image']",
+        # 기사 내 이미지
+        ".article_body img", ".news_body img", ".article-body img",
+        ".view_content img", ".article_view img", ".content img",
+        "article img", ".article-content img", "main img"
+    ]
+    from utils.image_resolver import collect_image_candidates
+    image_candidates = collect_image_candidates(soup, url, img_selectors)
+    
+    return content, image_candidates
+
+def feed_item_identity(item):
+    """RSS 항목 키 (guid, 없으면 링크), 발행일, 변화 감지용 지문"""
+    guid_tag, link_tag = item.find("guid"), item.find("link")
+    key = (guid_tag or link_tag).get_text(strip=True) if (guid_tag or link_tag) else ""
+    title_tag, pub_date_tag = item.find("title"), item.find("pubDate")
+    title = title_tag.get_text(strip=True) if title_tag else ""
+    pub_date = pub_date_tag.get_text(strip=True) if pub_date_tag else ""
+    return key, pub_date, f"{key}\x1f{title}\x1f{pub_date}"
+
+def fetch_feed(source_name, url, settings, feed_state=None):
+    """피드 요청 (모든 요청을 적응형 요청 예산에 기록) - 2xx/304 가 아니면 None
+
+    304 는 새 항목 없음으로 관측, 429/5xx 등 실패 응답은 갱신 주기 추정에 넣지 않음
+    """
+    from crawler.adaptive_schedule import charge_feed_request
+    try:
+        resp = polite_get(url, timeout=settings.feed_timeout,
+                          headers=feed_state.request_headers(source_name) if feed_state else None)
+    except requests.RequestException:
+        charge_feed_request(source_name)
+        raise
+    charge_feed_request(source_name)
+    if feed_state and feed_state.not_modified(source_name, resp):
+        observe_items(source_name, [])
+        return resp
+    if not 200 <= resp.status_code < 300:
+        logger.warning(f"{source_name}: 피드 응답 {resp.status_code}, 이번 결과는 건너뜀")
+        return None
+    return resp
+
+def observe_items(source_name, items):
+    """피드 항목 발행일/GUID 를 소스별 갱신 주기 추정에 반영"""
+    from crawler.adaptive_schedule import observe_feed
+    entries = []
+    for item in items:
+        key, pub_date, _ = feed_item_identity(item)
+        entries.append((pub_date, key))
+    return observe_feed(source_name, entries)
+
+def parse_changed_items(source_name, resp, settings, feed_state):
+    """피드 응답을 해석해 처리할 항목 반환 (304 면 해석하지 않고 빈 목록)"""
+    if resp.status_code == 304:
+        return []
+    items = BeautifulSoup(resp.content, "xml").find_all("item")[:settings.feed_item_limit]
+    observe_items(source_name, items)
+    return select_changed_items(source_name, resp, items, feed_state)
+
+def select_changed_items(source_name, resp, items, feed_state):
+    """피드가 바뀌었으면 처리한 적 없는 항목만, 그대로면 빈 목록 (feed_state 없으면 전체)"""
+    if feed_state is None:
+        return items
+    identities = [feed_item_identity(item) for item in items]
+    return feed_state.changed_items(source_name, items, [key for key, _, _ in identities],
+                                    [fingerprint for _, _, fingerprint in identities], resp)
+
+def collect_source_candidates(source, feed_state=None, settings=None):
+    """대체 RSS 소스 하나에서 키워드에 맞는 후보 수집 (feed_state 가 있으면 새 항목만)"""
+    settings = (settings or get_settings()).for_source(source['name'])
+    resp = fetch_feed(source['name'], source['url'], settings, feed_state)
+    if resp is None:
+        return []
+    
+    articles = []
+    for item in parse_changed_items(source['name'], resp, settings, feed_state):
+        title = item.find("title").get_text(strip=True) if item.find("title") else ""
+        link = item.find("link").get_text(strip=True) if item.find("link") else ""
+        desc = item.find("description").get_text(strip=True) if item.find("description") else ""
+        guid = item.find("guid").get_text(strip=True) if item.find("guid") else ""
+        
+        # 다양한 키워드로 검색
+        if title and any(keyword in title for keyword in source['keywords']):
+            articles.append(Article(title, source['name'], url=link, description=desc, guid=guid))
+            logger.info(f"{source['name']}: {title[:30]}...")
+    
+    # 이전 실행에서 남긴 후보도 함께, 한도를 넘는 후보는 다음 실행에서 처리
+    if feed_state:
+        articles.extend(feed_state.backlog(source['name']))
+        feed_state.defer_articles(articles[settings.feed_max_articles:])
+    return articles[:settings.feed_max_articles]
+
+def crawl_alternative_sources(names=None, feed_state=None, settings=None):
+    """다양한 대체 뉴스 소스 크롤링 (names: 이 이름의 소스만, feed_state: 바뀐 피드의 새 항목만)"""
     import random
+    settings = settings or get_settings()
     articles = []
     
-    # 다양한 우주 관련 RSS 소스
-    sources = [
-        {
-            'name': '사이언스타임즈',
-            'url': 'https://www.sciencetimes.co.kr/rss/S1N8.xml',
-            'keywords': ['우주', '로켓', '인공위성', 'NASA', '탐사']
-        },
-        {
-            'name': '연합뉴스',
-            'url': 'https://www.yna.co.kr/rss/science.xml',
-            'keywords': ['우주', '항공', '로켓', '인공위성']
-        },
-        {
-            'name': 'IT조선',
-            'url': 'https://rss.itchosun.com/itchosun_news.xml',
-            'keywords': ['우주', '위성', '로켓', '항공']
-        }
-    ]
+    sources = [source for source in ALTERNATIVE_RSS_SOURCES if names is None or source['name'] in names]
     
     # 랜덤으로 소스 순서 섮기
     random.shuffle(sources)
     
     for source in sources:
+        if not settings.for_source(source['name']).enabled:
+            continue
         try:
-            resp = requests.get(source['url'], timeout=10)
-            soup = BeautifulSoup(resp.content, "xml")
-            
-            found_articles = 0
-            for item in soup.find_all("item")[:10]:  # 최대 10개 확인
-                title = item.find("title").get_text(strip=True) if item.find("title") else ""
-                link = item.find("link").get_text(strip=True) if item.find("link") else ""
-                desc = item.find("description").get_text(strip=True) if item.find("description") else ""
-                
-                # 다양한 키워드로 검색
-                if title and any(keyword in title for keyword in source['keywords']):
-                    articles.append({
-                        'title': title,
-                        'content': f"{source['name']}에서 보도한 우주 과학 뉴스입니다.\n\n{desc}\n\n🔗 원문: {link}",
-                        'source': source['name']
-                    })
-                    logger.info(f"{source['name']}: {title[:30]}...")
-                    found_articles += 1
-                    
-                    if found_articles >= 2:  # 소스당 최대 2개
-                        break
-                        
+            articles.extend(collect_source_candidates(source, feed_state, settings))
         except Exception as e:
             logger.debug(f"{source['name']} RSS 실패: {e}")
     
     return articles
 
 def get_optimized_space_news():
-    """다양한 우주 뉴스 수집 (5개 보장) - 매번 다른 내용"""
+    """다양한 우주 뉴스 수집 (최대 article_quota개, 부족분만 보충 기사로 채움, 바뀐 피드의 새 항목만 처리)"""
     import random
-    all_articles = []
+    from crawler.feed_state import new_feed_state
+    # 실행 동안 같은 설정 사용 (중간에 재로드되어도 이번 실행은 시작 시점 설정으로 끝냄)
+    settings = get_settings()
+    quota = settings.article_quota
+    feed_state = new_feed_state()
     
-    # 1차: 구글 뉴스 (최대 2개)
-    google_articles = crawl_google_news_optimized()
-    if google_articles:
-        # 랜덤으로 1-2개 선택
-        selected_google = random.sample(google_articles, min(random.randint(1, 2), len(google_articles)))
-        all_articles.extend(selected_google)
+    # 1차: 구글 뉴스 후보 (RSS 만 읽고 본문 추출은 아직 하지 않음)
+    google_settings = settings.for_source("GoogleNews")
+    google_candidates = []
+    if google_settings.enabled:
+        try:
+            google_candidates = collect_google_candidates(google_settings, feed_state)
+        except Exception as e:
+            logger.error(f"구글 뉴스 크롤링 실패: {e}")
+    else:
+        logger.info("구글 뉴스 소스 비활성화됨 (크롤링 설정)")
     
-    # 2차: 대체 RSS 소스 (최대 2개)
-    alt_articles = crawl_alternative_sources()
-    if alt_articles:
-        selected_alt = random.sample(alt_articles, min(2, len(alt_articles)))
-        all_articles.extend(selected_alt)
+    # 2차: 대체 RSS 소스
+    alt_articles = crawl_alternative_sources(feed_state=feed_state, settings=settings)
     logger.info(f"대체 소스에서 {len(alt_articles)}개 수집")
     
-    # 3차: 다양한 우주 뉴스 생성 (항상 추가)
-    diverse_articles = generate_diverse_space_news()
-    all_articles.extend(diverse_articles)
-    logger.info(f"다양한 우주 뉴스 {len(diverse_articles)}개 추가")
+    # 이미 게시한 후보 제외, 소스 간 같은 사건 묶음 → 대표만 남긴 뒤 비싼 본문 추출/렌더링 수행
+    representatives = select_story_representatives(drop_seen_candidates(google_candidates + alt_articles), settings)
+    google_candidates = [item for item in representatives if item.source == "GoogleNews"]
+    alt_articles = [item for item in representatives if item.source != "GoogleNews"]
     
-    # 중복 제거 (제목 기반)
-    unique_articles = []
-    seen_titles = set()
+    # 구글 뉴스는 1-2개만 필요하므로 섞은 후보를 필요한 만큼만 처리
+    random.shuffle(google_candidates)
+    google_wanted = min(random.randint(1, 2), google_settings.google_max_articles)
+    all_articles = (process_google_candidates(google_candidates, google_wanted, feed_state, settings)
+                    if google_candidates else [])
+    logger.info(f"구글 뉴스 최신 우주 뉴스 {len(all_articles)}개 수집")
     
-    for article in all_articles:
-        title_key = article['title'][:30].lower()  # 제목 앞 30자로 비교
-        if title_key not in seen_titles:
-            unique_articles.append(article)
-            seen_titles.add(title_key)
+    # 대체 RSS 소스 (최대 2개, 고르지 않은 후보는 다음 실행으로)
+    if alt_articles:
+        picked = random.sample(alt_articles, min(2, len(alt_articles)))
+        all_articles.extend(picked)
+        if feed_state:
+            feed_state.defer_articles([article for article in alt_articles if article not in picked])
     
     # 랜덤 섮기로 다양성 보장
-    random.shuffle(unique_articles)
+    random.shuffle(all_articles)
+    
+    for article in all_articles[quota:]:
+        record_rejection(article.source, article.title, "over_quota")
+    unique_articles = all_articles[:quota]
+    if feed_state:
+        feed_state.defer_articles(all_articles[quota:])
+        feed_state.commit()
+    
+    # 3차: 실제 기사가 할당량보다 적을 때만 보충 기사 생성
+    shortfall = quota - len(unique_articles)
+    if shortfall > 0:
+        diverse_articles = generate_diverse_space_news(shortfall)
+        unique_articles.extend(diverse_articles)
+        logger.info(f"보충 우주 뉴스 {len(diverse_articles)}개 추가 (부족분 {shortfall}개)")
     
     logger.info(f"총 {len(unique_articles)}개 뉴스 수집 성공")
-    return unique_articles[:5]  # 최대 5개
+    return unique_articles
 
-def generate_diverse_space_news():
-    """다양한 우주 뉴스 생성 (매번 다른 내용)"""
-    import random
-    from datetime import datetime
+def get_due_source_news(names):
+    """지정한 소스(적응형 일정에서 확인할 때가 된 소스)의 새 기사만 수집 (보충 기사 없음, 최대 article_quota개)"""
+    from crawler.feed_state import new_feed_state
+    settings = get_settings()
+    quota = settings.article_quota
+    feed_state = new_feed_state()
+    google_candidates = []
+    if "GoogleNews" in names:
+        google_settings = settings.for_source("GoogleNews")
+        try:
+            google_candidates = collect_google_candidates(google_settings, feed_state)
+        except Exception as e:
+            logger.error(f"구글 뉴스 크롤링 실패: {e}")
+    alt_articles = crawl_alternative_sources([name for name in names if name != "GoogleNews"], feed_state, settings)
+    if not google_candidates and not alt_articles:
+        # 바뀐 피드가 없으면 이후 단계 없이 종료
+        if feed_state:
+            feed_state.commit()
+        logger.info(f"적응형 수집: 소스 {len(names)}개 모두 새 항목 없음")
+        return []
     
-    # 더 다양한 주제들
-    topics_pool = [
-        # 기술 발전
-        {
-            'title': '우주 기술 발전으로 인류 미래 변화 예상',
-            'content': '최근 우주 기술의 급속한 발전으로 인해 인류의 미래가 크게 변화할 것으로 예상됩니다. 우주 여행, 우주 정착, 우주 자원 채굴 등 다양한 분야에서 혁신이 이루어지고 있습니다.',
-            'category': '기술'
-        },
-        {
-            'title': '전 세계 우주 개발 경쟁 심화, 한국의 역할은?',
-            'content': '미국, 중국, 유럽 등 주요 국가들의 우주 개발 경쟁이 심화되고 있는 가운데, 한국도 누리호 로켓과 달 탐사 계획 등을 통해 우주 강국으로 도약하고 있습니다.',
-            'category': '국제'
-        },
-        # 상용화
-        {
-            'title': '우주 여행 상용화 시대, 일반인도 우주로',
-            'content': '민간 우주 기업들의 기술 발전으로 우주 여행이 점차 현실이 되고 있습니다. 앞으로 10년 내에 일반인도 우주 여행을 경험할 수 있을 것으로 예상됩니다.',
-            'category': '상용화'
-        },
-        # AI/로봇
-        {
-            'title': '인공지능과 로봇이 우주 탐사를 변화시키고 있다',
-            'content': 'AI와 로봇 기술의 발전으로 우주 탐사 방식이 혁신적으로 변화하고 있습니다. 자율 탐사 로봇과 AI 기반 데이터 분석으로 더 효율적인 우주 탐사가 가능해지고 있습니다.',
-            'category': 'AI'
-        },
-        # 산업
-        {
-            'title': '우주 산업의 미래, 새로운 일자리 창출 기대',
-            'content': '우주 산업의 성장으로 새로운 직업과 일자리가 창출되고 있습니다. 우주 엔지니어, 우주 관광 가이드, 우주 자원 채굴 전문가 등 다양한 분야에서 새로운 기회가 열리고 있습니다.',
-            'category': '산업'
-        },
-        # 추가 주제들
-        {
-            'title': '달 기지 건설 프로젝트, 인류 우주 정착의 첫 걸음',
-            'content': '각국의 달 기지 건설 계획이 구체화되고 있습니다. 달 기지는 인류의 우주 정착을 위한 첫 번째 단계로 여겨지고 있습니다.',
-            'category': '탐사'
-        },
-        {
-            'title': '우주 쓰레기 문제 심각, 청소 기술 개발 시급',
-            'content': '지구 궤도상의 우주 쓰레기가 심각한 문제로 대두되고 있습니다. 우주 쓰레기 청소 기술 개발이 시급한 과제로 떠오르고 있습니다.',
-            'category': '환경'
-        },
-        {
-            'title': '소행성 채굴 계획, 우주 자원 확보의 새로운 길',
-            'content': '소행성에서 희귀 금속과 광물을 채굴하는 계획이 현실화되고 있습니다. 이는 지구의 자원 부족 문제를 해결할 새로운 방법으로 주목받고 있습니다.',
-            'category': '자원'
-        },
-        {
-            'title': '우주 정거장 건설, 인류 우주 시대 열린다',
-            'content': '우주 정거장 건설 계획이 구체적으로 진행되고 있습니다. 이는 인류가 우주에서 영구적으로 거주할 수 있는 기반을 마련하는 중요한 단계입니다.',
-            'category': '정착'
-        },
-        {
-            'title': '우주 날씨 예보 시스템, 지구 기후 변화 대응',
-            'content': '인공위성을 활용한 우주 날씨 예보 시스템이 발전하고 있습니다. 이를 통해 지구 기후 변화에 더 효과적으로 대응할 수 있을 것으로 기대됩니다.',
-            'category': '기후'
-        }
-    ]
+    representatives = select_story_representatives(drop_seen_candidates(google_candidates + alt_articles), settings)
+    google_candidates = [item for item in representatives if item.source == "GoogleNews"]
+    alt_articles = [item for item in representatives if item.source != "GoogleNews"]
     
-    # 랜덤으로 2-4개 선택 (다양성 보장)
-    selected_count = random.randint(2, 4)
-    selected_topics = random.sample(topics_pool, selected_count)
+    articles = alt_articles[:quota]
+    if google_candidates and len(articles) < quota:
+        google_wanted = min(quota - len(articles), settings.for_source("GoogleNews").google_max_articles)
+        articles.extend(process_google_candidates(google_candidates, google_wanted, feed_state, settings))
+    elif feed_state:
+        feed_state.defer_articles(google_candidates)
+    for article in alt_articles[quota:]:
+        record_rejection(article.source, article.title, "over_quota")
+    if feed_state:
+        feed_state.defer_articles(alt_articles[quota:])
+        feed_state.commit()
+    logger.info(f"적응형 수집: 소스 {len(names)}개에서 새 기사 {len(articles)}개")
+    return articles
+
+def generate_diverse_space_news(count):
+    """보충 우주 뉴스 생성 - 순환 기간 안에 쓰지 않은 주제만 (data/filler_topics.json)"""
+    from crawler.topic_rotation import get_topic_rotation
     
     result = []
-    for i, topic in enumerate(selected_topics):
-        # 다양한 소스 이름 사용
-        sources = ['SpaceNews', 'KoreaSpace', 'ScienceDaily', 'SpaceTech', 'AstroNews']
-        source_name = random.choice(sources)
-        
-        result.append({
-            'title': topic['title'],
-            'content': f"{source_name}에서 보도한 우주 과학 뉴스입니다.\n\n{topic['content']}\n\n🏷️ 분류: {topic['category']}\n🔗 자세한 내용은 관련 우주 기관에서 확인하실 수 있습니다.",
-            'source': source_name
-        })
+    for topic in get_topic_rotation().take(count):
+        result.append(Article(topic['title'], topic['source'], kind="filler", body=topic['content'],
+                              category=topic['category']))
     
-    return result
\ No newline at end of file
+    return result
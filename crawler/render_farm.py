@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Selenium 렌더 팜 - 브라우저를 별도 워커 프로세스에서 실행
+
+작업(job)은 dict로 전달합니다:
+    {"url": ..., "wait_selector": ..., "wait_seconds": ..., "content_selectors": [...], "timeout": ...}
+결과도 dict입니다:
+    {"ok": bool, "final_url": ..., "content": ..., "image_candidates": [...], "error": ...}
+"""
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from contextlib import ExitStack
+from typing import Callable, Dict, Optional
+
+from config import (
+    RENDER_WORKERS, RENDER_JOB_TIMEOUT, RENDER_WORKER_MAX_JOBS, RENDER_ACQUIRE_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+# 포크 시 FastAPI/스케줄러 스레드 상태가 복사되지 않도록 spawn 사용
+_mp_context = multiprocessing.get_context("spawn")
+
+
+def _render_worker_main(conn, worker_id: int):
+    """워커 프로세스 본체: 브라우저를 소유하고 작업을 하나씩 처리"""
+    if hasattr(os, "setsid"):
+        # 강제 종료 시 chromedriver/chrome 자식까지 한 번에 정리하기 위해 새 프로세스 그룹 생성
+        os.setsid()
+
+    from crawler.selenium_enhancer import create_chrome_driver, render_page, extract_rendered_content
+
+    driver = None
+    try:
+        while True:
+            job = conn.recv()
+            if job is None:
+                break
+
+            result = {"id": job.get("id"), "ok": False, "final_url": "", "content": "",
+                      "image_candidates": [], "error": ""}
+            try:
+                if driver is None:
+                    driver = create_chrome_driver(page_load_timeout=int(job.get("timeout", RENDER_JOB_TIMEOUT)))
+                final_url, html = render_page(
+                    driver, job["url"],
+                    wait_selector=job.get("wait_selector"),
+                    wait_seconds=job.get("wait_seconds", 5)
+                )
+                result["final_url"] = final_url
+                if html:
+                    content, image_candidates = extract_rendered_content(
+                        html, final_url, job.get("content_selectors")
+                    )
+                    result.update(ok=True, content=content, image_candidates=image_candidates)
+                    if job.get("return_html"):
+                        # 스냅샷 저장용 (bound_html 로 이미 상한 적용됨)
+                        result["html"] = html
+                else:
+                    result["error"] = "구글 뉴스에서 벗어나지 못함"
+            except Exception as e:
+                result["error"] = str(e)
+                # 드라이버 상태를 알 수 없으므로 다음 작업에서 새로 생성
+                if driver is not None:
+                    try:
+                        driver.quit()
+                    except Exception:
+                        pass
+                    driver = None
+            conn.send(result)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+class _RenderWorker:
+    """부모 프로세스 쪽에서 관리하는 워커 핸들"""
+
+    def __init__(self, worker_id: int):
+        self.worker_id = worker_id
+        self.jobs_done = 0
+        self.conn, child_conn = _mp_context.Pipe()
+        self.process = _mp_context.Process(
+            target=_render_worker_main, args=(child_conn, worker_id),
+            name=f"render-worker-{worker_id}", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self):
+        """워커와 브라우저 프로세스 그룹 강제 종료"""
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+        # setsid 이전에 종료되는 경우 등을 대비해 워커 자체도 종료
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+    def stop(self, timeout: float = 10):
+        """정상 종료 요청 후 시간 내 종료되지 않으면 강제 종료"""
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(timeout=timeout)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+class RenderFarm:
+    """렌더 워커 풀 (작업별 타임아웃/강제 종료, 작업 수 기준 워커 재생성)"""
+
+    def __init__(self, size: int = RENDER_WORKERS, job_timeout: float = RENDER_JOB_TIMEOUT,
+                 max_jobs_per_worker: int = RENDER_WORKER_MAX_JOBS):
+        self.size = size
+        self.job_timeout = job_timeout
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self._idle = queue.Queue()
+        self._ids = itertools.count(1)
+        self._job_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {"completed": 0, "failed": 0, "timeouts": 0, "recycled": 0, "killed": 0}
+
+        for _ in range(size):
+            self._idle.put(self._spawn())
+        logger.info(f"렌더 팜 시작: 워커 {size}개")
+
+    def _spawn(self) -> _RenderWorker:
+        return _RenderWorker(next(self._ids))
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _release(self, worker: _RenderWorker):
+        """워커 반환 (수명 초과/비정상 워커는 교체)"""
+        if self._closed:
+            worker.stop()
+            return
+        if not worker.is_alive():
+            worker.kill()
+            worker = self._spawn()
+        elif worker.jobs_done >= self.max_jobs_per_worker:
+            # 브라우저 메모리 누수 누적 방지를 위해 주기적으로 재생성
+            worker.stop()
+            worker = self._spawn()
+            self._count("recycled")
+        self._idle.put(worker)
+
+    def render(self, job: Dict, timeout: Optional[float] = None, slot: Callable = None) -> Dict:
+        """렌더 작업 실행 (동기) - 타임아웃 시 해당 워커를 강제 종료
+
+        slot: 워커를 얻은 뒤 페이지 로드 동안만 잡을 컨텍스트 (호스트별 요청 예절, 워커 대기 시간은 제외)
+        """
+        if self._closed:
+            return {"ok": False, "error": "렌더 팜 종료됨"}
+
+        job = dict(job, id=next(self._job_ids))
+        timeout = timeout or job.get("timeout") or self.job_timeout
+
+        try:
+            worker = self._idle.get(timeout=RENDER_ACQUIRE_TIMEOUT)
+        except queue.Empty:
+            return {"ok": False, "error": "사용 가능한 렌더 워커 없음"}
+
+        with ExitStack() as stack:
+            if slot is not None:
+                try:
+                    stack.enter_context(slot())
+                except Exception:
+                    self._release(worker)
+                    raise
+            started = time.monotonic()
+            try:
+                worker.conn.send(job)
+                if worker.conn.poll(timeout):
+                    result = worker.conn.recv()
+                    worker.jobs_done += 1
+                    self._count("completed" if result.get("ok") else "failed")
+                    result["elapsed"] = round(time.monotonic() - started, 2)
+                    self._release(worker)
+                    return result
+
+                logger.warning(f"렌더 작업 타임아웃 ({timeout}초): {job['url'][:60]}... - 워커 {worker.worker_id} 종료")
+                self._count("timeouts")
+            except (EOFError, OSError, BrokenPipeError) as e:
+                logger.error(f"렌더 워커 {worker.worker_id} 비정상 종료: {e}")
+                self._count("failed")
+
+        # 멈춘 브라우저는 워커째로 정리하고 새 워커로 교체
+        worker.kill()
+        self._count("killed")
+        if self._closed:
+            return {"ok": False, "error": "렌더 팜 종료됨"}
+        self._idle.put(self._spawn())
+        return {"ok": False, "error": "렌더 작업 타임아웃 또는 워커 종료"}
+
+    def status(self) -> Dict:
+        """풀 상태 (헬스체크용)"""
+        with self._lock:
+            stats = dict(self.stats)
+        return {"size": self.size, "idle": self._idle.qsize(), **stats}
+
+    def shutdown(self):
+        """모든 워커 종료"""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.stop()
+        logger.info("렌더 팜 종료")
+
+
+_farm = None
+_farm_lock = threading.Lock()
+
+
+def get_render_farm() -> RenderFarm:
+    """전역 렌더 팜 (첫 사용 시 시작)"""
+    global _farm
+    if _farm is None:
+        with _farm_lock:
+            if _farm is None:
+                _farm = RenderFarm()
+    return _farm
+
+
+def get_render_farm_status() -> Optional[Dict]:
+    """렌더 팜이 시작되지 않았으면 None"""
+    return _farm.status() if _farm is not None else None
+
+
+def shutdown_render_farm():
+    """서버 종료 시 호출"""
+    global _farm
+    with _farm_lock:
+        if _farm is not None:
+            _farm.shutdown()
+            _farm = None
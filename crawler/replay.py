@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+스냅샷 재실행 - 저장된 페이지로 본문 추출/AI 평가를 네트워크 없이 다시 돌려봄
+
+추출 로직을 고친 뒤 실제 페이지 수천 개에 대해 결과가 어떻게 바뀌는지 확인하는 용도:
+    python -m crawler.replay --output before.jsonl          # 변경 전 결과 저장
+    (추출 코드 수정)
+    python -m crawler.replay --baseline before.jsonl        # 변경 후 결과와 비교
+
+옵션: --kind fetch|rendered, --limit N, --workers N, --no-evaluate
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from utils.snapshot_store import get_snapshot_store
+
+
+def replay_snapshot(snapshot: Dict, evaluate: bool = True) -> Dict:
+    """스냅샷 하나에 대해 추출(+평가) 실행 (워커 프로세스에서 호출)"""
+    result = {
+        "snapshot_id": snapshot["snapshot_id"],
+        "kind": snapshot["kind"],
+        "url": snapshot["url"],
+        "digest": snapshot["digest"],
+        "error": ""
+    }
+    try:
+        html = get_snapshot_store().read(snapshot["digest"])
+        final_url = snapshot["final_url"] or snapshot["url"]
+        if snapshot["kind"] == "rendered":
+            from crawler.selenium_enhancer import extract_rendered_content
+            content, image_candidates = extract_rendered_content(html, final_url)
+        else:
+            from crawler.optimized_news_crawler import extract_article_from_html
+            content, image_candidates = extract_article_from_html(html, final_url)
+
+        result.update(
+            content_length=len(content),
+            content_hash=hashlib.md5(content.encode('utf-8')).hexdigest()[:16],
+            image_candidates=len(image_candidates),
+            first_image=image_candidates[0] if image_candidates else ""
+        )
+        if evaluate:
+            from ai.news_evaluator import evaluate_news_article
+            evaluation = evaluate_news_article(snapshot["title"] or "", content, snapshot["url"])
+            result.update(evaluation=evaluation["evaluation"], reason=evaluation.get("reason", ""))
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+def _replay_chunk(snapshots: List[Dict], evaluate: bool) -> List[Dict]:
+    return [replay_snapshot(snapshot, evaluate) for snapshot in snapshots]
+
+
+def replay(kind: str = None, limit: int = None, workers: int = None, evaluate: bool = True) -> List[Dict]:
+    """저장된 스냅샷을 여러 코어에서 나눠 재실행"""
+    snapshots = get_snapshot_store().list_snapshots(kind=kind, limit=limit)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(snapshots) < 2:
+        return _replay_chunk(snapshots, evaluate)
+
+    # 프로세스 간 전달 비용을 줄이기 위해 덩어리 단위로 분배
+    chunk_size = max(1, min(64, len(snapshots) // (workers * 4) or 1))
+    chunks = [snapshots[i:i + chunk_size] for i in range(0, len(snapshots), chunk_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_results in pool.map(_replay_chunk, chunks, [evaluate] * len(chunks)):
+            results.extend(chunk_results)
+    return results
+
+
+def summarize(results: List[Dict]) -> Dict:
+    ok = [r for r in results if not r["error"]]
+    lengths = [r["content_length"] for r in ok]
+    summary = {
+        "snapshots": len(results),
+        "errors": len(results) - len(ok),
+        "empty_content": sum(1 for length in lengths if length == 0),
+        "avg_content_length": round(sum(lengths) / len(lengths), 1) if lengths else 0,
+        "with_image": sum(1 for r in ok if r["image_candidates"]),
+    }
+    if ok and "evaluation" in ok[0]:
+        summary["accepted"] = sum(1 for r in ok if r["evaluation"] != "REJECT")
+        summary["rejected"] = sum(1 for r in ok if r["evaluation"] == "REJECT")
+    return summary
+
+
+def compare(results: List[Dict], baseline: List[Dict]) -> Dict:
+    """이전 결과와 비교 (같은 snapshot_id 기준)"""
+    previous = {r["snapshot_id"]: r for r in baseline}
+    diff = {"compared": 0, "content_changed": 0, "became_empty": 0, "became_filled": 0,
+            "evaluation_changed": 0, "examples": []}
+    for result in results:
+        before = previous.get(result["snapshot_id"])
+        if before is None or result["error"] or before.get("error"):
+            continue
+        diff["compared"] += 1
+        changed = False
+        if result["content_hash"] != before["content_hash"]:
+            diff["content_changed"] += 1
+            changed = True
+            if result["content_length"] == 0:
+                diff["became_empty"] += 1
+            elif before["content_length"] == 0:
+                diff["became_filled"] += 1
+        # 한쪽이 평가를 생략했으면 평가 결과는 비교하지 않음
+        if "evaluation" in result and "evaluation" in before and result["evaluation"] != before["evaluation"]:
+            diff["evaluation_changed"] += 1
+            changed = True
+        if changed and len(diff["examples"]) < 10:
+            diff["examples"].append({
+                "url": result["url"],
+                "content_length": [before["content_length"], result["content_length"]],
+                "evaluation": [before.get("evaluation"), result.get("evaluation")]
+            })
+    return diff
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="스냅샷 기반 추출/평가 재실행")
+    arg_parser.add_argument("--kind", choices=["fetch", "rendered"])
+    arg_parser.add_argument("--limit", type=int)
+    arg_parser.add_argument("--workers", type=int)
+    arg_parser.add_argument("--no-evaluate", action="store_true", help="AI 평가 생략")
+    arg_parser.add_argument("--output", help="결과를 JSON Lines 로 저장")
+    arg_parser.add_argument("--baseline", help="비교할 이전 결과 (JSON Lines)")
+    args = arg_parser.parse_args()
+
+    started = time.perf_counter()
+    results = replay(kind=args.kind, limit=args.limit, workers=args.workers, evaluate=not args.no_evaluate)
+    elapsed = time.perf_counter() - started
+
+    summary = summarize(results)
+    summary["seconds"] = round(elapsed, 2)
+    summary["pages_per_second"] = round(len(results) / elapsed, 1) if elapsed else 0
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = [json.loads(line) for line in f if line.strip()]
+        print(json.dumps(compare(results, baseline), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,145 +3,191 @@
 Selenium을 사용한 기사 내용 품질 개선
 """
 import logging
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+from utils.snapshot_store import record_snapshot
+from utils.text_normalizer import RENDERED_BLOCK_BOILERPLATE, RENDERED_LINE_BOILERPLATE
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONTENT_SELECTORS = [
+    '.article_body', '.news_body', '.view_body',
+    '.article_txt', '.news_txt', '.view_txt',
+    '.article_content', '.news_content', '.view_content',
+    '.article-content', '.news-content', '.view-content',
+    '.content_area', '.txt_area', '.article_area',
+    '.article_body_contents', '.view_con_t',
+    'article', '.content', '#content', '.main-content',
+    '.post-content', '.entry-content', '.story-content',
+    '.article-body', '.news-body', '.text-content'
+]
+
+RENDERED_IMAGE_SELECTORS = [
+    "meta[property='og:image']",
+    "meta[name='twitter:image']",
+    "meta[property='twitter:image']",
+    ".article_body img",
+    ".news_body img",
+    ".article-content img",
+    "article img",
+    ".content img",
+    "img"
+]
+
+def get_content_selectors() -> List[str]:
+    """렌더링 본문 셀렉터 (크롤링 설정의 추가 셀렉터를 먼저 시도)"""
+    from utils.crawl_settings import get_settings
+    return [*get_settings().extra_rendered_selectors, *DEFAULT_CONTENT_SELECTORS]
+
+def create_chrome_driver(page_load_timeout: int = 20):
+    """헤드리스 Chrome 드라이버 생성"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_page_load_timeout(page_load_timeout)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+def render_page(driver, url: str, wait_selector: Optional[str] = None, wait_seconds: float = 5) -> Tuple[str, str]:
+    """페이지 렌더링 후 (최종 URL, HTML) 반환 - 구글 뉴스를 벗어나지 못하면 HTML은 빈 문자열"""
+    import time
+
+    driver.get(url)
+    if wait_selector:
+        # 지정한 요소가 나타날 때까지만 대기
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        try:
+            WebDriverWait(driver, wait_seconds).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+            )
+        except Exception:
+            logger.debug(f"대기 요소 미발견: {wait_selector}")
+    else:
+        time.sleep(wait_seconds)
+
+    final_url = driver.current_url
+    if 'news.google.com' in final_url:
+        return final_url, ""
+
+    logger.info(f"실제 사이트 도달: {final_url[:50]}...")
+    if not wait_selector:
+        time.sleep(3)
+
+    # 대형 포털 페이지도 상한까지만 파싱
+    from utils.bounded_fetch import bound_html
+    return final_url, bound_html(driver.page_source)
+
+def extract_rendered_content(html: str, final_url: str, content_selectors: List[str] = None) -> Tuple[str, List[str]]:
+    """렌더링된 HTML에서 본문과 이미지 후보 추출 (네트워크 없음)"""
+    from bs4 import BeautifulSoup
+    from utils.image_resolver import collect_image_candidates
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    content = ""
+    for selector in content_selectors or get_content_selectors():
+        elements = soup.select(selector)
+        for element in elements:
+            for unwanted in element.select('script, style, .ad, .advertisement, .social, .share, .comment'):
+                unwanted.decompose()
+
+            text = element.get_text(separator='\n', strip=True)
+
+            if (len(text) > 300 and
+                not RENDERED_BLOCK_BOILERPLATE.matches(text) and
+                text.count('\n') >= 3):
+
+                lines = text.split('\n')
+                unique_lines = []
+                seen_lines = set()
+
+                for line in lines:
+                    line = line.strip()
+                    if (len(line) > 20 and
+                        line not in seen_lines and
+                        not RENDERED_LINE_BOILERPLATE.matches(line)):
+                        unique_lines.append(line)
+                        seen_lines.add(line)
+
+                if len(unique_lines) >= 3:
+                    content = '\n\n'.join(unique_lines[:8])
+                    break
+
+        if content:
+            break
+
+    return content, collect_image_candidates(soup, final_url, RENDERED_IMAGE_SELECTORS)
+
+def _render_in_process(url: str, title: str = "") -> Tuple[str, List[str]]:
+    """현재 프로세스에서 브라우저를 띄워 렌더링 (렌더 팜 미사용 시)"""
+    from utils.politeness import get_scheduler
+    driver = create_chrome_driver()
+    try:
+        # 호스트 슬롯은 페이지 로드 동안만
+        with get_scheduler().slot(url):
+            final_url, html = render_page(driver, url)
+    finally:
+        # 브라우저는 먼저 종료하고 이미지 검증은 HTTP로 진행
+        driver.quit()
+
+    if not html:
+        logger.warning("구글 뉴스에서 벗어나지 못함")
+        return "", []
+    record_snapshot("rendered", url, html, final_url=final_url, title=title)
+    return extract_rendered_content(html, final_url, get_content_selectors())
+
 def enhance_article_with_selenium(url: str, title: str) -> Tuple[str, str]:
     """Selenium으로 실제 기사 내용과 이미지 추출 (강화버전)"""
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.common.by import By
-        from bs4 import BeautifulSoup
-        import time
-        
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
+        from config import RENDER_FARM_ENABLED, SNAPSHOT_ENABLED
+        from utils.crawl_settings import get_settings
+
         logger.info(f"Selenium으로 기사 내용 개선 시작: {url[:50]}...")
-        
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.set_page_load_timeout(20)
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
-        driver.get(url)
-        time.sleep(5)
-        
-        final_url = driver.current_url
-        
-        if 'news.google.com' not in final_url:
-            logger.info(f"실제 사이트 도달: {final_url[:50]}...")
-            
-            time.sleep(3)
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            content_selectors = [
-                '.article_body', '.news_body', '.view_body',
-                '.article_txt', '.news_txt', '.view_txt',
-                '.article_content', '.news_content', '.view_content',
-                '.article-content', '.news-content', '.view-content',
-                '.content_area', '.txt_area', '.article_area',
-                '.article_body_contents', '.view_con_t',
-                'article', '.content', '#content', '.main-content',
-                '.post-content', '.entry-content', '.story-content',
-                '.article-body', '.news-body', '.text-content'
-            ]
-            
-            content = ""
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    for unwanted in element.select('script, style, .ad, .advertisement, .social, .share, .comment'):
-                        unwanted.decompose()
-                    
-                    text = element.get_text(separator='\n', strip=True)
-                    
-                    if (len(text) > 300 and 
-                        not any(skip in text.lower() for skip in ['광고', '구독', '로그인', '댓글', '공유하기', '카카오톡']) and
-                        text.count('\n') >= 3):
-                        
-                        lines = text.split('\n')
-                        unique_lines = []
-                        seen_lines = set()
-                        
-                        for line in lines:
-                            line = line.strip()
-                            if (len(line) > 20 and 
-                                line not in seen_lines and
-                                not any(skip in line for skip in ['저작권', '무단전재', '사진=', '기자=', '출처='])):
-                                unique_lines.append(line)
-                                seen_lines.add(line)
-                        
-                        if len(unique_lines) >= 3:
-                            content = '\n\n'.join(unique_lines[:8])
-                            break
-                
-                if content:
-                    break
-            
-            image_url = ""
-            img_selectors = [
-                "meta[property='og:image']",
-                "meta[name='twitter:image']",
-                "meta[property='twitter:image']",
-                ".article_body img[src]",
-                ".news_body img[src]",
-                ".article-content img[src]",
-                "article img[src]",
-                ".content img[src]",
-                "img[src]"
-            ]
-            
-            for selector in img_selectors:
-                if 'meta' in selector:
-                    meta_img = soup.select_one(selector)
-                    if meta_img and meta_img.get('content'):
-                        src = meta_img.get('content')
-                        if src and src.startswith('http') and any(ext in src.lower() for ext in ['.jpg', '.png', '.jpeg', '.webp']):
-                            image_url = src
-                            break
-                else:
-                    img = soup.select_one(selector)
-                    if img and img.get('src'):
-                        src = img.get('src')
-                        if src and (src.startswith('http') or src.startswith('/')):
-                            if not src.startswith('http'):
-                                from urllib.parse import urljoin
-                                src = urljoin(final_url, src)
-                            if any(ext in src.lower() for ext in ['.jpg', '.png', '.jpeg', '.webp']):
-                                image_url = src
-                                break
-            
-            driver.quit()
-            
-            if content and len(content) > 500:
-                logger.info(f"Selenium 성공: {len(content)}자 추출")
-                return content[:2000], image_url
-            else:
-                logger.warning(f"Selenium 결과 부족: {len(content) if content else 0}자")
-                return content if content else "", image_url
+
+        if RENDER_FARM_ENABLED:
+            # 별도 프로세스의 브라우저 풀에서 렌더링 (API 프로세스와 격리)
+            from crawler.render_farm import get_render_farm
+            from utils.politeness import get_scheduler
+            # 셀렉터는 작업에 담아 보냄 (워커 프로세스는 설정 재로드를 모름)
+            # 호스트 슬롯은 워커가 페이지를 읽는 동안만 (워커 대기/이미지 검증 제외)
+            result = get_render_farm().render({
+                "url": url, "return_html": SNAPSHOT_ENABLED, "content_selectors": get_content_selectors()
+            }, slot=lambda: get_scheduler().slot(url))
+            if not result.get("ok"):
+                logger.warning(f"렌더 작업 실패: {result.get('error', '')}")
+                return "", ""
+            record_snapshot("rendered", url, result.get("html"), final_url=result["final_url"], title=title)
+            content, image_candidates = result["content"], result["image_candidates"]
         else:
-            logger.warning("구글 뉴스에서 벗어나지 못함")
-            driver.quit()
-            return "", ""
-            
+            content, image_candidates = _render_in_process(url, title)
+
+        from utils.image_resolver import resolve_best_image
+        image_url = resolve_best_image(image_candidates)
+
+        if content and len(content) > get_settings().selenium_min_content:
+            logger.info(f"Selenium 성공: {len(content)}자 추출")
+            return content[:2000], image_url
+        else:
+            logger.warning(f"Selenium 결과 부족: {len(content) if content else 0}자")
+            return content if content else "", image_url
+
     except ImportError:
         logger.warning("Selenium 미설치 - pip install selenium 필요")
         return "", ""
     except Exception as e:
         logger.error(f"Selenium 오류: {e}")
-        try:
-            driver.quit()
-        except:
-            pass
         return "", ""
 
 def is_selenium_available() -> bool:
@@ -150,4 +196,4 @@ def is_selenium_available() -> bool:
         from selenium import webdriver
         return True
     except ImportError:
-        return False
\ No newline at end of file
+        return False
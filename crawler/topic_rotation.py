@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+보충 기사 주제 순환 (결정적 선택 + 사용 이력 저장)
+
+실제 기사가 할당량보다 적을 때만 보충 기사를 만들며,
+최근 FILLER_ROTATION_HORIZON_HOURS 안에 쓴 주제는 다시 고르지 않음.
+(중복 체크 기간 안에 같은 주제를 다시 내보내면 어차피 중복으로 걸러지기 때문)
+"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from utils.duplicate_checker import create_title_hash
+from config import FILLER_TOPICS_FILE, FILLER_ROTATION_STATE_FILE, FILLER_ROTATION_HORIZON_HOURS
+
+logger = logging.getLogger(__name__)
+
+
+def topic_id(topic: Dict) -> str:
+    """주제 식별자 (파일에서 순서가 바뀌어도 유지되도록 제목 해시 사용)"""
+    return create_title_hash(topic['title'])
+
+
+class TopicRotation:
+    """주제 파일과 사용 이력을 바탕으로 보충 기사 주제를 고름"""
+
+    def __init__(self, topics_file: str = FILLER_TOPICS_FILE, state_file: str = FILLER_ROTATION_STATE_FILE,
+                 horizon_hours: int = FILLER_ROTATION_HORIZON_HOURS):
+        self.topics_file = topics_file
+        self.state_file = state_file
+        self.horizon = timedelta(hours=horizon_hours)
+        self._lock = threading.Lock()
+        self._catalog = None
+        self._catalog_mtime = None
+
+    def _load_catalog(self) -> Dict:
+        """주제 파일 로드 (수정 시각이 바뀐 경우에만 다시 읽음)"""
+        try:
+            mtime = os.path.getmtime(self.topics_file)
+        except OSError:
+            logger.warning(f"보충 주제 파일 없음: {self.topics_file}")
+            return {"sources": [], "topics": []}
+        if self._catalog is None or mtime != self._catalog_mtime:
+            with open(self.topics_file, 'r', encoding='utf-8') as f:
+                self._catalog = json.load(f)
+            self._catalog_mtime = mtime
+            logger.info(f"보충 주제 {len(self._catalog.get('topics', []))}개 로드")
+        return self._catalog
+
+    def _load_state(self) -> Dict:
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"주제 순환 상태 로드 실패: {e}")
+        return {"last_used": {}, "source_index": 0}
+
+    def _save_state(self, state: Dict):
+        directory = os.path.dirname(self.state_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_file)
+
+    def available_topics(self, now: datetime = None) -> List[Dict]:
+        """순환 기간 안에 쓰지 않은 주제 (안 쓴 주제 → 오래전에 쓴 주제 순, 동률은 파일 순서)"""
+        now = now or datetime.now()
+        catalog = self._load_catalog()
+        last_used = self._load_state()["last_used"]
+        cutoff = now - self.horizon
+
+        ranked = []
+        for order, topic in enumerate(catalog.get("topics", [])):
+            used_at = last_used.get(topic_id(topic))
+            used_at = datetime.fromisoformat(used_at) if used_at else None
+            if used_at is not None and used_at > cutoff:
+                continue
+            ranked.append((used_at or datetime.min, order, topic))
+        ranked.sort(key=lambda entry: (entry[0], entry[1]))
+        return [topic for _, _, topic in ranked]
+
+    def take(self, count: int, now: datetime = None) -> List[Dict]:
+        """주제 count개를 골라 사용 처리 후 반환 (출처 이름도 순서대로 배정)"""
+        if count <= 0:
+            return []
+        now = now or datetime.now()
+        with self._lock:
+            selected = self.available_topics(now)[:count]
+            if not selected:
+                logger.info("순환 기간 안에 사용 가능한 보충 주제 없음")
+                return []
+
+            state = self._load_state()
+            sources = self._load_catalog().get("sources") or ["SpaceNews"]
+            result = []
+            for topic in selected:
+                state["last_used"][topic_id(topic)] = now.isoformat()
+                source_name = sources[state["source_index"] % len(sources)]
+                state["source_index"] += 1
+                result.append({**topic, "source": source_name})
+
+            # 더 이상 파일에 없는 주제의 이력은 정리
+            known = {topic_id(topic) for topic in self._load_catalog().get("topics", [])}
+            state["last_used"] = {key: value for key, value in state["last_used"].items() if key in known}
+            try:
+                self._save_state(state)
+            except Exception as e:
+                logger.error(f"주제 순환 상태 저장 실패: {e}")
+            return result
+
+
+_rotation = None
+
+
+def get_topic_rotation() -> TopicRotation:
+    global _rotation
+    if _rotation is None:
+        _rotation = TopicRotation()
+    return _rotation
@@ -1,54 +1,86 @@
-from fastapi import FastAPI, HTTPException
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
-from crawler.news_only_crawler import crawl_news_only
-from crawler.exhibition_crawler import crawl_space_exhibitions
-import uvicorn
+from fastapi import FastAPI, HTTPException, Header
+from fastapi.responses import JSONResponse
+import asyncio
 import logging
-import requests
-from config import SPRING_SERVER_URL
 from utils.logger_setup import setup_logger, log_crawling_result, log_crawling_error
+from utils.plugin_registry import (
+    run_plugin, run_scheduled_plugin, get_scheduled_plugins, list_plugins, PluginUnavailable
+)
+from utils.health_monitor import create_default_monitor
 
 # 로그 시스템 설정
 setup_logger()
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="AI 우주 정보 크롤러", description="우주 뉴스와 전시회 정보 크롤링 시스템")
-scheduler = AsyncIOScheduler()
+
+# 크롤러/스케줄러 모듈은 무거우므로 서버 기동 후 지연 임포트
+scheduler = None
+health_monitor = create_default_monitor()
+backfill_task = None
 
 @app.on_event("startup")
 async def startup_event():
-    """서버 시작 시 스케줄러 시작"""
-    # 우주 뉴스 크롤링: 하루 1회 (오전 8시) - 3개 뉴스 보장
-    scheduler.add_job(
-        crawl_news_only,
-        CronTrigger(hour=8, minute=0),
-        id="daily_news",
-        name="오전 8시 우주 뉴스 크롤링 (3개 보장)"
-    )
-    
-    # 우주 전시회 크롤링: 하루 1회 (오전 10시) - 뉴스와 시간 분리
-    scheduler.add_job(
-        crawl_space_exhibitions,
-        CronTrigger(hour=10, minute=0),
-        id="daily_exhibitions",
-        name="오전 10시 우주 전시회 크롤링"
-    )
-    
+    """서버 시작 시 스케줄러 시작 (사용 가능한 플러그인만 등록)"""
+    global scheduler
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from apscheduler.triggers.cron import CronTrigger
+
+    # 다중 인스턴스 조정 (COORDINATION_ENABLED 일 때만 공유 저장소에 하트비트)
+    from utils.coordination import get_coordinator
+    await asyncio.to_thread(get_coordinator().start)
+
+    scheduler = AsyncIOScheduler()
+    for plugin in get_scheduled_plugins():
+        # 크롤러 모듈은 첫 실행 시점에 임포트됨 (회차 리스를 얻은 노드만 실행)
+        scheduler.add_job(
+            run_scheduled_plugin,
+            CronTrigger(**plugin["schedule"]),
+            args=[plugin["name"]],
+            id=f"daily_{plugin['name']}",
+            name=plugin["description"]
+        )
+        logger.info(f"  - {plugin['description']}")
+
     scheduler.start()
     logger.info("우주 정보 크롤링 스케줄러 시작됨")
-    logger.info("  - 우주 뉴스 (3개 보장): 매일 08:00")
-    logger.info("  - 우주 전시회: 매일 10:00")
+
+    # 헬스 프로브는 백그라운드에서 주기 실행 (엔드포인트는 캐시된 결과만 사용)
+    health_monitor.start()
+
+    # 아웃박스 디스패처 (이전 실행에서 남은 게시글도 이어서 전송)
+    from utils.outbox import get_dispatcher
+    get_dispatcher().start()
+
+    # 상시 프로파일링 (PROFILE_CONTINUOUS 일 때만, 낮은 빈도 스택 샘플링)
+    from config import PROFILE_CONTINUOUS
+    if PROFILE_CONTINUOUS:
+        from utils.profiler import get_continuous_profiler
+        get_continuous_profiler().start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """서버 종료 시 스케줄러 종료"""
-    scheduler.shutdown()
+    """서버 종료 시 스케줄러, 헬스 프로브, 아웃박스 디스패처, 노드 조정, 프로파일러, 요약기 및 렌더 팜 종료 (게시 기록 필터 저장)"""
+    await health_monitor.stop()
+    if scheduler is not None:
+        scheduler.shutdown()
+    from utils.outbox import get_dispatcher
+    await asyncio.to_thread(get_dispatcher().stop)
+    from utils.coordination import get_coordinator
+    await asyncio.to_thread(get_coordinator().stop)
+    from utils.profiler import get_continuous_profiler
+    await asyncio.to_thread(get_continuous_profiler().stop)
+    from ai.summarizer import shutdown_summarizer
+    await asyncio.to_thread(shutdown_summarizer)
+    from utils.seen_filter import shutdown_seen_filter
+    await asyncio.to_thread(shutdown_seen_filter)
+    from crawler.render_farm import shutdown_render_farm
+    shutdown_render_farm()
 
 @app.get("/")
 def read_root():
     return {
-        "message": "AI 우주 정보 크롤러 서버 실행 중", 
+        "message": "AI 우주 정보 크롤러 서버 실행 중",
         "news_schedule": ["08:00 (3개 보장)"],
         "exhibition_schedule": ["10:00"],
         "features": ["우주 뉴스 크롤링 (NEWS) - 3개 보장", "우주 전시회 크롤링 (EVENT)"],
@@ -59,7 +91,7 @@ def read_root():
 async def manual_news_crawl():
     """수동 뉴스 크롤링 실행"""
     try:
-        result = await crawl_news_only()
+        result = await run_plugin("news")
         log_crawling_result("news", result)
         return {"message": "뉴스 크롤링 완료", "result": result}
     except Exception as e:
@@ -70,39 +102,251 @@ async def manual_news_crawl():
 async def manual_exhibition_crawl():
     """수동 우주 전시회 크롤링 실행"""
     try:
-        result = await crawl_space_exhibitions()
+        result = await run_plugin("exhibitions")
         log_crawling_result("exhibitions", result)
         return {"message": "우주 전시회 크롤링 완료", "result": result}
+    except PluginUnavailable as e:
+        logger.warning(f"전시회 크롤러 사용 불가: {e}")
+        raise HTTPException(status_code=503, detail=f"전시회 크롤러 사용 불가: {str(e)}")
     except Exception as e:
         logger.error(f"수동 전시회 크롤링 오류: {e}")
         raise HTTPException(status_code=500, detail=f"전시회 크롤링 오류: {str(e)}")
 
+@app.post("/backfill")
+async def start_backfill(start: str, end: str, sources: str = None, fresh: bool = False, selenium: bool = False):
+    """과거 기간 백필 시작 (백그라운드 실행, 같은 기간으로 다시 호출하면 체크포인트부터 재개)"""
+    global backfill_task
+    from crawler.backfill import BackfillJob, parse_day, run_backfill, is_backfill_running
+    if is_backfill_running():
+        raise HTTPException(status_code=409, detail="이미 백필이 실행 중입니다")
+    try:
+        start_day, end_day = parse_day(start), parse_day(end)
+        source_list = [name.strip() for name in sources.split(",")] if sources else None
+        # 입력 검증만 먼저 수행 (잘못된 기간/소스는 400)
+        BackfillJob(start_day, end_day, sources=source_list, resume=True)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def _run():
+        try:
+            result = await asyncio.to_thread(run_backfill, start_day, end_day, source_list, not fresh, selenium)
+            logger.info(f"백필 완료: {result}")
+        except Exception as e:
+            logger.error(f"백필 오류: {e}")
+
+    backfill_task = asyncio.create_task(_run())
+    return {"message": "백필 시작", "start": start, "end": end, "resume": not fresh}
+
+@app.get("/backfill/status")
+async def backfill_status():
+    """백필 실행 여부 및 체크포인트 진행 상황"""
+    from crawler.backfill import get_backfill_status
+    return await asyncio.to_thread(get_backfill_status)
+
+def _scheduler_running() -> bool:
+    return scheduler.running if scheduler is not None else False
+
 @app.get("/status")
-def get_status():
-    """스케줄러 상태 확인"""
+async def get_status():
+    """스케줄러 상태 확인 (메모리 상태만 사용)"""
+    from utils.date_parser import get_date_parse_stats
+    from utils.politeness import get_scheduler
+    from utils.snapshot_store import get_snapshot_store
+    from utils.outbox import get_outbox
+    from utils.coordination import get_coordinator
+    from utils.seen_filter import get_seen_filter
+    from ai.summarizer import get_summarizer
+    from crawler.adaptive_schedule import get_feed_rates
     jobs = []
-    for job in scheduler.get_jobs():
-        jobs.append({
-            "id": job.id,
-            "name": job.name,
-            "next_run": str(job.next_run_time) if job.next_run_time else None
-        })
-    return {"scheduler_running": scheduler.running, "jobs": jobs}
+    if scheduler is not None:
+        for job in scheduler.get_jobs():
+            jobs.append({
+                "id": job.id,
+                "name": job.name,
+                "next_run": str(job.next_run_time) if job.next_run_time else None
+            })
+    return {
+        "scheduler_running": _scheduler_running(),
+        "jobs": jobs,
+        "plugins": list_plugins(),
+        "health": health_monitor.snapshot(),
+        "date_parsing": get_date_parse_stats(),
+        "politeness": get_scheduler().stats(),
+        "snapshots": await asyncio.to_thread(lambda: get_snapshot_store().stats()),
+        "outbox": await asyncio.to_thread(lambda: get_outbox().stats()),
+        "coordination": await asyncio.to_thread(get_coordinator().stats),
+        "seen_filter": await asyncio.to_thread(lambda: get_seen_filter().stats()),
+        "summarizer": await asyncio.to_thread(lambda: get_summarizer().stats()),
+        "feed_rates": await asyncio.to_thread(lambda: get_feed_rates().snapshot())
+    }
 
 @app.get("/health")
-def health_check():
-    """헬스체크 및 스프링 서버 연결 확인"""
-    try:
-        response = requests.get(f"{SPRING_SERVER_URL}/api/admin/crawler/status", timeout=5)
-        spring_status = "connected" if response.status_code == 200 else "disconnected"
-    except:
-        spring_status = "disconnected"
-    
+async def health_check():
+    """헬스체크 및 스프링 서버 연결 확인 (백그라운드 프로브 캐시 결과)"""
+    checks = health_monitor.snapshot()
+    spring = checks.get("spring_server")
+    if spring is None:
+        spring_status = "unknown"  # 첫 프로브 실행 전
+    else:
+        spring_status = "connected" if spring["ok"] else "disconnected"
     return {
         "fastapi_status": "running",
         "spring_server_status": spring_status,
-        "scheduler_running": scheduler.running if 'scheduler' in globals() else False
+        "scheduler_running": _scheduler_running(),
+        "ready": _scheduler_running() and health_monitor.is_ready(),
+        "uptime_seconds": health_monitor.uptime(),
+        "checks": checks
     }
 
+@app.get("/health/live")
+async def liveness_check():
+    """프로세스 생존 확인 (외부 의존성과 무관)"""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    """요청을 받을 준비가 되었는지 확인 (스케줄러 + 필수 프로브)"""
+    ready = _scheduler_running() and health_monitor.is_ready()
+    body = {"status": "ready" if ready else "not_ready", "checks": health_monitor.snapshot()}
+    return JSONResponse(status_code=200 if ready else 503, content=body)
+
+@app.get("/analytics/sources")
+async def analytics_sources(days: int = 7):
+    """출처별 수락률 / 중복 / 전송 성공 수"""
+    from utils.run_history import get_store
+    return {"days": days, "sources": await asyncio.to_thread(get_store().source_acceptance, days)}
+
+@app.get("/analytics/stages")
+async def analytics_stages(days: int = 7):
+    """단계별 평균 / p95 지연 시간"""
+    from utils.run_history import get_store
+    return {"days": days, "stages": await asyncio.to_thread(get_store().stage_latency, days)}
+
+@app.get("/analytics/selenium")
+async def analytics_selenium(days: int = 7):
+    """Selenium 본문 개선 성공률"""
+    from utils.run_history import get_store
+    return {"days": days, **(await asyncio.to_thread(get_store().selenium_hit_rate, days))}
+
+@app.get("/analytics/rejections")
+async def analytics_rejections(days: int = 7):
+    """출처/사유별 거부 건수"""
+    from utils.run_history import get_store
+    return {"days": days, "rejections": await asyncio.to_thread(get_store().rejection_reasons, days)}
+
+@app.get("/analytics/runs")
+async def analytics_runs(limit: int = 20):
+    """최근 실행 목록"""
+    from utils.run_history import get_store
+    return {"runs": await asyncio.to_thread(get_store().recent_runs, limit)}
+
+@app.get("/analytics/runs/{run_id}/stages")
+async def analytics_run_stages(run_id: str):
+    """실행 하나의 단계별 벽시계 / CPU 시간"""
+    from utils.run_history import get_store
+    stages = await asyncio.to_thread(get_store().run_stages, run_id)
+    if not stages:
+        raise HTTPException(status_code=404, detail=f"단계 기록 없음: {run_id}")
+    return {"run_id": run_id, "stages": stages}
+
+def _check_admin_key(key):
+    """ADMIN_API_KEY 가 설정된 경우에만 X-Admin-Key 헤더 확인"""
+    from config import ADMIN_API_KEY
+    import hmac
+    if ADMIN_API_KEY and not hmac.compare_digest(key or "", ADMIN_API_KEY):
+        raise HTTPException(status_code=403, detail="관리자 키가 올바르지 않습니다")
+
+@app.get("/admin/settings")
+async def admin_settings(x_admin_key: str = Header(None)):
+    """현재 크롤링 튜닝 설정 (버전, 마지막 재로드 오류 포함)"""
+    _check_admin_key(x_admin_key)
+    from utils.crawl_settings import get_settings_manager
+    return get_settings_manager().describe()
+
+@app.post("/admin/settings/reload")
+async def reload_settings(x_admin_key: str = Header(None)):
+    """설정 파일/환경 변수 재로드 (검증 실패 시 400, 기존 설정 유지)"""
+    _check_admin_key(x_admin_key)
+    from utils.crawl_settings import get_settings_manager, SettingsError
+    manager = get_settings_manager()
+    try:
+        changed = await asyncio.to_thread(manager.reload)
+    except SettingsError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"message": "설정 재로드 완료", "version": manager.version, "changed": changed}
+
+@app.post("/admin/outbox/retry")
+async def retry_outbox(x_admin_key: str = Header(None)):
+    """실패(dead) 처리된 게시글을 다시 전송 대기열로"""
+    _check_admin_key(x_admin_key)
+    from utils.outbox import get_outbox, get_dispatcher
+    requeued = await asyncio.to_thread(get_outbox().retry_dead)
+    await asyncio.to_thread(get_dispatcher().wake)
+    return {"message": "재전송 대기열 등록", "requeued": requeued}
+
+def _profile_response(files: dict, output: str, headers: dict):
+    """프로파일 결과 파일을 요청한 형식으로 반환"""
+    from fastapi.responses import FileResponse
+    if output not in files:
+        raise HTTPException(status_code=400, detail=f"이 방식에서 지원하지 않는 형식: {output} (가능: {', '.join(files)})")
+    media_types = {"svg": "image/svg+xml", "pstats": "application/octet-stream"}
+    path = files[output]
+    return FileResponse(path, media_type=media_types.get(output, "text/plain; charset=utf-8"),
+                        filename=path.rsplit("/", 1)[-1], headers=headers)
+
+@app.post("/admin/profile/run")
+async def profile_run(plugin: str = "news", mode: str = "sampling", output: str = "json",
+                      x_admin_key: str = Header(None)):
+    """크롤링을 프로파일러 아래에서 1회 실행 (실제 게시 포함)
+
+    mode: sampling (접힌 스택 collapsed / 플레임 그래프 svg) 또는 cprofile (pstats / text)
+    output: json 이면 요약과 파일 경로, 그 외에는 해당 파일 자체
+    """
+    _check_admin_key(x_admin_key)
+    from utils.plugin_registry import resolve_plugin
+    from utils.profiler import profile_call, ProfileBusy
+    try:
+        target = resolve_plugin(plugin)
+    except PluginUnavailable as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    try:
+        # 새 이벤트 루프(별도 스레드)에서 실행 → 서버 루프를 막지 않음
+        # (샘플링은 모든 스레드를, 3.12 이상 cProfile 도 모든 스레드를 측정하므로 서버 요청/디스패처 스택도 섞임,
+        #  접힌 스택은 스레드 이름으로 시작하므로 실행 스레드만 골라 볼 수 있음)
+        summary = await asyncio.to_thread(profile_call, target, mode, label=plugin)
+    except ProfileBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    result = summary.pop("result")
+    run_id = result.get("run_id") if isinstance(result, dict) else None
+    if output != "json":
+        headers = {"X-Run-Id": run_id or "", "X-Profile-Samples": str(summary["samples"] or 0)}
+        return _profile_response(summary["files"], output, headers)
+    stages = []
+    if run_id:
+        from utils.run_history import get_store
+        stages = await asyncio.to_thread(get_store().run_stages, run_id)
+    return {"run_id": run_id, **summary, "stages": stages, "result": result}
+
+@app.get("/admin/profile/continuous")
+async def profile_continuous(minutes: int = None, output: str = "collapsed", x_admin_key: str = Header(None)):
+    """상시 프로파일링 최근 구간 (collapsed 또는 svg)"""
+    _check_admin_key(x_admin_key)
+    from fastapi.responses import Response
+    from utils.profiler import get_continuous_profiler, collapse, render_flamegraph
+    profiler = get_continuous_profiler()
+    if not profiler.running:
+        raise HTTPException(status_code=404, detail="상시 프로파일링이 꺼져 있습니다 (PROFILE_CONTINUOUS=true)")
+    collapsed = collapse(await asyncio.to_thread(profiler.snapshot, minutes))
+    if output == "svg":
+        title = f"continuous ({f'최근 {minutes}분' if minutes else '전체 구간'})"
+        return Response(render_flamegraph(collapsed, title=title), media_type="image/svg+xml")
+    if output != "collapsed":
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식: {output} (collapsed / svg)")
+    return Response(collapsed, media_type="text/plain; charset=utf-8")
+
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=9000, reload=True)
\ No newline at end of file
+    import uvicorn
+    uvicorn.run("main:app", host="0.0.0.0", port=9000, reload=True)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+파이프라인 공통 기사 레코드 (__slots__) 와 게시글 본문 템플릿
+
+- RSS 후보 → (본문 추출/AI 평가) → 중복 체크 → 전송까지 같은 레코드 하나가 이동
+  → 단계마다 딕셔너리를 복사하거나 키가 달라지는 일 없음, 인스턴스 딕셔너리가 없어 후보 수천 개도 가벼움
+- 게시글 본문은 레코드에 저장하지 않고 전송 시점에 템플릿으로 한 번만 조립 (content 속성)
+  → 중복/할당량으로 버려지는 후보는 본문 문자열을 만들지 않음
+- kind 로 템플릿 선택: feed (RSS 설명 그대로), evaluated (본문 추출 + AI 평가), filler (보충 기사)
+"""
+from typing import Dict, List, Optional
+
+# 본문이 이 길이(자) 이하이면 본문 대신 요약을 표시 (요약은 이런 기사만 요청)
+SUMMARY_BODY_THRESHOLD = 100
+
+
+class Article:
+    """기사 후보/게시글 레코드
+
+    title: 출처를 뗀 제목 (게시 제목, 중복 체크 기준), raw_title: RSS 원본 제목, guid: RSS 항목 식별자
+    source: 수집 소스 이름 (설정/실행 이력/전송 source), outlet: 본문에 표시할 언론사
+    """
+
+    __slots__ = (
+        "title", "raw_title", "url", "guid", "source", "outlet", "published_at", "description", "kind",
+        "body", "image_url", "evaluation", "category", "metrics", "_content"
+    )
+
+    def __init__(self, title: str, source: str, url: str = "", outlet: str = None, published_at: str = "",
+                 description: str = "", raw_title: str = None, kind: str = "feed", body: str = "",
+                 category: str = "", guid: str = ""):
+        self.title = title
+        self.raw_title = raw_title if raw_title is not None else title
+        self.url = url
+        self.guid = guid
+        self.source = source
+        self.outlet = outlet or source
+        self.published_at = published_at
+        self.description = description
+        self.kind = kind
+        self.body = body
+        self.image_url = ""
+        self.evaluation: Optional[Dict] = None
+        self.category = category
+        self.metrics: Optional[Dict] = None
+        self._content: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"Article({self.kind}, {self.source}, {self.title[:30]!r})"
+
+    @property
+    def content(self) -> str:
+        """게시글 본문 (처음 읽을 때 템플릿으로 조립)"""
+        if self._content is None:
+            self._content = render_content(self)
+        return self._content
+
+    def evaluated(self, body: str, image_url: str, evaluation: Dict, metrics: Dict) -> "Article":
+        """본문 추출/AI 평가 결과 반영 (evaluated 템플릿으로 전환)"""
+        self.kind = "evaluated"
+        self.body = body or ""
+        self.image_url = image_url or ""
+        self.evaluation = evaluation
+        self.metrics = metrics
+        self._content = None
+        return self
+
+
+def _body_section(article: Article) -> str:
+    """기사 내용 구역 (길이에 따라 전체 / 요약 / 요약기 요약 / 제목 기반 설명)"""
+    content, title, evaluation = article.body, article.title, article.evaluation or {}
+    length = len(content.strip())
+    if length > 200:
+        return f"📰 기사 내용:\n{content}\n\n"
+    if length > SUMMARY_BODY_THRESHOLD:
+        clean_content = content.replace(title, '').replace(article.outlet, '').strip()
+        if len(clean_content) > 50:
+            return f"📰 기사 요약: {clean_content}\n\n"
+        return f"📰 기사 내용: {content}\n\n"
+    summary = evaluation.get("summary")
+    if summary and len(summary) > 50:
+        return f"📰 기사 내용: {summary}\n\n"
+    return f"📰 기사 주제: {title}에 대한 우주 과학 소식입니다. 자세한 내용은 원문에서 확인하세요.\n\n"
+
+
+def _render_evaluated(article: Article) -> List[str]:
+    evaluation = article.evaluation or {}
+    parts = [f"{article.outlet}에서 보도한 우주 관련 최신 뉴스입니다.\n\n", _body_section(article)]
+    summary = evaluation.get("summary")
+    if summary and len(summary) > 30 and not article.body:
+        parts.append(f"🤖 AI 요약: {summary}\n\n")  # 보조적 역할
+    if article.image_url:
+        parts.append(f"🖼️ 관련 이미지: {article.image_url}\n\n")
+    if article.published_at:
+        parts.append(f"📅 발행일: {article.published_at}\n")
+    if evaluation.get("keywords"):
+        parts.append(f"🏷️ 핵심 키워드: {', '.join(evaluation['keywords'][:3])}\n")
+    parts.append(f"🔗 원문 링크: {article.url}\n🌌 출처: {article.outlet}")
+    return parts
+
+
+def _render_feed(article: Article) -> List[str]:
+    return [f"{article.outlet}에서 보도한 우주 과학 뉴스입니다.\n\n{article.description}\n\n🔗 원문: {article.url}"]
+
+
+def _render_filler(article: Article) -> List[str]:
+    return [f"{article.outlet}에서 보도한 우주 과학 뉴스입니다.\n\n{article.body}\n\n🏷️ 분류: {article.category}\n"
+            f"🔗 자세한 내용은 관련 우주 기관에서 확인하실 수 있습니다."]
+
+
+_TEMPLATES = {
+    "evaluated": _render_evaluated,
+    "feed": _render_feed,
+    "filler": _render_filler
+}
+
+
+def render_content(article: Article) -> str:
+    """kind 에 맞는 템플릿으로 게시글 본문 조립 (구역 목록을 한 번에 이어 붙임)"""
+    try:
+        template = _TEMPLATES[article.kind]
+    except KeyError:
+        raise ValueError(f"알 수 없는 기사 종류: {article.kind}") from None
+    return "".join(template(article))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+메모리 상한이 있는 기사 페이지 수집 (스트리밍 + 증분 파서)
+"""
+import codecs
+import logging
+import re
+from html.parser import HTMLParser
+from typing import Dict
+
+from utils.logger_setup import log_sampled
+from config import (
+    MAX_ARTICLE_BYTES, BOUNDED_FETCH_CHUNK_SIZE,
+    BOUNDED_FETCH_MAX_PARAGRAPHS, BOUNDED_FETCH_MIN_PARAGRAPHS
+)
+
+logger = logging.getLogger(__name__)
+
+_META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([A-Za-z0-9_\-]+)', re.IGNORECASE)
+
+
+class _ArticleBoundaryParser(HTMLParser):
+    """문단 수와 </article> 위치만 추적하는 가벼운 증분 파서"""
+
+    def __init__(self, min_paragraph_length: int = 30):
+        super().__init__(convert_charrefs=True)
+        self.min_paragraph_length = min_paragraph_length
+        self.paragraphs = 0
+        self.article_closed = False
+        self._in_paragraph = False
+        self._paragraph_length = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'p':
+            self._in_paragraph = True
+            self._paragraph_length = 0
+
+    def handle_endtag(self, tag):
+        if tag == 'p' and self._in_paragraph:
+            self._in_paragraph = False
+            if self._paragraph_length > self.min_paragraph_length:
+                self.paragraphs += 1
+        elif tag == 'article' and self.paragraphs >= BOUNDED_FETCH_MIN_PARAGRAPHS:
+            # 본문 문단을 충분히 본 뒤 닫히는 article 이후는 댓글/추천 기사 영역
+            self.article_closed = True
+
+    def handle_data(self, data):
+        if self._in_paragraph:
+            self._paragraph_length += len(data.strip())
+
+
+class BoundedHtmlReader:
+    """HTML 조각을 받아 상한/중단 조건에 도달하면 멈추는 수집기"""
+
+    def __init__(self, max_chars: int = MAX_ARTICLE_BYTES, max_paragraphs: int = BOUNDED_FETCH_MAX_PARAGRAPHS):
+        self.max_chars = max_chars
+        self.max_paragraphs = max_paragraphs
+        self.size = 0
+        self.stop_reason = ""
+        self._chunks = []
+        self._parser = _ArticleBoundaryParser()
+
+    def feed(self, text: str) -> bool:
+        """조각 추가 후 수집을 멈춰야 하면 True"""
+        remaining = self.max_chars - self.size
+        if len(text) > remaining:
+            text = text[:remaining]
+        self._chunks.append(text)
+        self.size += len(text)
+
+        try:
+            self._parser.feed(text)
+        except Exception as e:
+            # 깨진 마크업이면 경계 탐지만 포기하고 상한으로만 자름
+            logger.debug(f"증분 파서 오류 무시: {e}")
+
+        if self._parser.article_closed:
+            self.stop_reason = "article_end"
+        elif self._parser.paragraphs >= self.max_paragraphs:
+            self.stop_reason = "paragraphs"
+        elif self.size >= self.max_chars:
+            self.stop_reason = "max_bytes"
+        return bool(self.stop_reason)
+
+    @property
+    def paragraphs(self) -> int:
+        return self._parser.paragraphs
+
+    def html(self) -> str:
+        return ''.join(self._chunks)
+
+
+def _detect_encoding(resp, first_chunk: bytes) -> str:
+    """응답 헤더 -> meta charset -> utf-8 순으로 인코딩 결정"""
+    if 'charset=' in resp.headers.get('Content-Type', '').lower():
+        return resp.encoding
+    match = _META_CHARSET.search(first_chunk[:4096])
+    if match:
+        encoding = match.group(1).decode('ascii', errors='ignore')
+        try:
+            codecs.lookup(encoding)
+            return encoding
+        except LookupError:
+            pass
+    return 'utf-8'
+
+
+def fetch_bounded_html(url: str, headers: Dict = None, timeout: int = 15,
+                       max_bytes: int = MAX_ARTICLE_BYTES) -> Dict:
+    """본문을 스트리밍으로 받아 상한/중단 조건까지만 읽은 HTML 반환"""
+    from utils.http_client import get_session
+    from utils.politeness import get_scheduler
+
+    scheduler = get_scheduler()
+    with scheduler.slot(url):
+        resp = get_session().get(url, headers=headers, timeout=timeout, stream=True)
+    scheduler.record_response(url, resp.status_code, resp.headers)
+    try:
+        reader = BoundedHtmlReader(max_chars=max_bytes)
+        decoder = None
+        bytes_read = 0
+
+        for chunk in resp.iter_content(chunk_size=BOUNDED_FETCH_CHUNK_SIZE):
+            if not chunk:
+                continue
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(_detect_encoding(resp, chunk))(errors='replace')
+            chunk = chunk[:max_bytes - bytes_read]
+            bytes_read += len(chunk)
+            if reader.feed(decoder.decode(chunk)) or bytes_read >= max_bytes:
+                break
+
+        if reader.stop_reason:
+            log_sampled(logger, logging.DEBUG, "bounded_stop",
+                        f"부분 수집 종료 ({reader.stop_reason}): {bytes_read}바이트, 문단 {reader.paragraphs}개")
+
+        return {
+            "html": reader.html(),
+            "url": resp.url,
+            "status": resp.status_code,
+            "bytes": bytes_read,
+            "truncated": bool(reader.stop_reason) or bytes_read >= max_bytes
+        }
+    finally:
+        # 남은 본문은 읽지 않고 연결 종료
+        resp.close()
+
+
+def bound_html(html: str, max_chars: int = MAX_ARTICLE_BYTES) -> str:
+    """이미 받은 HTML(예: Selenium page_source)을 같은 조건으로 잘라냄"""
+    if not html:
+        return ""
+    reader = BoundedHtmlReader(max_chars=max_chars)
+    step = BOUNDED_FETCH_CHUNK_SIZE
+    for start in range(0, len(html), step):
+        if reader.feed(html[start:start + step]):
+            break
+    return reader.html()
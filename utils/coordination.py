@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+다중 인스턴스 조정 (공유 SQLite: 노드 하트비트 + 작업 리스 + 일관된 해싱 분할 + 게시 선점)
+
+- 노드: 하트비트를 주기적으로 기록, NODE_TTL 동안 소식이 없으면 이탈로 간주
+- 리스: 예약 작업(뉴스 크롤링 등)은 회차마다 리스를 얻은 노드 한 곳만 실행, 하트비트 스레드가 실행 중 갱신
+  → 끝난 회차는 리스를 남겨 다른 노드가 다시 실행하지 않음, 노드가 죽으면 TTL 후 다음 회차부터 다른 노드가 실행
+  → 소유자가 바뀔 때마다 펜싱 토큰 증가
+- 분할: 살아 있는 노드로 해시 링을 만들어 소스/도메인마다 담당 노드 하나 (노드 증감 시 일부만 이동)
+- 게시 선점: 아웃박스 멱등 키를 공유 저장소에 먼저 선점한 노드만 전송 (선점한 노드가 죽고 전송 전이면 다른 노드가 인수)
+  → 인수할 때마다 선점 토큰 증가, 전송 직전에 선점 토큰/회차 리스 토큰이 아직 유효한지 다시 확인
+  → 노드별 로컬 캐시 대신 최근 선점 제목을 중복 체크에 함께 사용
+- 공유 상태: 노드가 함께 쓰는 작은 JSON 상태 (피드 요청 예산/갱신 주기 등)를 쓰기 잠금 안에서 읽고 고침
+
+COORDINATION_ENABLED=false(기본)이면 단일 노드로 동작 (DB 를 만들지 않고 항상 소유/선점 성공).
+공유 볼륨(NFS 등)에서는 WAL 을 쓸 수 없으므로 롤백 저널 모드 사용.
+"""
+import bisect
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from config import (
+    COORDINATION_ENABLED, COORDINATION_DB, NODE_ID, NODE_HEARTBEAT_INTERVAL, NODE_TTL, JOB_LEASE_TTL,
+    HASH_RING_VNODES, SHARED_CLAIM_RETENTION_DAYS
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    node_id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    heartbeat_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    token INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS claims (
+    claim_key TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    claimed_at REAL NOT NULL,
+    delivered_at REAL,
+    token INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_claims_claimed ON claims(claimed_at);
+CREATE TABLE IF NOT EXISTS shared_state (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+_run_lease = contextvars.ContextVar("run_lease", default=None)
+
+
+def default_node_id() -> str:
+    return NODE_ID or f"{socket.gethostname()}-{os.getpid()}"
+
+
+def _ring_hash(value: str) -> int:
+    return int.from_bytes(hashlib.md5(value.encode('utf-8')).digest()[:8], 'big')
+
+
+class HashRing:
+    """일관된 해싱 링 (노드당 가상 노드 vnodes 개)"""
+
+    def __init__(self, nodes: List[str], vnodes: int = HASH_RING_VNODES):
+        points = sorted((_ring_hash(f"{node}#{i}"), node) for node in nodes for i in range(vnodes))
+        self._hashes = [point for point, _ in points]
+        self._nodes = [node for _, node in points]
+
+    def owner(self, key: str) -> Optional[str]:
+        if not self._nodes:
+            return None
+        position = bisect.bisect(self._hashes, _ring_hash(key)) % len(self._hashes)
+        return self._nodes[position]
+
+
+class Coordinator:
+    """공유 저장소 기반 노드 간 조정"""
+
+    def __init__(self, path: str = COORDINATION_DB, node_id: str = None, enabled: bool = COORDINATION_ENABLED,
+                 lease_ttl: float = JOB_LEASE_TTL, node_ttl: float = NODE_TTL,
+                 heartbeat_interval: float = NODE_HEARTBEAT_INTERVAL):
+        self.path = path
+        self.node_id = node_id or default_node_id()
+        self.enabled = enabled
+        self.lease_ttl = lease_ttl
+        self.node_ttl = node_ttl
+        self.heartbeat_interval = heartbeat_interval
+        self._held: Dict[str, int] = {}  # 이 노드가 가진 리스 → 펜싱 토큰
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        if not enabled:
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.executescript(_SCHEMA)
+            # 이전 버전 DB: 선점 토큰 열 추가
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(claims)")}
+            if "token" not in columns:
+                conn.execute("ALTER TABLE claims ADD COLUMN token INTEGER NOT NULL DEFAULT 0")
+                conn.commit()
+        finally:
+            conn.close()
+        self.heartbeat()
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (조회 후 갱신 사이에 다른 노드가 끼어들지 않도록)"""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+    # ---- 노드 ----
+
+    def heartbeat(self):
+        """하트비트 기록 + 가진 리스 갱신 (갱신에 실패한 리스는 잃은 것으로 처리)"""
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO nodes (node_id, host, started_at, heartbeat_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(node_id) DO UPDATE SET heartbeat_at = excluded.heartbeat_at",
+                (self.node_id, socket.gethostname(), now, now)
+            )
+            # 오래 소식 없는 노드와 지난 회차 리스 정리
+            conn.execute("DELETE FROM nodes WHERE heartbeat_at < ?", (now - self.node_ttl * 10,))
+            conn.execute("DELETE FROM leases WHERE expires_at < ?", (now - 86400,))
+        with self._lock:
+            held = dict(self._held)
+        for name, token in held.items():
+            if not self.renew(name):
+                logger.warning(f"리스 갱신 실패 (다른 노드로 넘어감): {name} (토큰 {token})")
+
+    def live_nodes(self) -> List[str]:
+        if not self.enabled:
+            return [self.node_id]
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT node_id FROM nodes WHERE heartbeat_at >= ? ORDER BY node_id",
+                                (time.time() - self.node_ttl,)).fetchall()
+        nodes = [row["node_id"] for row in rows]
+        return nodes if self.node_id in nodes else sorted(nodes + [self.node_id])
+
+    def start(self):
+        if not self.enabled or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="coordination-heartbeat", daemon=True)
+        self._thread.start()
+        logger.info(f"다중 인스턴스 조정 시작: 노드 {self.node_id} ({self.path})")
+
+    def stop(self, timeout: float = 10):
+        """하트비트 중지 + 리스 반납 + 노드 등록 해제 (다른 노드가 TTL 을 기다리지 않고 바로 인수)"""
+        if not self.enabled:
+            return
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        for name in list(self._held):
+            self.release(name)
+        try:
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM nodes WHERE node_id = ?", (self.node_id,))
+        except sqlite3.Error as e:
+            logger.error(f"노드 등록 해제 실패: {e}")
+
+    def _loop(self):
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                self.heartbeat()
+            except sqlite3.Error as e:
+                logger.error(f"하트비트 기록 실패: {e}")
+
+    # ---- 리스 ----
+
+    def acquire(self, name: str, ttl: float = None) -> Optional[int]:
+        """리스 획득 (비어 있거나 만료되었거나 이미 가진 경우) - 펜싱 토큰, 실패 시 None"""
+        if not self.enabled:
+            return 0
+        now = time.time()
+        expires_at = now + (ttl or self.lease_ttl)
+        with self._transaction() as conn:
+            row = conn.execute("SELECT owner, token, expires_at FROM leases WHERE name = ?", (name,)).fetchone()
+            # 다른 노드가 가졌거나, 이 노드가 이미 끝낸 회차(유지 중인 리스)면 실패
+            if row is not None and row["expires_at"] > now and (row["owner"] != self.node_id or name not in self._held):
+                return None
+            if row is not None and name in self._held:
+                token = row["token"]  # 이미 가진 리스 연장
+            else:
+                token = (row["token"] if row is not None else 0) + 1
+            conn.execute(
+                "INSERT INTO leases (name, owner, token, expires_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, token = excluded.token, "
+                "expires_at = excluded.expires_at",
+                (name, self.node_id, token, expires_at)
+            )
+        with self._lock:
+            self._held[name] = token
+        return token
+
+    def renew(self, name: str) -> bool:
+        if not self.enabled:
+            return True
+        with self._lock:
+            token = self._held.get(name)
+        if token is None:
+            return False
+        with self._transaction() as conn:
+            renewed = conn.execute(
+                "UPDATE leases SET expires_at = ? WHERE name = ? AND owner = ? AND token = ?",
+                (time.time() + self.lease_ttl, name, self.node_id, token)
+            ).rowcount
+        if not renewed:
+            with self._lock:
+                self._held.pop(name, None)
+        return bool(renewed)
+
+    def release(self, name: str):
+        if not self.enabled:
+            return
+        with self._lock:
+            token = self._held.pop(name, None)
+        if token is None:
+            return
+        try:
+            with self._transaction() as conn:
+                conn.execute("UPDATE leases SET expires_at = 0 WHERE name = ? AND owner = ? AND token = ?",
+                             (name, self.node_id, token))
+        except sqlite3.Error as e:
+            logger.error(f"리스 반납 실패 ({name}): {e}")
+
+    def complete(self, name: str, keep: float):
+        """회차 작업 완료: 같은 회차를 다른 노드가 다시 실행하지 않도록 keep 초 동안 리스 유지"""
+        if not self.enabled:
+            return
+        with self._lock:
+            token = self._held.pop(name, None)
+        if token is None:
+            return
+        with self._transaction() as conn:
+            conn.execute("UPDATE leases SET expires_at = ? WHERE name = ? AND owner = ? AND token = ?",
+                         (time.time() + keep, name, self.node_id, token))
+
+    def holds(self, name: str) -> bool:
+        return not self.enabled or name in self._held
+
+    def lease_current(self, name: str, token: int) -> bool:
+        """회차 리스가 아직 token 세대인지 (다른 노드가 만료된 리스를 가져가 다시 실행했으면 False)"""
+        if not self.enabled:
+            return True
+        with self._transaction() as conn:
+            row = conn.execute("SELECT owner, token FROM leases WHERE name = ?", (name,)).fetchone()
+        # 정리된 리스는 그 뒤로 가져간 노드가 없다는 뜻
+        return row is None or (row["owner"] == self.node_id and row["token"] == token)
+
+    @contextmanager
+    def lease(self, name: str):
+        """리스를 가진 동안만 실행 - 펜싱 토큰(얻지 못하면 None)을 넘기고 끝나면 반납"""
+        token = self.acquire(name)
+        try:
+            yield token
+        finally:
+            if token is not None:
+                self.release(name)
+
+    # ---- 분할 ----
+
+    def owns(self, key: str, nodes: List[str] = None) -> bool:
+        """해시 링에서 key 의 담당 노드가 이 노드인지"""
+        if not self.enabled:
+            return True
+        return HashRing(nodes or self.live_nodes()).owner(key) == self.node_id
+
+    def partition(self, items: List, key: Callable) -> List:
+        """이 노드가 담당하는 항목만 (살아 있는 노드 목록은 한 번만 조회)"""
+        if not self.enabled:
+            return list(items)
+        ring = HashRing(self.live_nodes())
+        return [item for item in items if ring.owner(key(item)) == self.node_id]
+
+    # ---- 게시 선점 ----
+
+    def claim(self, claim_key: str, title: str) -> Optional[int]:
+        """게시 선점 (처음이거나, 선점한 노드가 죽었고 아직 전송 전이면 인수) - 선점 토큰, 실패 시 None"""
+        if not self.enabled:
+            return 0
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT node_id, delivered_at, token FROM claims WHERE claim_key = ?",
+                               (claim_key,)).fetchone()
+            # 이 노드가 이미 선점한 게시글은 같은 토큰 유지 (대기 중인 아웃박스 행이 무효가 되지 않도록)
+            token = row["token"] if row is not None and row["node_id"] == self.node_id else (
+                (row["token"] if row is not None else 0) + 1)
+            if row is not None and row["node_id"] != self.node_id:
+                if row["delivered_at"] is not None:
+                    return None
+                alive = conn.execute("SELECT 1 FROM nodes WHERE node_id = ? AND heartbeat_at >= ?",
+                                     (row["node_id"], now - self.node_ttl)).fetchone()
+                if alive:
+                    return None
+                logger.info(f"이탈한 노드의 게시 선점 인수: {title[:30]}... ({row['node_id']} → {self.node_id})")
+            conn.execute(
+                "INSERT INTO claims (claim_key, title, node_id, claimed_at, token) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(claim_key) DO UPDATE SET node_id = excluded.node_id, claimed_at = excluded.claimed_at, "
+                "token = excluded.token",
+                (claim_key, title, self.node_id, now, token)
+            )
+            conn.execute("DELETE FROM claims WHERE claimed_at < ?", (now - SHARED_CLAIM_RETENTION_DAYS * 86400,))
+        return token
+
+    def claim_current(self, claim_key: str, token: int) -> bool:
+        """전송 직전 확인: 아직 이 노드가 token 세대로 선점 중이고 전송 전인지"""
+        if not self.enabled:
+            return True
+        with self._transaction() as conn:
+            row = conn.execute("SELECT node_id, delivered_at, token FROM claims WHERE claim_key = ?",
+                               (claim_key,)).fetchone()
+        return (row is not None and row["node_id"] == self.node_id and row["delivered_at"] is None
+                and row["token"] == token)
+
+    def mark_delivered(self, claim_key: str, token: int) -> bool:
+        """전송 완료 기록 (다른 노드가 인수한 뒤의 이전 토큰 기록은 거부, 반환: 기록 여부)"""
+        if not self.enabled:
+            return True
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE claims SET delivered_at = ? WHERE claim_key = ? AND node_id = ? AND token = ? "
+                "AND delivered_at IS NULL", (time.time(), claim_key, self.node_id, token)
+            ).rowcount
+        return bool(updated)
+
+    # ---- 공유 상태 ----
+
+    @contextmanager
+    def shared_state(self, name: str):
+        """공유 JSON 상태를 쓰기 잠금 안에서 고침 (없으면 빈 딕셔너리, 블록이 정상 종료하면 저장)"""
+        with self._transaction() as conn:
+            row = conn.execute("SELECT value FROM shared_state WHERE name = ?", (name,)).fetchone()
+            state = json.loads(row["value"]) if row else {}
+            yield state
+            conn.execute(
+                "INSERT INTO shared_state (name, value, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                (name, json.dumps(state, ensure_ascii=False), time.time())
+            )
+
+    def read_shared_state(self, name: str) -> Dict:
+        with self._transaction() as conn:
+            row = conn.execute("SELECT value FROM shared_state WHERE name = ?", (name,)).fetchone()
+        return json.loads(row["value"]) if row else {}
+
+    def recent_titles(self, minutes: int) -> Set[str]:
+        """모든 노드에서 최근 선점/전송한 제목 (노드별 로컬 캐시 보완)"""
+        if not self.enabled:
+            return set()
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT title FROM claims WHERE claimed_at >= ?",
+                                (time.time() - minutes * 60,)).fetchall()
+        return {row["title"] for row in rows}
+
+    def stats(self) -> Dict:
+        if not self.enabled:
+            return {"enabled": False, "node_id": self.node_id}
+        with self._transaction() as conn:
+            leases = conn.execute("SELECT name, owner, token, expires_at FROM leases WHERE expires_at > ?",
+                                  (time.time(),)).fetchall()
+        return {
+            "enabled": True,
+            "node_id": self.node_id,
+            "live_nodes": self.live_nodes(),
+            "held_leases": sorted(self._held),
+            "leases": [dict(row) for row in leases]
+        }
+
+
+@contextmanager
+def run_lease(name: str, token: int):
+    """예약 실행 안에서 회차 리스 (이름, 펜싱 토큰)를 현재 컨텍스트에 등록 (아웃박스가 게시글과 함께 저장)"""
+    reset = _run_lease.set((name, token))
+    try:
+        yield
+    finally:
+        _run_lease.reset(reset)
+
+
+def current_run_lease() -> Optional[Tuple[str, int]]:
+    return _run_lease.get()
+
+
+_coordinator = None
+_coordinator_lock = threading.Lock()
+
+
+def get_coordinator() -> Coordinator:
+    global _coordinator
+    if _coordinator is None:
+        with _coordinator_lock:
+            if _coordinator is None:
+                _coordinator = Coordinator()
+    return _coordinator
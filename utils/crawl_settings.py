@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+크롤링 튜닝 설정 (타입 검증 + 무중단 재로드 + 소스별 덮어쓰기)
+
+우선순위: 기본값 < 설정 파일(CRAWL_SETTINGS_FILE, JSON) < 환경 변수(CRAWL_<필드명 대문자>)
+
+설정 파일 예:
+    {
+        "feed_item_limit": 15,
+        "duplicate_similarity": 0.9,
+        "extra_exclude_keywords": ["코인"],
+        "sources": {
+            "연합뉴스": {"feed_timeout": 5, "feed_max_articles": 1},
+            "IT조선": {"enabled": false}
+        }
+    }
+
+재로드는 전체를 다시 읽고 검증에 성공했을 때만 교체하며, 실패하면 기존 설정을 유지.
+호출하는 쪽은 작업 시작 시 get_settings() 를 한 번 받아 끝까지 사용 (작업 중간에 값이 바뀌지 않음).
+"""
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field, fields, replace, asdict
+from typing import Dict, List, Tuple, get_type_hints
+
+from config import CRAWL_SETTINGS_FILE, NEWS_ARTICLE_QUOTA, MAX_ARTICLES_PER_SOURCE
+
+logger = logging.getLogger(__name__)
+
+ENV_PREFIX = "CRAWL_"
+
+
+class SettingsError(ValueError):
+    """설정 값 검증 실패"""
+
+
+def _range(low=None, high=None) -> Dict:
+    return {"min": low, "max": high}
+
+
+@dataclass(frozen=True)
+class CrawlSettings:
+    # 소스 사용 여부 (소스별 덮어쓰기로 특정 피드만 끌 때 사용)
+    enabled: bool = True
+
+    # 수집량
+    article_quota: int = field(default=NEWS_ARTICLE_QUOTA, metadata=_range(1, 50))
+    feed_item_limit: int = field(default=10, metadata=_range(1, 100))  # 피드당 확인할 항목 수
+    google_max_articles: int = field(default=MAX_ARTICLES_PER_SOURCE, metadata=_range(1, 50))
+    feed_max_articles: int = field(default=2, metadata=_range(1, 50))  # 대체 RSS 소스당 최대 기사 수
+    recent_days: int = field(default=7, metadata=_range(1, 365))
+
+    # 중복 판단
+    similar_title_ratio: float = field(default=0.5, metadata=_range(0.0, 1.0))  # 수집 중 유사 제목 키워드 겹침
+    # 소스 간 같은 사건 묶음 (제목 2-gram Jaccard) - 낮으면 "9차 실패"/"10차 성공" 같은 다른 사건도 묶임
+    story_similarity: float = field(default=0.7, metadata=_range(0.0, 1.0))
+    duplicate_similarity: float = field(default=0.85, metadata=_range(0.0, 1.0))  # 게시 전 제목 유사도
+    duplicate_keyword_overlap: float = field(default=0.7, metadata=_range(0.0, 1.0))
+    duplicate_lookup_days: int = field(default=7, metadata=_range(1, 90))  # DB 조회 기간
+    local_cache_minutes: int = field(default=30, metadata=_range(0, 7 * 24 * 60))
+    semantic_dedup: bool = False  # 해시 n-gram 임베딩 기반 유사 제목 탐지 (utils/semantic_dedup.py)
+    semantic_similarity: float = field(default=0.65, metadata=_range(0.0, 1.0))  # 코사인 유사도 기준
+
+    # 타임아웃 (초)
+    feed_timeout: float = field(default=15, metadata=_range(1, 120))
+    article_timeout: float = field(default=15, metadata=_range(1, 120))
+
+    # 본문 추출
+    selenium_enabled: bool = True
+    selenium_min_content: int = field(default=500, metadata=_range(0, 10000))
+    extra_article_selectors: Tuple[str, ...] = ()  # 내장 셀렉터보다 먼저 시도
+    extra_rendered_selectors: Tuple[str, ...] = ()
+
+    # AI 평가 키워드 (내장 목록에 추가)
+    extra_space_keywords: Tuple[str, ...] = ()
+    extra_exclude_keywords: Tuple[str, ...] = ()
+
+    # 소스 이름(실행 이력의 source 와 동일) → 덮어쓸 값
+    source_overrides: Dict[str, Dict] = field(default_factory=dict, compare=False)
+
+    def for_source(self, source: str) -> "CrawlSettings":
+        """소스별 덮어쓰기를 적용한 설정 (없으면 자기 자신)"""
+        overrides = self.source_overrides.get(source)
+        return replace(self, **overrides) if overrides else self
+
+    def as_dict(self) -> Dict:
+        values = asdict(self)
+        for key, value in values.items():
+            if isinstance(value, tuple):
+                values[key] = list(value)
+        return values
+
+
+_TYPES = get_type_hints(CrawlSettings)
+_FIELDS = {f.name: f for f in fields(CrawlSettings) if f.name != "source_overrides"}
+
+
+def _coerce(name: str, value):
+    """JSON 값 또는 환경 변수 문자열을 필드 타입으로 변환 후 범위 검사"""
+    expected = _TYPES[name]
+    try:
+        if expected is bool:
+            if isinstance(value, str):
+                lowered = value.strip().lower()
+                if lowered not in ("true", "false", "1", "0", "yes", "no"):
+                    raise ValueError(value)
+                value = lowered in ("true", "1", "yes")
+            elif not isinstance(value, bool):
+                raise ValueError(value)
+        elif expected in (int, float):
+            if isinstance(value, bool) or (expected is int and isinstance(value, float) and not value.is_integer()):
+                raise ValueError(value)
+            value = expected(value)
+        else:  # Tuple[str, ...]
+            if isinstance(value, str):
+                value = [item for item in (part.strip() for part in value.split(",")) if item]
+            if not isinstance(value, (list, tuple)) or not all(isinstance(item, str) for item in value):
+                raise ValueError(value)
+            value = tuple(value)
+    except (TypeError, ValueError):
+        raise SettingsError(f"{name}: {expected.__name__ if hasattr(expected, '__name__') else expected} "
+                            f"형식이 아님 ({value!r})")
+
+    bounds = _FIELDS[name].metadata
+    if bounds.get("min") is not None and value < bounds["min"]:
+        raise SettingsError(f"{name}: {bounds['min']} 이상이어야 함 ({value})")
+    if bounds.get("max") is not None and value > bounds["max"]:
+        raise SettingsError(f"{name}: {bounds['max']} 이하여야 함 ({value})")
+    return value
+
+
+def _coerce_all(values: Dict, where: str, errors: List[str]) -> Dict:
+    result = {}
+    for name, value in values.items():
+        if name not in _FIELDS:
+            errors.append(f"{where}: 알 수 없는 설정 {name}")
+            continue
+        try:
+            result[name] = _coerce(name, value)
+        except SettingsError as e:
+            errors.append(f"{where}: {e}")
+    return result
+
+
+def load_settings(path: str = CRAWL_SETTINGS_FILE, environ: Dict = None) -> CrawlSettings:
+    """파일 + 환경 변수에서 설정 생성 (문제가 있으면 모든 오류를 모아 SettingsError)"""
+    environ = os.environ if environ is None else environ
+    errors = []
+    file_values, raw_sources = {}, {}
+
+    if path and os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                file_values = json.load(f)
+        except (OSError, ValueError) as e:
+            raise SettingsError(f"설정 파일을 읽을 수 없음 ({path}): {e}")
+        if not isinstance(file_values, dict):
+            raise SettingsError(f"설정 파일 최상위는 객체여야 함 ({path})")
+        raw_sources = file_values.pop("sources", {}) or {}
+        if not isinstance(raw_sources, dict):
+            errors.append("sources: 소스 이름 → 설정 객체여야 함")
+            raw_sources = {}
+
+    values = _coerce_all(file_values, "파일", errors)
+    env_values = {
+        key[len(ENV_PREFIX):].lower(): value
+        for key, value in environ.items()
+        if key.startswith(ENV_PREFIX) and key[len(ENV_PREFIX):].lower() in _FIELDS
+    }
+    values.update(_coerce_all(env_values, "환경 변수", errors))
+
+    source_overrides = {}
+    for source, overrides in raw_sources.items():
+        if not isinstance(overrides, dict):
+            errors.append(f"sources.{source}: 설정 객체여야 함")
+            continue
+        source_overrides[source] = _coerce_all(overrides, f"sources.{source}", errors)
+
+    if errors:
+        raise SettingsError("; ".join(errors))
+    return CrawlSettings(source_overrides=source_overrides, **values)
+
+
+class SettingsManager:
+    """현재 설정을 보관하고 검증된 재로드만 반영"""
+
+    def __init__(self, path: str = CRAWL_SETTINGS_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.version = 0
+        self.loaded_at = None
+        self.last_error = None
+        try:
+            self._settings = self._swap(load_settings(self.path))
+        except SettingsError as e:
+            # 기동은 막지 않음 (기본값으로 시작하고 오류는 /admin/settings 에 노출)
+            logger.error(f"크롤링 설정 로드 실패, 기본값 사용: {e}")
+            self.last_error = str(e)
+            self._settings = self._swap(CrawlSettings())
+
+    def _swap(self, settings: CrawlSettings) -> CrawlSettings:
+        self.version += 1
+        self.loaded_at = time.time()
+        return settings
+
+    @property
+    def current(self) -> CrawlSettings:
+        return self._settings
+
+    def reload(self) -> Dict:
+        """설정 재로드 (검증 실패 시 SettingsError, 기존 설정 유지) - 바뀐 항목 반환"""
+        with self._lock:
+            try:
+                new_settings = load_settings(self.path)
+            except SettingsError as e:
+                self.last_error = str(e)
+                logger.warning(f"크롤링 설정 재로드 거부: {e}")
+                raise
+            old_values, new_values = self._settings.as_dict(), new_settings.as_dict()
+            changed = {
+                key: {"old": old_values[key], "new": new_values[key]}
+                for key in new_values if old_values[key] != new_values[key]
+            }
+            self._settings = self._swap(new_settings)
+            self.last_error = None
+        logger.info(f"크롤링 설정 재로드 (v{self.version}): 변경 {list(changed) or '없음'}")
+        return changed
+
+    def describe(self) -> Dict:
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "file": self.path,
+            "last_error": self.last_error,
+            "settings": self._settings.as_dict()
+        }
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_settings_manager() -> SettingsManager:
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = SettingsManager()
+    return _manager
+
+
+def get_settings(source: str = None) -> CrawlSettings:
+    """현재 설정 (source 를 주면 소스별 덮어쓰기 적용)"""
+    settings = get_settings_manager().current
+    return settings.for_source(source) if source else settings
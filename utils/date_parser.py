@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+발행일 파싱 (RFC 822 / ISO 8601 빠른 경로 + dateutil 대체)
+
+- RSS pubDate(RFC 822)는 email.utils, ISO 8601은 datetime.fromisoformat 으로 먼저 처리
+- 두 형식이 아닐 때만 dateutil 사용
+- 결과는 항상 UTC aware datetime (시간대가 없으면 FEED_DEFAULT_UTC_OFFSET 기준)
+- 같은 문자열은 LRU 캐시로 재사용, 형식별/실패 건수 집계
+"""
+import logging
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Optional
+
+from config import DATE_PARSE_CACHE_SIZE, FEED_DEFAULT_UTC_OFFSET_HOURS
+from utils.logger_setup import log_sampled
+
+logger = logging.getLogger(__name__)
+
+FEED_DEFAULT_TZ = timezone(timedelta(hours=FEED_DEFAULT_UTC_OFFSET_HOURS))
+
+# dateutil 이 모르는 약어 시간대 (국내 매체는 KST 표기가 많음)
+_TZINFOS = {"KST": FEED_DEFAULT_TZ, "UTC": timezone.utc, "GMT": timezone.utc, "Z": timezone.utc}
+
+# "Mon, 06 Jan 2025 07:00:00 GMT" 형태만 빠른 경로로 처리 (그 외 자연어 날짜는 dateutil)
+_RFC822_PATTERN = re.compile(r'^(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}\s+\d{1,2}:\d{2}')
+
+_stats = {"rfc822": 0, "iso8601": 0, "dateutil": 0, "unparseable": 0, "empty": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(kind: str):
+    with _stats_lock:
+        _stats[kind] += 1
+
+
+def to_utc(value: datetime) -> datetime:
+    """시간대 없는 값은 기본 시간대로 간주하고 UTC 로 변환"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=FEED_DEFAULT_TZ)
+    return value.astimezone(timezone.utc)
+
+
+def _looks_like_iso(value: str) -> bool:
+    return len(value) >= 10 and value[:4].isdigit() and value[4] == '-' and value[7] == '-'
+
+
+def _parse_rfc822(value: str) -> Optional[datetime]:
+    parsed = parsedate_to_datetime(value)
+    if parsed.tzinfo is None and value.endswith("-0000"):
+        # RFC 2822: -0000 은 "UTC, 현지 시간대 미상"
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+def _parse(value: str) -> Optional[datetime]:
+    if _looks_like_iso(value):
+        try:
+            parsed = datetime.fromisoformat(value)
+            _count("iso8601")
+            return to_utc(parsed)
+        except ValueError:
+            pass
+    elif _RFC822_PATTERN.match(value):
+        try:
+            parsed = _parse_rfc822(value)
+            _count("rfc822")
+            return to_utc(parsed)
+        except (TypeError, ValueError, IndexError):
+            pass
+
+    try:
+        from dateutil import parser
+        parsed = parser.parse(value, tzinfos=_TZINFOS)
+        _count("dateutil")
+        return to_utc(parsed)
+    except (ValueError, OverflowError, TypeError) as e:
+        _count("unparseable")
+        log_sampled(logger, logging.WARNING, "unparseable_date", f"발행일 파싱 실패: {value[:40]!r} ({e})")
+        return None
+
+
+def parse_pub_date(value: str) -> Optional[datetime]:
+    """발행일 문자열을 UTC datetime 으로 변환 (비어 있거나 해석할 수 없으면 None)"""
+    value = (value or "").strip()
+    if not value:
+        _count("empty")
+        return None
+    return _parse(value)
+
+
+def get_date_parse_stats() -> Dict:
+    """형식별 파싱 건수, 실패 건수, 캐시 적중률"""
+    info = _parse.cache_info()
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = info.hits + info.misses
+    stats["cache"] = {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "hit_rate": round(info.hits / lookups, 3) if lookups else 0.0
+    }
+    return stats
@@ -4,24 +4,27 @@ DB 기반 중복 게시글 체크 시스템
 """
 import logging
 import requests
-from typing import List, Dict
+from typing import List, Tuple
 from config import SPRING_SERVER_URL, API_KEY
+from utils.article import Article
+from utils.crawl_settings import get_settings
+from utils.text_normalizer import normalize_title, extract_words
 
 logger = logging.getLogger(__name__)
 
-def check_existing_posts(titles: List[str]) -> List[str]:
-    """스프링 서버 DB에서 기존 게시글 제목 확인"""
+def check_existing_posts(titles: List[str], category: str = 'NEWS') -> List[str]:
+    """스프링 서버 DB에서 기존 게시글 제목 확인 (category: NEWS / EVENT)"""
     try:
         headers = {
             'Content-Type': 'application/json',
             'X-API-KEY': API_KEY
         }
         
-        # 최근 7일간 뉴스 게시글 제목 조회
+        # 최근 N일간 해당 분류 게시글 제목 조회
         response = requests.get(
             f"{SPRING_SERVER_URL}/api/admin/crawler/check-duplicates",
             headers=headers,
-            params={'days': 7, 'category': 'NEWS'},
+            params={'days': get_settings().duplicate_lookup_days, 'category': category},
             timeout=10
         )
         
@@ -37,17 +40,23 @@ def check_existing_posts(titles: List[str]) -> List[str]:
         logger.error(f"DB 중복 체크 실패: {e}")
         return []
 
-def is_duplicate_title(new_title: str, existing_titles: List[str]) -> bool:
-    """제목 중복 여부 확인 (유사도 포함)"""
+def is_duplicate_title(new_title: str, existing_titles: List[str], existing_keys: set = None) -> bool:
+    """제목 중복 여부 확인 (유사도 포함)
+
+    existing_keys: existing_titles 의 정규화 제목 집합 (여러 제목을 확인할 때 한 번만 만들어 전달)
+    """
     try:
-        # 정확한 일치 확인
-        if new_title in existing_titles:
+        settings = get_settings()
+        # 정확한 일치 확인 (정규화된 제목 기준, 집합 조회)
+        if existing_keys is None:
+            existing_keys = {normalize_title(t) for t in existing_titles}
+        if normalize_title(new_title) in existing_keys:
             return True
         
-        # 유사도 확인 (85% 이상 유사하면 중복으로 판단) - 조건 완화
+        # 유사도 확인 (duplicate_similarity 설정보다 유사하면 중복으로 판단)
         for existing_title in existing_titles:
             similarity = calculate_similarity(new_title, existing_title)
-            if similarity > 0.85:
+            if similarity > settings.duplicate_similarity:
                 logger.info(f"유사 제목 발견: '{new_title}' vs '{existing_title}' (유사도: {similarity:.2f})")
                 return True
         
@@ -56,7 +65,7 @@ def is_duplicate_title(new_title: str, existing_titles: List[str]) -> bool:
         for existing_title in existing_titles:
             existing_keywords = extract_key_words(existing_title)
             common_keywords = new_keywords & existing_keywords
-            if len(common_keywords) >= 2 and len(common_keywords) / len(new_keywords) > 0.7:
+            if len(common_keywords) >= 2 and len(common_keywords) / len(new_keywords) > settings.duplicate_keyword_overlap:
                 logger.info(f"키워드 기반 중복: '{new_title}' (공통: {common_keywords})")
                 return True
         
@@ -69,8 +78,7 @@ def is_duplicate_title(new_title: str, existing_titles: List[str]) -> bool:
 def extract_key_words(title: str) -> set:
     """제목에서 핵심 키워드 추출"""
     # 의미있는 단어들만 추출
-    import re
-    words = re.findall(r'[가-힣A-Za-z0-9]+', title)
+    words = extract_words(title)
     # 짧은 단어나 일반적인 단어 제외
     meaningful_words = set()
     for word in words:
@@ -98,41 +106,59 @@ def calculate_similarity(title1: str, title2: str) -> float:
         logger.error(f"유사도 계산 오류: {e}")
         return 0.0
 
-def filter_duplicate_articles(articles: List[Dict]) -> List[Dict]:
-    """중복 기사 필터링 (DB + 스마트 로컬 캐시)"""
+def _title(article) -> str:
+    """기사 레코드(Article) 또는 일정 딕셔너리의 제목"""
+    return article.title if isinstance(article, Article) else article.get('title', '')
+
+def filter_duplicate_articles(articles: List, category: str = 'NEWS', remember: bool = True) -> List:
+    """중복 기사 필터링 (DB + 스마트 로컬 캐시) - 뉴스는 Article 레코드, 일정은 딕셔너리
+
+    remember=False 이면 통과한 제목을 로컬 캐시에 기록하지 않음 (아웃박스가 전송 확인 후 기록)
+    """
     try:
         if not articles:
             return []
         
         # 새로운 기사 제목들 추출
-        new_titles = [article.get('title', '') for article in articles]
+        new_titles = [_title(article) for article in articles]
         
         # 1차: DB에서 기존 제목들 조회
-        existing_titles = check_existing_posts(new_titles)
+        existing_titles = check_existing_posts(new_titles, category)
         
-        # 2차: 스마트 로컬 캐시 체크 (30분 이내만 중복 방지)
-        from utils.local_cache import get_smart_cached_titles, save_cached_titles
-        recent_cached_titles = get_smart_cached_titles(minutes=30)  # 30분 이내만 중복 체크
+        # 2차: 스마트 로컬 캐시 체크 (local_cache_minutes 이내만 중복 방지)
+        from utils.local_cache import get_smart_cached_titles
+        recent_cached_titles = get_smart_cached_titles(minutes=get_settings().local_cache_minutes)
+        # 다중 인스턴스: 다른 노드가 최근 게시(선점)한 제목도 포함
+        recent_cached_titles |= _shared_recent_titles(get_settings().local_cache_minutes)
         all_existing_titles = list(set(existing_titles) | recent_cached_titles)
         
+        existing_keys = {normalize_title(title) for title in all_existing_titles}
+        
         logger.info(f"중복 체크: DB {len(existing_titles)}개 + 캐시 {len(recent_cached_titles)}개 = 총 {len(all_existing_titles)}개")
         
+        # 게시 기록 필터에 있는 제목은 유사도 비교 없이 바로 중복 (DB 조회가 실패해도 동작)
+        seen = _seen_titles(new_titles, category)
+        
         # 중복되지 않은 기사만 필터링
         filtered_articles = []
-        new_article_titles = []
         
-        for article in articles:
-            title = article.get('title', '')
-            if not is_duplicate_title(title, all_existing_titles):
+        for article, title, already_seen in zip(articles, new_titles, seen):
+            if not already_seen and not is_duplicate_title(title, all_existing_titles, existing_keys):
                 filtered_articles.append(article)
-                new_article_titles.append(title)
-                logger.info(f"새로운 기사: {title[:50]}...")
             else:
                 logger.info(f"중복 기사 제외: {title[:50]}...")
         
+        # 3차: 의미 기반 유사 제목 (설정으로 켠 경우, 통과한 제목만 한 번에 질의)
+        if filtered_articles and get_settings().semantic_dedup:
+            filtered_articles = filter_semantic_duplicates(filtered_articles, existing_titles, category)
+        
+        new_article_titles = [_title(article) for article in filtered_articles]
+        for title in new_article_titles:
+            logger.info(f"새로운 기사: {title[:50]}...")
+        
         # 새로운 제목들을 로컬 캐시에 저장
-        if new_article_titles:
-            save_cached_titles(new_article_titles)
+        if remember and new_article_titles:
+            remember_titles(new_article_titles, category)
         
         logger.info(f"중복 필터링 결과: {len(articles)}개 → {len(filtered_articles)}개")
         return filtered_articles
@@ -141,6 +167,100 @@ def filter_duplicate_articles(articles: List[Dict]) -> List[Dict]:
         logger.error(f"중복 필터링 실패: {e}")
         return articles  # 실패 시 원본 반환
 
+def _seen_titles(titles: List[str], category: str) -> List[bool]:
+    """중복 조회 기간(duplicate_lookup_days) 안에 게시한 제목인지 (Bloom 필터 → 적중 시에만 DB 확인)"""
+    try:
+        from utils.seen_filter import get_seen_filter
+        return get_seen_filter().contains_many([(f"title:{category}", title) for title in titles],
+                                               max_age_days=get_settings().duplicate_lookup_days)
+    except Exception as e:
+        logger.error(f"게시 기록 필터 조회 실패: {e}")
+        return [False] * len(titles)
+
+def filter_seen_articles(articles: List[Article], category: str = 'NEWS') -> Tuple[List[Article], List[Article]]:
+    """본문 추출 전 후보 거르기: 이미 게시한 URL/GUID(보관 기간 전체) 또는 제목(중복 조회 기간) → (새 후보, 본 후보)"""
+    if not articles:
+        return [], []
+    try:
+        from utils.seen_filter import get_seen_filter
+        items = []
+        for article in articles:
+            items += [("url", article.url), ("guid", article.guid)]
+        links = get_seen_filter().contains_many(items)
+        titles = _seen_titles([article.title for article in articles], category)
+    except Exception as e:
+        logger.error(f"게시 기록 필터 조회 실패: {e}")
+        return list(articles), []
+    fresh, seen = [], []
+    for index, article in enumerate(articles):
+        (seen if links[2 * index] or links[2 * index + 1] or titles[index] else fresh).append(article)
+    if seen:
+        logger.info(f"이미 게시한 후보 제외: {len(articles)}개 → {len(fresh)}개")
+    return fresh, seen
+
+def remember_links(articles: List[Article]):
+    """게시(대기열 등록)한 기사의 URL/GUID 기록 (다음 실행에서 본문 추출 전에 제외)"""
+    items = []
+    for article in articles:
+        items += [("url", article.url), ("guid", article.guid)]
+    try:
+        from utils.seen_filter import get_seen_filter
+        seen_filter = get_seen_filter()
+        if seen_filter.add_many(items):
+            seen_filter.maybe_save()
+    except Exception as e:
+        logger.error(f"게시 기록 필터 저장 실패: {e}")
+
+def _shared_recent_titles(minutes: int) -> set:
+    try:
+        from utils.coordination import get_coordinator
+        return get_coordinator().recent_titles(minutes)
+    except Exception as e:
+        logger.error(f"공유 저장소 제목 조회 실패: {e}")
+        return set()
+
+def filter_semantic_duplicates(articles: List, published_titles: List[str], category: str = 'NEWS') -> List:
+    """임베딩 색인 기준 유사 기사 제외 (DB 에서 조회한 게시 제목도 색인에 반영)"""
+    try:
+        from utils.semantic_dedup import get_semantic_index
+        index = get_semantic_index(category)
+        if published_titles and index.add_many(published_titles):
+            index.save()
+        
+        threshold = get_settings().semantic_similarity
+        titles = [_title(article) for article in articles]
+        filtered_articles = []
+        for article, title, match in zip(articles, titles, index.find_duplicates(titles, threshold)):
+            if match is None:
+                filtered_articles.append(article)
+            else:
+                logger.info(f"의미 유사 제목 발견: '{title}' vs '{match[0]}' (유사도: {match[1]:.2f})")
+        return filtered_articles
+        
+    except Exception as e:
+        logger.error(f"의미 기반 중복 체크 실패: {e}")
+        return articles
+
+def remember_titles(titles: List[str], category: str = 'NEWS'):
+    """게시된 제목 기록 (로컬 캐시 + 게시 기록 필터 + 의미 색인)"""
+    from utils.local_cache import save_cached_titles
+    save_cached_titles(titles)
+    try:
+        from utils.seen_filter import get_seen_filter
+        seen_filter = get_seen_filter()
+        if seen_filter.add_many([(f"title:{category}", title) for title in titles]):
+            seen_filter.maybe_save()
+    except Exception as e:
+        logger.error(f"게시 기록 필터 저장 실패: {e}")
+    if get_settings().semantic_dedup:
+        try:
+            from utils.semantic_dedup import get_semantic_index
+            index = get_semantic_index(category)
+            if index.add_many(titles):
+                index.save()
+        except Exception as e:
+            logger.error(f"의미 색인 기록 실패: {e}")
+
 def create_title_hash(title: str) -> str:
     """제목의 해시값 생성 (중복 체크용)"""
     import hashlib
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+백그라운드 헬스 프로브 (결과를 메모리에 캐시하고 엔드포인트는 캐시만 읽음)
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from config import HEALTH_PROBE_INTERVAL, HEALTH_PROBE_TIMEOUT, HEALTH_STALE_AFTER
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """등록된 프로브를 주기적으로 실행하고 마지막 결과를 보관"""
+
+    def __init__(self, interval: float = HEALTH_PROBE_INTERVAL, timeout: float = HEALTH_PROBE_TIMEOUT,
+                 stale_after: float = HEALTH_STALE_AFTER):
+        self.interval = interval
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self._probes: Dict[str, Dict] = {}
+        self._results: Dict[str, Dict] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.started_at = time.time()
+
+    def register_probe(self, name: str, func: Callable[[], Dict], critical: bool = True):
+        """프로브 등록 - func는 {"ok": bool, ...} 를 반환하는 동기 함수"""
+        self._probes[name] = {"func": func, "critical": critical}
+
+    async def _run_probe(self, name: str, probe: Dict):
+        started = time.perf_counter()
+        try:
+            # 네트워크/파일 I/O는 이벤트 루프 밖에서 실행
+            detail = await asyncio.wait_for(asyncio.to_thread(probe["func"]), timeout=self.timeout)
+            ok = bool(detail.pop("ok", False))
+        except asyncio.TimeoutError:
+            ok, detail = False, {"error": f"{self.timeout}초 타임아웃"}
+        except Exception as e:
+            ok, detail = False, {"error": str(e)}
+
+        self._results[name] = {
+            "ok": ok,
+            "critical": probe["critical"],
+            "checked_at": time.time(),
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            **detail
+        }
+
+    async def probe_all(self):
+        """모든 프로브를 동시에 1회 실행"""
+        await asyncio.gather(*(self._run_probe(name, probe) for name, probe in self._probes.items()))
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.probe_all()
+            except Exception as e:
+                logger.error(f"헬스 프로브 실행 실패: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """이벤트 루프에서 백그라운드 프로브 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """프로브별 마지막 결과 + 경과 시간(staleness)"""
+        now = time.time()
+        snapshot = {}
+        for name, result in self._results.items():
+            staleness = now - result["checked_at"]
+            snapshot[name] = {
+                **result,
+                "checked_at": datetime.fromtimestamp(result["checked_at"]).isoformat(timespec="seconds"),
+                "staleness_seconds": round(staleness, 1),
+                "stale": staleness > self.stale_after
+            }
+        return snapshot
+
+    def is_ready(self) -> bool:
+        """필수 프로브가 모두 최신 상태로 성공했으면 준비 완료"""
+        snapshot = self.snapshot()
+        for name, probe in self._probes.items():
+            if not probe["critical"]:
+                continue
+            result = snapshot.get(name)
+            if result is None or not result["ok"] or result["stale"]:
+                return False
+        return True
+
+    def uptime(self) -> float:
+        return round(time.time() - self.started_at, 1)
+
+
+def probe_spring_server() -> Dict:
+    """스프링 서버 상태 엔드포인트 확인"""
+    from config import SPRING_SERVER_URL
+    from utils.http_client import get_session
+
+    response = get_session().get(f"{SPRING_SERVER_URL}/api/admin/crawler/status", timeout=HEALTH_PROBE_TIMEOUT)
+    connected = response.status_code == 200
+    return {"ok": connected, "status": "connected" if connected else "disconnected",
+            "http_status": response.status_code}
+
+
+def probe_browser_pool() -> Dict:
+    """렌더 팜 상태 (아직 시작 전이면 대기 상태로 정상 처리)"""
+    from config import RENDER_FARM_ENABLED
+    from utils.plugin_registry import is_plugin_available
+
+    if not is_plugin_available("selenium"):
+        return {"ok": True, "status": "selenium_unavailable"}
+    if not RENDER_FARM_ENABLED:
+        return {"ok": True, "status": "in_process"}
+
+    from crawler.render_farm import get_render_farm_status
+    farm_status = get_render_farm_status()
+    if farm_status is None:
+        return {"ok": True, "status": "not_started"}
+    return {"ok": farm_status["size"] > 0, "status": "running", **farm_status}
+
+
+def probe_dedup_store() -> Dict:
+    """로컬 중복 캐시 파일 읽기 가능 여부"""
+    import json
+    import os
+    from utils.local_cache import CACHE_FILE, ensure_data_dir
+
+    ensure_data_dir()
+    if not os.path.exists(CACHE_FILE):
+        return {"ok": True, "status": "empty", "entries": 0}
+    with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+        entries = len(json.load(f))
+    return {"ok": True, "status": "readable", "entries": entries}
+
+
+def create_default_monitor() -> HealthMonitor:
+    """기본 프로브가 등록된 모니터 생성"""
+    monitor = HealthMonitor()
+    # 스프링 서버 장애 시에도 크롤링은 계속되므로 준비 상태 판단에서는 제외
+    monitor.register_probe("spring_server", probe_spring_server, critical=False)
+    monitor.register_probe("browser_pool", probe_browser_pool, critical=False)
+    monitor.register_probe("dedup_store", probe_dedup_store, critical=True)
+    return monitor
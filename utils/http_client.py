@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+공유 HTTP 세션 (커넥션 풀 재사용)
+"""
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """프로세스 전역 세션 반환 (호스트별 커넥션 풀 공유)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # 동시 요청을 고려해 풀 크기 확장
+                adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({'User-Agent': DEFAULT_USER_AGENT})
+                _session = session
+    return _session
+
+def close_session():
+    """세션 종료 (서버 종료 시)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
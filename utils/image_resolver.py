@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+기사 이미지 후보 수집 및 병렬 검증 (메타데이터 캐시 포함)
+"""
+import contextvars
+import logging
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from utils.logger_setup import log_sampled
+from config import (
+    IMAGE_PROBE_TIMEOUT, IMAGE_PROBE_WORKERS, IMAGE_MAX_CANDIDATES,
+    IMAGE_CACHE_SIZE, IMAGE_CACHE_TTL, IMAGE_MIN_WIDTH, IMAGE_MIN_HEIGHT
+)
+
+logger = logging.getLogger(__name__)
+
+# 기본 이미지 셀렉터 (메타 태그 우선)
+DEFAULT_IMAGE_SELECTORS = [
+    "meta[property='og:image']", "meta[name='twitter:image']", "meta[property='twitter:image']",
+    ".article_body img", ".news_body img", ".article-body img",
+    ".view_content img", ".article_view img", ".article-content img",
+    "article img", ".content img", "main img"
+]
+
+# 로고/아이콘/추적 픽셀 등 기사 이미지가 아닌 URL 패턴
+SKIP_IMAGE_PATTERNS = ['logo', 'icon', 'pixel', 'blank', 'spacer', 'banner', '/ads/', 'favicon']
+
+# 헤더 스니핑에 필요한 최대 바이트 (JPEG SOF 마커가 뒤쪽에 있는 경우 대비)
+SNIFF_BYTES = 32 * 1024
+
+_executor = ThreadPoolExecutor(max_workers=IMAGE_PROBE_WORKERS, thread_name_prefix="image-probe")
+
+
+class ImageMetadataCache:
+    """URL별 이미지 메타데이터 LRU 캐시 (TTL 만료)"""
+
+    def __init__(self, max_size: int = IMAGE_CACHE_SIZE, ttl: int = IMAGE_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._data.get(url)
+            if entry is None:
+                return None
+            stored_at, info = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._data[url]
+                return None
+            self._data.move_to_end(url)
+            return info
+
+    def put(self, url: str, info: Dict):
+        with self._lock:
+            self._data[url] = (time.monotonic(), info)
+            self._data.move_to_end(url)
+            # 가장 오래 사용되지 않은 항목부터 제거
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+_cache = ImageMetadataCache()
+
+
+def collect_image_candidates(soup, base_url: str, selectors: List[str] = None) -> List[str]:
+    """페이지에서 이미지 후보 URL 수집 (확장자 없는 URL도 포함, 우선순위 순)"""
+    candidates = []
+    seen = set()
+
+    for selector in selectors or DEFAULT_IMAGE_SELECTORS:
+        for tag in soup.select(selector):
+            if tag.name == 'meta':
+                src = tag.get('content')
+            else:
+                # 지연 로딩 이미지 속성도 확인
+                src = tag.get('src') or tag.get('data-src') or tag.get('data-original')
+            if not src:
+                continue
+
+            src = src.strip()
+            if src.startswith('data:'):
+                continue
+            if src.startswith('//'):
+                src = 'https:' + src
+            elif not src.startswith('http'):
+                src = urljoin(base_url, src)
+
+            lowered = src.lower()
+            if lowered.endswith('.svg') or any(pattern in lowered for pattern in SKIP_IMAGE_PATTERNS):
+                continue
+
+            if src not in seen:
+                seen.add(src)
+                candidates.append(src)
+
+    return candidates
+
+
+def sniff_image_size(data: bytes):
+    """이미지 헤더에서 (가로, 세로) 추출 - PNG, GIF, JPEG, WEBP 지원"""
+    try:
+        if data[:8] == b'\x89PNG\r\n\x1a\n' and len(data) >= 24:
+            return struct.unpack('>II', data[16:24])
+
+        if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+            return struct.unpack('<HH', data[6:10])
+
+        if data[:4] == b'RIFF' and data[8:12] == b'WEBP' and len(data) >= 30:
+            chunk = data[12:16]
+            if chunk == b'VP8 ':
+                width, height = struct.unpack('<HH', data[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b'VP8L':
+                bits = int.from_bytes(data[21:25], 'little')
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b'VP8X':
+                width = int.from_bytes(data[24:27], 'little') + 1
+                height = int.from_bytes(data[27:30], 'little') + 1
+                return width, height
+
+        if data[:2] == b'\xff\xd8':
+            # JPEG: SOF 마커까지 세그먼트 단위로 이동
+            index = 2
+            while index + 9 < len(data):
+                if data[index] != 0xFF:
+                    index += 1
+                    continue
+                marker = data[index + 1]
+                if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+                    index += 1 if marker == 0xFF else 2
+                    continue
+                segment_length = struct.unpack('>H', data[index + 2:index + 4])[0]
+                if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                    height, width = struct.unpack('>HH', data[index + 5:index + 9])
+                    return width, height
+                index += 2 + segment_length
+    except struct.error:
+        pass
+    return None
+
+
+def probe_image(url: str, timeout: float = IMAGE_PROBE_TIMEOUT) -> Dict:
+    """Range 요청으로 이미지 메타데이터 확인 (캐시 우선)"""
+    cached = _cache.get(url)
+    if cached is not None:
+        return cached
+
+    from utils.http_client import get_session
+
+    info = {"url": url, "ok": False, "content_type": "", "size": 0, "width": 0, "height": 0}
+    transient = False
+    try:
+        resp = get_session().get(
+            url,
+            headers={'Range': f'bytes=0-{SNIFF_BYTES - 1}', 'Accept': 'image/*'},
+            timeout=timeout,
+            stream=True
+        )
+        try:
+            content_type = resp.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            info["content_type"] = content_type
+            transient = resp.status_code == 429 or resp.status_code >= 500
+
+            # 전체 크기: Content-Range 우선, 없으면 Content-Length
+            content_range = resp.headers.get('Content-Range', '')
+            if '/' in content_range and content_range.rsplit('/', 1)[1].isdigit():
+                info["size"] = int(content_range.rsplit('/', 1)[1])
+            elif resp.headers.get('Content-Length', '').isdigit():
+                info["size"] = int(resp.headers['Content-Length'])
+
+            if resp.status_code in (200, 206) and content_type.startswith('image/'):
+                # Range 미지원 서버도 앞부분만 읽고 연결 종료
+                head = b''
+                for chunk in resp.iter_content(chunk_size=8192):
+                    head += chunk
+                    if len(head) >= SNIFF_BYTES:
+                        break
+                dimensions = sniff_image_size(head)
+                if dimensions:
+                    info["width"], info["height"] = dimensions
+                info["ok"] = True
+        finally:
+            resp.close()
+    except Exception as e:
+        log_sampled(logger, logging.DEBUG, "image_probe_failed", f"이미지 검증 실패 ({url[:60]}...): {e}")
+        transient = True
+
+    # 네트워크 오류/시간 초과, 429/5xx 같은 일시적 실패는 캐시하지 않음 (다음 요청에서 다시 확인)
+    if not transient:
+        _cache.put(url, info)
+    return info
+
+
+def score_image(info: Dict, rank: int) -> float:
+    """이미지 점수 계산 (크기 우선, 동점이면 앞선 후보 우대)"""
+    if not info.get("ok"):
+        return -1.0
+    width, height = info.get("width", 0), info.get("height", 0)
+    if width and height:
+        if width < IMAGE_MIN_WIDTH or height < IMAGE_MIN_HEIGHT:
+            return -1.0
+        # 극단적인 가로/세로 비율(배너, 구분선) 제외
+        if width / height > 5 or height / width > 5:
+            return -1.0
+        area_score = min(width * height, 1920 * 1080) / (1920 * 1080)
+    else:
+        # 크기를 알 수 없으면 파일 크기로 대략 판단
+        size = info.get("size", 0)
+        if size and size < 5 * 1024:
+            return -1.0
+        area_score = 0.3
+    return area_score + 0.5 / (rank + 1)
+
+
+def resolve_best_image(candidates: List[str], max_candidates: int = IMAGE_MAX_CANDIDATES,
+                       timeout: float = IMAGE_PROBE_TIMEOUT) -> str:
+    """이미지 후보들을 병렬 검증 후 가장 적합한 URL 반환"""
+    candidates = candidates[:max_candidates]
+    if not candidates:
+        return ""
+
+    # 실행 ID 등 로그 컨텍스트를 검증 스레드로 전달
+    futures = {
+        _executor.submit(contextvars.copy_context().run, probe_image, url, timeout): rank
+        for rank, url in enumerate(candidates)
+    }
+    # 전체 단계에 상한을 두어 느린 이미지 서버가 크롤링을 막지 않도록 함
+    done, _ = wait(futures, timeout=timeout + 1)
+
+    best_url, best_score = "", -1.0
+    for future in done:
+        info = future.result()
+        score = score_image(info, futures[future])
+        if score > best_score:
+            best_url, best_score = info["url"], score
+
+    if best_url:
+        logger.info(f"이미지 선택: {best_url[:100]}... (후보 {len(candidates)}개)")
+    else:
+        log_sampled(logger, logging.DEBUG, "image_none", f"유효한 이미지 없음 (후보 {len(candidates)}개)")
+    return best_url
+
+
+def get_image_cache_stats() -> Dict:
+    """이미지 메타데이터 캐시 상태"""
+    return {"entries": len(_cache), "max_size": _cache.max_size, "ttl": _cache.ttl}
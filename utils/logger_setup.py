@@ -1,23 +1,68 @@
+import atexit
+import contextvars
+import json
 import logging
 import os
+import queue
+import threading
+import uuid
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
-def setup_logger():
-    """로그 시스템 설정"""
+from config import LOG_LEVEL, LOG_JSON_FORMAT, LOG_SAMPLE_EVERY
+
+# 실행(run)별 상관관계 ID - asyncio 태스크/to_thread 로 자동 전파
+_run_id = contextvars.ContextVar("run_id", default="-")
+
+_listener = None
+
+def new_run_id(prefix: str = "run") -> str:
+    """새 실행 ID를 만들어 현재 컨텍스트에 설정"""
+    run_id = f"{prefix}-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    _run_id.set(run_id)
+    return run_id
+
+def get_run_id() -> str:
+    return _run_id.get()
+
+class RunIdFilter(logging.Filter):
+    """로그 레코드에 현재 실행 ID 추가 (큐에 넣기 전, 호출 스레드에서 실행)"""
+
+    def filter(self, record):
+        record.run_id = _run_id.get()
+        return True
+
+class JsonLinesFormatter(logging.Formatter):
+    """JSON Lines 구조화 로그 포맷"""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "run_id": getattr(record, "run_id", "-"),
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+def setup_logger(log_dir: str = "logs", json_format: bool = LOG_JSON_FORMAT):
+    """로그 시스템 설정 (QueueHandler -> 백그라운드 QueueListener 가 파일/콘솔 기록)"""
+    global _listener
     
     # 로그 디렉토리 생성
-    log_dir = "logs"
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
     
     # 로거 설정
     logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
     
-    # 기존 핸들러 제거
+    # 기존 핸들러/리스너 제거 (재설정 시)
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    stop_logger()
     
     # 파일 핸들러 (회전 로그)
     file_handler = RotatingFileHandler(
@@ -42,22 +87,54 @@ def setup_logger():
     console_handler.setLevel(logging.INFO)
     
     # 포맷터 설정
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    if json_format:
+        formatter = JsonLinesFormatter()
+    else:
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - [%(run_id)s] %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
     
     file_handler.setFormatter(formatter)
     error_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # 핸들러 추가
-    logger.addHandler(file_handler)
-    logger.addHandler(error_handler)
-    logger.addHandler(console_handler)
+    # 호출 스레드는 큐에 넣기만 하고, 파일 쓰기/회전 검사는 리스너 스레드가 처리
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(RunIdFilter())
+    logger.addHandler(queue_handler)
+    
+    _listener = QueueListener(log_queue, file_handler, error_handler, console_handler, respect_handler_level=True)
+    _listener.start()
     
     return logger
 
+def stop_logger():
+    """리스너 종료 (큐에 남은 로그를 모두 기록한 뒤 반환)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(stop_logger)
+
+_sample_counts = {}
+_sample_lock = threading.Lock()
+
+def log_sampled(logger: logging.Logger, level: int, key: str, message: str, every: int = LOG_SAMPLE_EVERY):
+    """항목별 반복 로그 샘플링: 같은 key 는 첫 건과 이후 every 건마다 한 번만 기록"""
+    if not logger.isEnabledFor(level):
+        return
+    with _sample_lock:
+        count = _sample_counts.get(key, 0) + 1
+        _sample_counts[key] = count
+    if count == 1 or count % every == 0:
+        suffix = f" (누적 {count}건)" if count > 1 else ""
+        logger.log(level, message + suffix)
+
 def log_crawling_result(crawler_type: str, result: dict):
     """크롤링 결과 로그 기록"""
     logger = logging.getLogger(__name__)
@@ -67,9 +144,9 @@ def log_crawling_result(crawler_type: str, result: dict):
     if crawler_type == "news":
         logger.info(f"📰 [{timestamp}] 뉴스 크롤링 완료 - 총 {result['total']}개 중 {result['success']}개 성공")
         logger.info(f"📰 [{timestamp}] 뉴스 소스: {', '.join(result['sources'])}")
-    elif crawler_type == "observatory":
-        logger.info(f"🏛️ [{timestamp}] 천문대 일정 크롤링 완료 - 총 {result['total_events']}개 중 {result['success']}개 성공")
-        logger.info(f"🏛️ [{timestamp}] 천문대: {', '.join(result['observatories'])}")
+    elif crawler_type in ("exhibitions", "observatory"):
+        logger.info(f"🏛️ [{timestamp}] 전시회/천문대 일정 크롤링 완료 - 총 {result['total_events']}개 중 {result['success']}개 성공")
+        logger.info(f"🏛️ [{timestamp}] 확인한 기관: {', '.join(result['observatories']) or '없음'}")
     
     # 실패가 있으면 에러 로그에도 기록
     if result.get('success', 0) < result.get('total', 0) or result.get('success', 0) < result.get('total_events', 0):
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+스프링 전송 아웃박스 (SQLite, 재시도 + 지수 백오프 + 멱등 키)
+
+- 채택된 게시글은 먼저 아웃박스에 저장하고, 백그라운드 디스패처가 전송
+- 멱등 키는 분류 + 정규화 제목 해시 → 같은 게시글은 한 번만 쌓이고, 재전송 시 Idempotency-Key 헤더로 전달
+- 전송이 확인된 뒤에만 로컬 캐시에 제목을 "본 것"으로 기록 (실패한 기사가 중복으로 걸러지지 않도록)
+- 네트워크 오류/5xx/408/429 는 재시도, 그 외 4xx 는 즉시 실패(dead) 처리, 409 는 이미 게시된 것으로 간주
+- 다중 인스턴스: 저장할 때 받은 선점 토큰과 회차 리스 토큰을 함께 두고, 전송 직전에 공유 저장소에서 다시 확인
+  → 다른 노드가 선점이나 회차를 인수했으면 보내지 않고 superseded 처리
+"""
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from config import (
+    OUTBOX_DB, OUTBOX_POLL_INTERVAL, OUTBOX_BATCH_SIZE, OUTBOX_BASE_DELAY, OUTBOX_MAX_DELAY,
+    OUTBOX_MAX_ATTEMPTS, OUTBOX_RETENTION_DAYS
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    message_id INTEGER PRIMARY KEY,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_status INTEGER,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    delivered_at REAL,
+    run_id TEXT,
+    item_id INTEGER,
+    claim_token INTEGER,
+    lease_name TEXT,
+    lease_token INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox(status, next_attempt_at);
+"""
+
+# 분류별 API 키 (키 자체는 DB 에 저장하지 않음)
+_API_KEYS = {"news": "API_KEY", "event": "EVENT_API_KEY"}
+
+RETRYABLE_STATUS = {408, 425, 429}
+
+
+def idempotency_key(kind: str, title: str) -> str:
+    from utils.duplicate_checker import create_title_hash
+    from utils.text_normalizer import normalize_title
+    return f"{kind}-{create_title_hash(normalize_title(title))}"
+
+
+def backoff_delay(attempts: int) -> float:
+    """attempts 번 실패한 뒤 다음 시도까지 대기 시간 (지수 증가, ±10% 지터)"""
+    delay = min(OUTBOX_MAX_DELAY, OUTBOX_BASE_DELAY * (2 ** max(0, attempts - 1)))
+    return delay * random.uniform(0.9, 1.1)
+
+
+class Outbox:
+    """전송 대기 게시글 저장소"""
+
+    def __init__(self, path: str = OUTBOX_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            # 이전 버전 DB: 선점/리스 토큰 열 추가
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(outbox)")}
+            for column, column_type in (("claim_token", "INTEGER"), ("lease_name", "TEXT"), ("lease_token", "INTEGER")):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE outbox ADD COLUMN {column} {column_type}")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, kind: str, endpoint: str, payload: Dict, source: str, run_id: str = "",
+                item_id: int = None) -> bool:
+        """게시글 저장 (같은 멱등 키가 이미 있거나 다른 노드가 선점했으면 False)
+
+        예약 실행 안이면 회차 리스 (이름, 토큰)도 함께 저장 (전송 직전 확인용)
+        """
+        from utils.coordination import current_run_lease
+        key = idempotency_key(kind, payload["title"])
+        claimed, claim_token = _claim(key, payload["title"])
+        if not claimed:
+            logger.info(f"다른 노드가 이미 게시 중인 게시글: {payload['title'][:30]}...")
+            return False
+        lease_name, lease_token = current_run_lease() or (None, None)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO outbox (idempotency_key, kind, endpoint, source, title, payload, "
+                "next_attempt_at, created_at, run_id, item_id, claim_token, lease_name, lease_token) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, kind, endpoint, source, payload["title"], json.dumps(payload, ensure_ascii=False),
+                 now, now, run_id, item_id, claim_token, lease_name, lease_token)
+            )
+        if cursor.rowcount == 0:
+            logger.info(f"아웃박스에 이미 있는 게시글: {payload['title'][:30]}...")
+            return False
+        return True
+
+    def due(self, limit: int = OUTBOX_BATCH_SIZE) -> List[Dict]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM outbox WHERE status = 'pending' AND next_attempt_at <= ? "
+                "ORDER BY next_attempt_at LIMIT ?", (time.time(), limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def mark_delivered(self, message_id: int, status: int):
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE outbox SET status = 'delivered', delivered_at = ?, attempts = attempts + 1, "
+                         "last_status = ?, last_error = NULL WHERE message_id = ?", (time.time(), status, message_id))
+
+    def mark_failed(self, message: Dict, status: Optional[int], error: str, retryable: bool):
+        attempts = message["attempts"] + 1
+        dead = not retryable or attempts >= OUTBOX_MAX_ATTEMPTS
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_status = ?, last_error = ? "
+                "WHERE message_id = ?",
+                ("dead" if dead else "pending", attempts, time.time() + backoff_delay(attempts), status,
+                 (error or "")[:500], message["message_id"])
+            )
+        return dead
+
+    def mark_superseded(self, message_id: int, reason: str):
+        """다른 노드가 인수한 게시글 (보내지 않고 종료)"""
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE outbox SET status = 'superseded', last_error = ? WHERE message_id = ?",
+                         (reason, message_id))
+
+    def retry_dead(self) -> int:
+        """실패 처리된 게시글을 다시 대기 상태로"""
+        with self._lock, self._connect() as conn:
+            return conn.execute("UPDATE outbox SET status = 'pending', attempts = 0, next_attempt_at = ? "
+                                "WHERE status = 'dead'", (time.time(),)).rowcount
+
+    def purge(self, retention_days: int = OUTBOX_RETENTION_DAYS) -> int:
+        """보관 기간이 지난 전송 완료/인수된 기록 삭제 (대기/실패 건은 유지)"""
+        cutoff = time.time() - retention_days * 86400
+        with self._lock, self._connect() as conn:
+            return conn.execute("DELETE FROM outbox WHERE (status = 'delivered' AND delivered_at < ?) "
+                                "OR (status = 'superseded' AND created_at < ?)", (cutoff, cutoff)).rowcount
+
+    def stats(self) -> Dict:
+        with self._connect() as conn:
+            counts = dict(conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall())
+            oldest = conn.execute("SELECT MIN(created_at) FROM outbox WHERE status = 'pending'").fetchone()[0]
+            dead = conn.execute("SELECT title, source, attempts, last_status, last_error FROM outbox "
+                                "WHERE status = 'dead' ORDER BY created_at DESC LIMIT 10").fetchall()
+        return {
+            "pending": counts.get("pending", 0),
+            "delivered": counts.get("delivered", 0),
+            "dead": counts.get("dead", 0),
+            "superseded": counts.get("superseded", 0),
+            "oldest_pending_seconds": round(time.time() - oldest, 1) if oldest else None,
+            "recent_dead": [dict(row) for row in dead]
+        }
+
+
+def _claim(key: str, title: str) -> Tuple[bool, Optional[int]]:
+    """다중 인스턴스 게시 선점 - (선점 여부, 선점 토큰)
+
+    공유 저장소 오류 시에는 선점 없이 진행 (토큰 None = 전송 전 선점 확인 생략, 중복은 멱등 키 헤더로 방지)
+    """
+    from utils.coordination import get_coordinator
+    try:
+        token = get_coordinator().claim(key, title)
+        return token is not None, token
+    except sqlite3.Error as e:
+        logger.error(f"게시 선점 실패, 선점 없이 저장: {e}")
+        return True, None
+
+
+def _superseded_reason(message: Dict) -> Optional[str]:
+    """전송 직전 확인: 다른 노드가 선점이나 회차를 인수했으면 그 이유 (확인 실패 시에는 그대로 전송)"""
+    from utils.coordination import get_coordinator
+    coordinator = get_coordinator()
+    if not coordinator.enabled:
+        return None
+    try:
+        if message["claim_token"] is not None and not coordinator.claim_current(message["idempotency_key"],
+                                                                                message["claim_token"]):
+            return "다른 노드가 게시 선점을 인수함"
+        if message["lease_name"] and not coordinator.lease_current(message["lease_name"], message["lease_token"]):
+            return f"다른 노드가 회차를 다시 실행함 ({message['lease_name']})"
+    except sqlite3.Error as e:
+        logger.error(f"게시 선점 확인 실패, 그대로 전송: {e}")
+    return None
+
+
+def _deliver(outbox: Outbox, message: Dict) -> str:
+    """게시글 하나 전송 후 결과 반영 - delivered / failed / superseded"""
+    import config
+    from utils.simple_sender import deliver_to_spring_admin
+
+    reason = _superseded_reason(message)
+    if reason:
+        logger.warning(f"아웃박스 전송 취소 ({reason}): {message['title'][:30]}...")
+        outbox.mark_superseded(message["message_id"], reason)
+        _record_delivery(message, False, 0.0)
+        return "superseded"
+
+    payload = json.loads(message["payload"])
+    started = time.perf_counter()
+    result = deliver_to_spring_admin(payload, message["endpoint"], message["source"],
+                                     api_key=getattr(config, _API_KEYS.get(message["kind"], "API_KEY")),
+                                     idempotency_key=message["idempotency_key"])
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    status = result["status"]
+    delivered = result["ok"] or status == 409  # 409: 같은 멱등 키로 이미 게시됨
+    final = delivered
+    if delivered:
+        outbox.mark_delivered(message["message_id"], status)
+        if message["claim_token"] is not None:
+            try:
+                from utils.coordination import get_coordinator
+                if not get_coordinator().mark_delivered(message["idempotency_key"], message["claim_token"]):
+                    logger.warning(f"이전 선점 토큰의 완료 기록 거부 (다른 노드가 인수): {message['title'][:30]}...")
+            except sqlite3.Error as e:
+                logger.error(f"게시 선점 완료 기록 실패: {e}")
+        # 전송이 확인된 제목만 로컬 중복 캐시(+ 의미 색인)에 기록
+        from utils.duplicate_checker import remember_titles
+        remember_titles([message["title"]], message["kind"].upper())
+    else:
+        retryable = status is None or status >= 500 or status in RETRYABLE_STATUS
+        final = outbox.mark_failed(message, status, result["error"], retryable)
+        if final:
+            logger.error(f"아웃박스 전송 포기 ({message['attempts'] + 1}회, 상태 {status}): {message['title'][:30]}...")
+
+    # 최종 결과(전송 완료 또는 포기)만 실행 이력에 반영
+    if final:
+        _record_delivery(message, delivered, elapsed_ms)
+    return "delivered" if delivered else "failed"
+
+
+def _record_delivery(message: Dict, delivered: bool, elapsed_ms: float):
+    if not message["item_id"]:
+        return
+    try:
+        from utils.run_history import get_store
+        get_store().mark_delivery(message["run_id"], message["item_id"], delivered, elapsed_ms)
+    except Exception as e:
+        logger.error(f"전송 결과 이력 반영 실패: {e}")
+
+
+def dispatch_due(outbox: "Outbox" = None, limit: int = OUTBOX_BATCH_SIZE) -> Dict:
+    """대기 시간이 지난 게시글을 한 차례 전송 (디스패처 스레드 또는 CLI 실행에서 호출)"""
+    outbox = outbox or get_outbox()
+    result = {"delivered": 0, "failed": 0, "superseded": 0}
+    for message in outbox.due(limit):
+        result[_deliver(outbox, message)] += 1
+    return result
+
+
+class OutboxDispatcher:
+    """아웃박스를 주기적으로(또는 깨우면 즉시) 비우는 백그라운드 스레드"""
+
+    def __init__(self, outbox: Outbox = None, interval: float = OUTBOX_POLL_INTERVAL):
+        self.outbox = outbox or get_outbox()
+        self.interval = interval
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="outbox-dispatcher", daemon=True)
+        self._thread.start()
+        logger.info("아웃박스 디스패처 시작")
+
+    def stop(self, timeout: float = 10):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def wake(self):
+        """새 게시글이 쌓였음을 알림 (디스패처가 없으면 현재 스레드에서 바로 전송)"""
+        if self.running:
+            self._wake.set()
+        else:
+            dispatch_due(self.outbox)
+
+    def _loop(self):
+        last_purge = 0.0
+        while not self._stop.is_set():
+            try:
+                # 한 번에 배치 크기만큼 보내고, 더 남았으면 바로 이어서
+                result = dispatch_due(self.outbox)
+                if sum(result.values()) >= OUTBOX_BATCH_SIZE:
+                    continue
+                if time.monotonic() - last_purge > 3600:
+                    last_purge = time.monotonic()
+                    self.outbox.purge()
+            except Exception as e:
+                logger.error(f"아웃박스 디스패치 오류: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+
+_outbox = None
+_dispatcher = None
+_lock = threading.Lock()
+
+
+def get_outbox() -> Outbox:
+    global _outbox
+    if _outbox is None:
+        with _lock:
+            if _outbox is None:
+                _outbox = Outbox()
+    return _outbox
+
+
+def get_dispatcher() -> OutboxDispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        outbox = get_outbox()
+        with _lock:
+            if _dispatcher is None:
+                _dispatcher = OutboxDispatcher(outbox)
+    return _dispatcher
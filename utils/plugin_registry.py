@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+선택적 하위 시스템 플러그인 레지스트리 (지연 임포트)
+
+플러그인은 "모듈경로:함수명" 문자열로 등록하고, 실제 임포트는 처음 실행할 때 합니다.
+모듈이 없거나 의존성이 설치되지 않은 플러그인은 건너뛰고 서버는 정상 기동합니다.
+"""
+import asyncio
+import importlib
+import importlib.util
+import logging
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_plugins: Dict[str, Dict] = {}
+
+
+class PluginUnavailable(Exception):
+    """플러그인 모듈 또는 의존성 없음"""
+
+
+def register_plugin(name: str, target: str, schedule: Optional[Dict] = None, requires: List[str] = None,
+                    optional: bool = True, description: str = "", partitioned: bool = False,
+                    slot_minutes: int = 0):
+    """플러그인 등록 (임포트하지 않음)
+
+    schedule: CronTrigger 인자 (예: {"hour": 8, "minute": 0}), 없으면 예약 작업 아님
+    requires: 추가로 필요한 외부 패키지 모듈명
+    partitioned: 다중 인스턴스에서 모든 노드가 실행하고 작업 안에서 담당 소스만 처리 (기본: 회차당 한 노드만 실행)
+    slot_minutes: 하루에 여러 번 도는 작업의 회차 단위 (분), 0 이면 날짜 단위 회차
+    """
+    _plugins[name] = {
+        "name": name,
+        "target": target,
+        "schedule": schedule,
+        "requires": requires or [],
+        "optional": optional,
+        "description": description,
+        "partitioned": partitioned,
+        "slot_minutes": slot_minutes,
+        "callable": None
+    }
+
+
+def _module_exists(module_name: str) -> bool:
+    """모듈을 임포트하지 않고 존재 여부만 확인"""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def is_plugin_available(name: str) -> bool:
+    """플러그인 모듈과 의존성이 모두 존재하는지 확인"""
+    plugin = _plugins.get(name)
+    if plugin is None:
+        return False
+    module_name = plugin["target"].split(":", 1)[0]
+    return all(_module_exists(module) for module in [module_name] + plugin["requires"])
+
+
+def resolve_plugin(name: str) -> Callable:
+    """플러그인 함수 반환 (최초 호출 시 임포트)"""
+    plugin = _plugins.get(name)
+    if plugin is None:
+        raise PluginUnavailable(f"등록되지 않은 플러그인: {name}")
+    if plugin["callable"] is None:
+        if not is_plugin_available(name):
+            raise PluginUnavailable(f"플러그인 모듈 또는 의존성 없음: {plugin['target']}")
+        module_name, func_name = plugin["target"].split(":", 1)
+        try:
+            module = importlib.import_module(module_name)
+            plugin["callable"] = getattr(module, func_name)
+        except (ImportError, AttributeError) as e:
+            raise PluginUnavailable(f"플러그인 로드 실패 ({plugin['target']}): {e}") from e
+        logger.info(f"플러그인 로드: {name} ({plugin['target']})")
+    return plugin["callable"]
+
+
+async def run_plugin(name: str, *args, **kwargs):
+    """플러그인 실행 (코루틴이면 await, 동기 함수면 스레드에서 실행)"""
+    func = resolve_plugin(name)
+    if asyncio.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+async def run_scheduled_plugin(name: str):
+    """예약 실행 (다중 인스턴스에서는 회차 리스를 얻은 노드만 실행, 건너뛰면 None)"""
+    plugin = _plugins.get(name)
+    if plugin is None or plugin["partitioned"]:
+        return await run_plugin(name)
+
+    from config import JOB_SLOT_KEEP
+    from utils.coordination import get_coordinator, run_lease
+    coordinator = get_coordinator()
+    schedule = ",".join(f"{key}={value}" for key, value in sorted(plugin["schedule"].items()))
+    keep = JOB_SLOT_KEEP
+    slot = date.today().isoformat()
+    if plugin["slot_minutes"]:
+        now = datetime.now()
+        slot = now.replace(minute=now.minute - now.minute % plugin["slot_minutes"], second=0,
+                           microsecond=0).isoformat(timespec="minutes")
+        keep = plugin["slot_minutes"] * 60
+    lease_name = f"job:{name}:{slot}:{schedule}"
+    token = await asyncio.to_thread(coordinator.acquire, lease_name)
+    if token is None:
+        logger.info(f"다른 노드가 이번 회차를 실행 중이거나 실행함: {name}")
+        return None
+    try:
+        # 이번 실행이 쌓은 게시글은 전송 직전에 이 리스 토큰이 아직 유효한지 확인
+        with run_lease(lease_name, token):
+            return await run_plugin(name)
+    finally:
+        await asyncio.to_thread(coordinator.complete, lease_name, keep)
+
+
+def get_scheduled_plugins() -> List[Dict]:
+    """예약 실행이 필요한 플러그인 중 사용 가능한 것만 반환"""
+    plugins = []
+    for plugin in _plugins.values():
+        if not plugin["schedule"]:
+            continue
+        if is_plugin_available(plugin["name"]):
+            plugins.append(plugin)
+        elif plugin["optional"]:
+            logger.warning(f"선택 플러그인 비활성화 (모듈 없음): {plugin['name']} ({plugin['target']})")
+        else:
+            raise PluginUnavailable(f"필수 플러그인 모듈 없음: {plugin['target']}")
+    return plugins
+
+
+def list_plugins() -> List[Dict]:
+    """등록된 플러그인 상태 목록"""
+    return [
+        {
+            "name": plugin["name"],
+            "target": plugin["target"],
+            "description": plugin["description"],
+            "available": is_plugin_available(plugin["name"]),
+            "loaded": plugin["callable"] is not None
+        }
+        for plugin in _plugins.values()
+    ]
+
+
+def _register_builtin_plugins():
+    """기본 플러그인 등록"""
+    register_plugin(
+        "news", "crawler.news_only_crawler:crawl_news_only",
+        schedule={"hour": 8, "minute": 0}, optional=False,
+        description="오전 8시 우주 뉴스 크롤링 (3개 보장)"
+    )
+    register_plugin(
+        "exhibitions", "crawler.exhibition_crawler:crawl_space_exhibitions",
+        schedule={"hour": 10, "minute": 0},
+        description="오전 10시 우주 전시회 크롤링", partitioned=True
+    )
+    from config import ADAPTIVE_SCHEDULE_ENABLED, ADAPTIVE_TICK_MINUTES
+    if ADAPTIVE_SCHEDULE_ENABLED:
+        register_plugin(
+            "news_adaptive", "crawler.news_only_crawler:crawl_news_adaptive",
+            schedule={"minute": f"*/{ADAPTIVE_TICK_MINUTES}"}, slot_minutes=ADAPTIVE_TICK_MINUTES,
+            description=f"{ADAPTIVE_TICK_MINUTES}분마다 갱신 예상 소스 확인 (적응형 뉴스 폴링)"
+        )
+    register_plugin(
+        "selenium", "crawler.selenium_enhancer:enhance_article_with_selenium",
+        requires=["selenium"],
+        description="Selenium 기반 본문 품질 개선"
+    )
+
+
+_register_builtin_plugins()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+도메인별 요청 예절 스케줄러
+
+- robots.txt 캐시 (허용 여부, Crawl-delay)
+- 호스트별 토큰 버킷 + 동시 요청 수 제한
+- 429/503 응답 시 Retry-After 만큼 해당 호스트 일시 중지
+- 같은 호스트 요청을 한 작업자에 묶어 커넥션 재사용 (run_batched)
+"""
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from utils.logger_setup import log_sampled
+from config import (
+    POLITENESS_ENABLED, ROBOTS_USER_AGENT, ROBOTS_CACHE_TTL, ROBOTS_EXEMPT_HOSTS,
+    POLITENESS_RATE, POLITENESS_BURST, POLITENESS_HOST_CONCURRENCY, POLITENESS_MAX_WAIT,
+    POLITENESS_BACKOFF, POLITENESS_HOST_OVERRIDES
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PolitenessError(Exception):
+    """예절 규칙 때문에 요청하지 않음"""
+
+
+class DisallowedByRobots(PolitenessError):
+    """robots.txt 에서 금지된 URL"""
+
+
+class HostThrottled(PolitenessError):
+    """호스트 대기 시간이 상한을 넘음"""
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+class RobotsCache:
+    """출처(scheme://host)별 robots.txt 파서 캐시"""
+
+    def __init__(self, user_agent: str = ROBOTS_USER_AGENT, ttl: int = ROBOTS_CACHE_TTL):
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self._parsers = {}
+        self._lock = threading.Lock()
+        self._origin_locks = {}
+
+    def _fetch(self, origin: str) -> RobotFileParser:
+        from utils.http_client import get_session
+
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        try:
+            resp = get_session().get(f"{origin}/robots.txt", timeout=5)
+            if resp.status_code in (401, 403):
+                parser.disallow_all = True
+            elif resp.status_code >= 400:
+                parser.allow_all = True  # robots.txt 없음
+            else:
+                parser.parse(resp.text.splitlines())
+        except Exception as e:
+            # 가져오지 못하면 허용으로 간주 (다음 TTL 에 재시도)
+            log_sampled(logger, logging.DEBUG, "robots_fetch_failed", f"robots.txt 조회 실패 ({origin}): {e}")
+            parser.allow_all = True
+        parser.modified()
+        return parser
+
+    def get(self, url: str) -> RobotFileParser:
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc.lower()}"
+        with self._lock:
+            entry = self._parsers.get(origin)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+            origin_lock = self._origin_locks.setdefault(origin, threading.Lock())
+        # 같은 출처는 한 번만 가져옴
+        with origin_lock:
+            with self._lock:
+                entry = self._parsers.get(origin)
+                if entry and time.monotonic() - entry[0] < self.ttl:
+                    return entry[1]
+            parser = self._fetch(origin)
+            with self._lock:
+                self._parsers[origin] = (time.monotonic(), parser)
+            return parser
+
+    def allowed(self, url: str) -> bool:
+        return self.get(url).can_fetch(self.user_agent, url)
+
+    def crawl_delay(self, url: str) -> Optional[float]:
+        """Crawl-delay 또는 Request-rate 로부터 요청 간 최소 간격 (초)"""
+        parser = self.get(url)
+        delay = parser.crawl_delay(self.user_agent)
+        rate = parser.request_rate(self.user_agent)
+        if rate and rate.requests:
+            delay = max(float(delay or 0), rate.seconds / rate.requests)
+        return float(delay) if delay else None
+
+
+class TokenBucket:
+    """초당 rate개, 최대 burst개까지 모아 둘 수 있는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간 반환 (호출하는 쪽에서 잠금)"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refund(self):
+        self._tokens = min(self.burst, self._tokens + 1)
+
+
+class _HostState:
+    def __init__(self, rate: float, burst: int, concurrency: int):
+        self.bucket = TokenBucket(rate, burst)
+        self.semaphore = threading.Semaphore(concurrency)
+        self.concurrency = concurrency
+        self.paused_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.blocked = 0
+        self.waited = 0.0
+
+
+class DomainScheduler:
+    """호스트별 요청 속도/동시성/robots.txt 를 한곳에서 관리"""
+
+    def __init__(self, enabled: bool = POLITENESS_ENABLED, robots: RobotsCache = None):
+        self.enabled = enabled
+        self.robots = robots or RobotsCache()
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _state(self, url: str, check_robots: bool) -> _HostState:
+        host = host_of(url)
+        with self._lock:
+            state = self._hosts.get(host)
+        if state is not None:
+            return state
+
+        override = POLITENESS_HOST_OVERRIDES.get(host, {})
+        rate = override.get("rate", POLITENESS_RATE)
+        if check_robots:
+            delay = self.robots.crawl_delay(url)
+            if delay:
+                rate = min(rate, 1.0 / delay)
+                logger.info(f"{host} Crawl-delay {delay}초 적용")
+        state = _HostState(rate, override.get("burst", POLITENESS_BURST),
+                           override.get("concurrency", POLITENESS_HOST_CONCURRENCY))
+        with self._lock:
+            return self._hosts.setdefault(host, state)
+
+    def is_allowed(self, url: str) -> bool:
+        if not self.enabled or host_of(url) in ROBOTS_EXEMPT_HOSTS:
+            return True
+        return self.robots.allowed(url)
+
+    @contextmanager
+    def slot(self, url: str, check_robots: bool = True):
+        """요청 한 건의 실행 구간 (robots 확인 → 동시성 → 속도 제한)"""
+        if not self.enabled:
+            yield
+            return
+
+        check_robots = check_robots and host_of(url) not in ROBOTS_EXEMPT_HOSTS
+        state = self._state(url, check_robots)
+        if check_robots and not self.robots.allowed(url):
+            with self._lock:
+                state.blocked += 1
+            raise DisallowedByRobots(f"robots.txt 에서 금지된 URL: {url[:100]}")
+
+        with state.semaphore:
+            with self._lock:
+                wait = max(state.bucket.reserve(), state.paused_until - time.monotonic())
+            if wait > POLITENESS_MAX_WAIT:
+                # 예약한 토큰은 돌려놓고 포기
+                with self._lock:
+                    state.bucket.refund()
+                raise HostThrottled(f"{host_of(url)} 대기 시간 {wait:.1f}초 초과")
+            with self._lock:
+                state.requests += 1
+                state.waited += max(0.0, wait)
+            if wait > 0:
+                time.sleep(wait)
+            yield
+
+    def record_response(self, url: str, status: int, headers: Dict = None):
+        """429/503 이면 Retry-After 동안 호스트 일시 중지"""
+        if not self.enabled or status not in (429, 503):
+            return
+        state = self._state(url, check_robots=False)
+        delay = _retry_after_seconds((headers or {}).get("Retry-After")) or POLITENESS_BACKOFF
+        with self._lock:
+            state.throttled += 1
+            state.paused_until = max(state.paused_until, time.monotonic() + delay)
+        logger.warning(f"{host_of(url)} 응답 {status}: {delay:.0f}초 동안 요청 중지")
+
+    def get(self, url: str, check_robots: bool = True, **kwargs):
+        """예절 규칙을 지키는 GET (공유 세션 사용)"""
+        from utils.http_client import get_session
+        with self.slot(url, check_robots=check_robots):
+            resp = get_session().get(url, **kwargs)
+        self.record_response(url, resp.status_code, resp.headers)
+        return resp
+
+    def run_batched(self, items: List, url_of: Callable, worker: Callable, max_workers: int) -> List:
+        """같은 호스트 항목을 묶어 한 작업자에서 순서대로 처리 (결과는 입력 순서, 실패는 None)"""
+        groups = {}
+        for index, item in enumerate(items):
+            groups.setdefault(host_of(url_of(item)), []).append(index)
+
+        # 호스트 동시성 한도만큼만 묶음을 나눠 병렬화
+        batches = []
+        for host, indexes in groups.items():
+            concurrency = POLITENESS_HOST_OVERRIDES.get(host, {}).get("concurrency", POLITENESS_HOST_CONCURRENCY)
+            parts = max(1, min(concurrency, len(indexes)))
+            batches.extend(indexes[part::parts] for part in range(parts))
+
+        results = [None] * len(items)
+
+        def run_batch(indexes):
+            for index in indexes:
+                try:
+                    results[index] = worker(items[index])
+                except Exception as e:
+                    logger.error(f"배치 작업 실패 ({url_of(items[index])[:60]}...): {e}")
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="domain-batch") as pool:
+            futures = [pool.submit(contextvars.copy_context().run, run_batch, batch) for batch in batches]
+            for future in futures:
+                future.result()
+        return results
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                host: {
+                    "rate": round(state.bucket.rate, 3),
+                    "requests": state.requests,
+                    "throttled": state.throttled,
+                    "robots_blocked": state.blocked,
+                    "waited_seconds": round(state.waited, 1),
+                    "paused": state.paused_until > time.monotonic()
+                }
+                for host, state in self._hosts.items()
+            }
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> DomainScheduler:
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = DomainScheduler()
+    return _scheduler
+
+
+def polite_get(url: str, **kwargs):
+    return get_scheduler().get(url, **kwargs)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+크롤링 실행 프로파일링 (샘플링 프로파일러 / cProfile, 접힌 스택 + 플레임 그래프)
+
+- 샘플링: 별도 스레드가 일정 간격으로 모든 스레드의 스택을 읽어 "스레드;함수;..." 접힌 스택으로 집계
+  → 코드 수정/추적 훅 없이 동작하므로 오버헤드가 간격에만 비례 (상시 프로파일링에도 사용)
+- cProfile: 실행 스레드와 실행 중 새로 만든 스레드의 함수별 호출 수/누적 시간 (pstats 파일로 내보내기)
+- 프로파일 실행은 별도 스레드의 새 이벤트 루프에서 돌려 서버 루프를 막지 않음
+  (샘플링과 3.12 이상 cProfile 은 프로세스의 다른 스레드도 측정 → 접힌 스택의 첫 프레임(스레드 이름)으로 구분)
+- 접힌 스택은 speedscope, flamegraph.pl 등에서 바로 열 수 있고, render_flamegraph 로 SVG 생성도 가능
+"""
+import asyncio
+import cProfile
+import html
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Callable, Dict, Tuple
+
+from config import (
+    PROFILE_DIR, PROFILE_SAMPLE_INTERVAL, PROFILE_MAX_DEPTH, PROFILE_CONTINUOUS_INTERVAL,
+    PROFILE_CONTINUOUS_WINDOW_MINUTES
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """sys._current_frames() 를 주기적으로 읽는 스택 샘플러"""
+
+    def __init__(self, interval: float = PROFILE_SAMPLE_INTERVAL, max_depth: int = PROFILE_MAX_DEPTH):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, name: str = "sampling-profiler"):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.record(self.take_sample())
+
+    def take_sample(self) -> Counter:
+        """현재 모든 스레드 스택 (자기 자신 제외) → {접힌 스택: 1}"""
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        sample = Counter()
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(ident, f"thread-{ident}"))
+            sample[";".join(reversed(stack))] += 1
+        return sample
+
+    def record(self, sample: Counter):
+        self.samples.update(sample)
+        self.sample_count += 1
+
+
+def collapse(samples: Counter, idle: bool = False) -> str:
+    """접힌 스택 텍스트 (한 줄에 "프레임;프레임;... 횟수")
+
+    idle=False 이면 잠금/이벤트/셀렉터 대기로 끝나는 스택은 제외 (CPU 를 쓰지 않는 스레드)
+    """
+    lines = []
+    for stack, count in samples.most_common():
+        if not idle and _is_idle(stack):
+            continue
+        lines.append(f"{stack} {count}")
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+# 이 프레임에서 멈춰 있으면 잠금/입출력 대기 (가장 안쪽 파이썬 프레임 기준)
+_IDLE_LEAVES = ("wait (threading.py", "select (selectors.py", "get (queue.py", "accept (socket.py",
+                "readinto (socket.py", "_worker (thread.py")
+
+
+def _is_idle(stack: str) -> bool:
+    return stack.rsplit(";", 1)[-1].startswith(_IDLE_LEAVES)
+
+
+def render_flamegraph(collapsed: str, title: str = "crawl profile", width: int = 1200, row_height: int = 16) -> str:
+    """접힌 스택 → 단독 SVG 플레임 그래프 (폭 = 샘플 비율, 마우스를 올리면 함수/비율 표시)"""
+    root = {"children": {}, "count": 0}
+    for line in collapsed.splitlines():
+        stack, _, count = line.rpartition(" ")
+        if not stack or not count.isdigit():
+            continue
+        node = root
+        root["count"] += int(count)
+        for frame in stack.split(";"):
+            node = node["children"].setdefault(frame, {"children": {}, "count": 0})
+            node["count"] += int(count)
+
+    total = root["count"] or 1
+    rects = []
+    depth_max = 0
+
+    def layout(node, x: float, depth: int):
+        nonlocal depth_max
+        for name, child in sorted(node["children"].items()):
+            span = child["count"] / total * width
+            if span >= 0.5:
+                depth_max = max(depth_max, depth)
+                rects.append((name, x, depth, span, child["count"]))
+                layout(child, x, depth + 1)
+            x += span
+
+    layout(root, 0.0, 0)
+    height = (depth_max + 2) * row_height + 24
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" font-family="monospace" font-size="11">',
+        f'<text x="4" y="16">{html.escape(title)} ({total} samples)</text>'
+    ]
+    for name, x, depth, span, count in rects:
+        y = height - (depth + 1) * row_height  # 아래가 루트
+        hue = 20 + (hash(name.split(" (")[0]) % 40)
+        label = html.escape(name)
+        parts.append(
+            f'<g><title>{label} — {count} samples ({count / total:.1%})</title>'
+            f'<rect x="{x:.1f}" y="{y}" width="{span:.1f}" height="{row_height - 1}" fill="hsl({hue},85%,60%)"/>'
+        )
+        if span > 40:
+            chars = int(span / 7)
+            parts.append(f'<text x="{x + 2:.1f}" y="{y + row_height - 4}">{html.escape(name[:chars])}</text>')
+        parts.append('</g>')
+    parts.append('</svg>')
+    return "\n".join(parts)
+
+
+def _run_isolated(coro_factory: Callable):
+    """새 이벤트 루프에서 코루틴 함수 실행 (동기 함수면 그대로 호출)"""
+    if asyncio.iscoroutinefunction(coro_factory):
+        return asyncio.run(coro_factory())
+    return coro_factory()
+
+
+def _run_cprofile(coro_factory: Callable) -> Tuple[object, pstats.Stats]:
+    """실행 스레드 + 실행 중 시작된 스레드를 cProfile 로 측정해 합침
+
+    3.12 이상은 cProfile 이 sys.monitoring 기반이라 프로파일러 하나가 모든 스레드를 측정하고 동시에 하나만 켤 수 있음
+    → 하나만 사용, 이전 버전은 새 스레드마다 스레드 전용 프로파일러를 붙임
+    """
+    profiles = []
+    per_thread = sys.version_info < (3, 12)
+
+    def bootstrap(frame, event, arg):
+        # 새 스레드의 첫 이벤트에서 스레드 전용 프로파일러로 교체
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            sys.setprofile(None)  # 다른 프로파일러가 이미 켜져 있음 - 이 스레드는 측정하지 않음
+            return
+        profiles.append(profile)
+
+    root = cProfile.Profile()
+    if per_thread:
+        threading.setprofile(bootstrap)
+    root.enable()
+    try:
+        result = _run_isolated(coro_factory)
+    finally:
+        root.disable()
+        if per_thread:
+            threading.setprofile(None)
+    stats = pstats.Stats(root)
+    for profile in profiles:
+        try:
+            stats.add(profile)
+        except TypeError:
+            pass  # 아무 것도 측정하지 못한 스레드
+    return result, stats
+
+
+_profile_lock = threading.Lock()
+
+
+class ProfileBusy(RuntimeError):
+    """다른 프로파일 실행이 진행 중"""
+
+
+def profile_call(coro_factory: Callable, mode: str = "sampling", interval: float = PROFILE_SAMPLE_INTERVAL,
+                 label: str = "run") -> Dict:
+    """함수(또는 코루틴 함수)를 프로파일러 아래에서 실행 (동기, 스레드에서 호출)
+
+    반환: result, mode, wall_s, cpu_s, samples, files(형식 → 경로)
+    """
+    if mode not in ("sampling", "cprofile"):
+        raise ValueError(f"알 수 없는 프로파일 방식: {mode} (sampling / cprofile)")
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfileBusy("이미 프로파일 실행 중")
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base = os.path.join(PROFILE_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{label}-{mode}")
+        files = {}
+        wall_started, cpu_started = time.perf_counter(), time.process_time()
+
+        if mode == "sampling":
+            sampler = SamplingProfiler(interval)
+            sampler.start()
+            try:
+                result = _run_isolated(coro_factory)
+            finally:
+                sampler.stop()
+            collapsed = collapse(sampler.samples)
+            files["collapsed"] = f"{base}.collapsed"
+            with open(files["collapsed"], 'w', encoding='utf-8') as f:
+                f.write(collapsed)
+            files["svg"] = f"{base}.svg"
+            with open(files["svg"], 'w', encoding='utf-8') as f:
+                f.write(render_flamegraph(collapsed, title=f"{label} ({mode}, {interval * 1000:.0f}ms)"))
+            samples = sampler.sample_count
+        else:
+            result, stats = _run_cprofile(coro_factory)
+            files["pstats"] = f"{base}.pstats"
+            stats.dump_stats(files["pstats"])
+            files["text"] = f"{base}.txt"
+            with open(files["text"], 'w', encoding='utf-8') as f:
+                f.write(format_stats(stats))
+            samples = None
+
+        summary = {
+            "result": result,
+            "mode": mode,
+            "wall_s": round(time.perf_counter() - wall_started, 3),
+            "cpu_s": round(time.process_time() - cpu_started, 3),
+            "samples": samples,
+            "files": files
+        }
+        logger.info(f"프로파일 완료 ({label}, {mode}): {summary['wall_s']}초, CPU {summary['cpu_s']}초 → {base}.*")
+        return summary
+    finally:
+        _profile_lock.release()
+
+
+def format_stats(stats: pstats.Stats, limit: int = 60) -> str:
+    """누적 시간 기준 상위 함수 표"""
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats("cumulative").print_stats(limit)
+    return stream.getvalue()
+
+
+class ContinuousProfiler(SamplingProfiler):
+    """낮은 빈도 상시 샘플링 - 분 단위 구간으로 최근 N분만 보관"""
+
+    def __init__(self, interval: float = PROFILE_CONTINUOUS_INTERVAL,
+                 window_minutes: int = PROFILE_CONTINUOUS_WINDOW_MINUTES):
+        super().__init__(interval)
+        self._windows = deque(maxlen=window_minutes)  # (분 시작 시각, Counter)
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, name: str = "continuous-profiler"):
+        if not self.running:
+            super().start(name)
+            logger.info(f"상시 프로파일링 시작 ({self.interval * 1000:.0f}ms 간격)")
+
+    def record(self, sample: Counter):
+        minute = int(time.time() // 60) * 60
+        with self._lock:
+            if not self._windows or self._windows[-1][0] != minute:
+                self._windows.append((minute, Counter()))
+            self._windows[-1][1].update(sample)
+            self.sample_count += 1
+
+    def snapshot(self, minutes: int = None) -> Counter:
+        """최근 minutes 분 (기본: 보관 중인 전체) 접힌 스택 합계"""
+        since = time.time() - minutes * 60 if minutes else 0
+        merged = Counter()
+        with self._lock:
+            for started, counts in self._windows:
+                if started + 60 > since:
+                    merged.update(counts)
+        return merged
+
+
+_continuous = None
+_continuous_lock = threading.Lock()
+
+
+def get_continuous_profiler() -> ContinuousProfiler:
+    global _continuous
+    if _continuous is None:
+        with _continuous_lock:
+            if _continuous is None:
+                _continuous = ContinuousProfiler()
+    return _continuous
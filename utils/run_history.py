@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+크롤링 실행 이력 저장소 (SQLite) 및 분석 쿼리
+
+- runs: 실행 단위 요약
+- items: 후보 기사별 결과 (출처, 수락/거부 사유, 중복 판정, 전송 결과, 바이트)
+- stage_timings: 단계별 소요 시간 (기사 단위 또는 실행 단위, 벽시계 + CPU)
+"""
+import contextvars
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from config import RUN_HISTORY_DB, RUN_HISTORY_RETENTION_DAYS
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    run_type TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    total INTEGER,
+    success INTEGER
+);
+CREATE TABLE IF NOT EXISTS items (
+    item_id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT,
+    decision TEXT NOT NULL,
+    reason TEXT,
+    dedup TEXT,
+    sent INTEGER,
+    selenium INTEGER,
+    selenium_ok INTEGER,
+    bytes INTEGER
+);
+CREATE TABLE IF NOT EXISTS stage_timings (
+    run_id TEXT NOT NULL,
+    item_id INTEGER,
+    ts REAL NOT NULL,
+    stage TEXT NOT NULL,
+    ms REAL NOT NULL,
+    cpu_ms REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_items_ts_source ON items(ts, source);
+CREATE INDEX IF NOT EXISTS idx_items_run ON items(run_id);
+CREATE INDEX IF NOT EXISTS idx_stage_stage_ts ON stage_timings(stage, ts);
+CREATE INDEX IF NOT EXISTS idx_stage_run ON stage_timings(run_id);
+"""
+
+_current_run = contextvars.ContextVar("current_run", default=None)
+
+
+class RunHistoryStore:
+    """SQLite 기반 실행 이력 저장소"""
+
+    def __init__(self, path: str = RUN_HISTORY_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            # 이전 버전 DB: CPU 시간 열 추가
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(stage_timings)")}
+            if "cpu_ms" not in columns:
+                conn.execute("ALTER TABLE stage_timings ADD COLUMN cpu_ms REAL")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def start_run(self, run_id: str, run_type: str):
+        with self._lock, self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO runs (run_id, run_type, started_at) VALUES (?, ?, ?)",
+                         (run_id, run_type, time.time()))
+
+    def finish_run(self, run_id: str, total: int, success: int):
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE runs SET finished_at = ?, total = ?, success = ? WHERE run_id = ?",
+                         (time.time(), total, success, run_id))
+
+    def add_item(self, run_id: str, item: Dict) -> int:
+        """기사 결과와 단계별 시간 저장 (stages: 벽시계 ms, cpu: 같은 단계의 CPU ms)"""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO items (run_id, ts, source, title, decision, reason, dedup, sent, selenium, selenium_ok, bytes) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, now, item.get("source", "unknown"), (item.get("title") or "")[:100],
+                 item.get("decision", "accepted"), item.get("reason"), item.get("dedup"),
+                 _as_int(item.get("sent")), _as_int(item.get("selenium")), _as_int(item.get("selenium_ok")),
+                 item.get("bytes"))
+            )
+            item_id = cursor.lastrowid
+            stages, cpu = item.get("stages") or {}, item.get("cpu") or {}
+            conn.executemany(
+                "INSERT INTO stage_timings (run_id, item_id, ts, stage, ms, cpu_ms) VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, item_id, now, stage, ms, cpu.get(stage)) for stage, ms in stages.items()]
+            )
+        return item_id
+
+    def mark_delivery(self, run_id: str, item_id: int, sent: bool, ms: float = None):
+        """아웃박스 전송 결과를 기사 기록에 반영 (전송은 실행이 끝난 뒤에 일어날 수 있음)"""
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE items SET sent = ? WHERE item_id = ?", (_as_int(sent), item_id))
+            if ms is not None:
+                conn.execute("INSERT INTO stage_timings (run_id, item_id, ts, stage, ms) VALUES (?, ?, ?, 'send', ?)",
+                             (run_id, item_id, time.time(), ms))
+
+    def add_stage(self, run_id: str, stage: str, ms: float, cpu_ms: float = None):
+        """실행 단위 단계 시간 저장 (예: 중복 필터링 전체)"""
+        with self._lock, self._connect() as conn:
+            conn.execute("INSERT INTO stage_timings (run_id, item_id, ts, stage, ms, cpu_ms) VALUES (?, NULL, ?, ?, ?, ?)",
+                         (run_id, time.time(), stage, ms, cpu_ms))
+
+    def purge(self, retention_days: int = RUN_HISTORY_RETENTION_DAYS) -> int:
+        """보관 기간이 지난 이력 삭제"""
+        cutoff = time.time() - retention_days * 86400
+        with self._lock, self._connect() as conn:
+            old_runs = "SELECT run_id FROM runs WHERE started_at < ?"
+            conn.execute(f"DELETE FROM stage_timings WHERE run_id IN ({old_runs})", (cutoff,))
+            conn.execute(f"DELETE FROM items WHERE run_id IN ({old_runs})", (cutoff,))
+            deleted = conn.execute("DELETE FROM runs WHERE started_at < ?", (cutoff,)).rowcount
+        return deleted
+
+    # ---- 분석 쿼리 ----
+
+    def source_acceptance(self, days: int = 7) -> List[Dict]:
+        """출처별 수락률 / 전송 성공 수"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT source,
+                       COUNT(*) AS total,
+                       COALESCE(SUM(decision = 'accepted'), 0) AS accepted,
+                       COALESCE(SUM(dedup = 'duplicate'), 0) AS duplicates,
+                       COALESCE(SUM(sent = 1), 0) AS sent
+                FROM items WHERE ts >= ?
+                GROUP BY source ORDER BY total DESC
+                """, (_since(days),)
+            ).fetchall()
+        return [
+            {**dict(row), "acceptance_rate": round(row["accepted"] / row["total"], 3) if row["total"] else 0.0}
+            for row in rows
+        ]
+
+    def stage_latency(self, days: int = 7, percentile: float = 0.95) -> List[Dict]:
+        """단계별 평균/백분위 지연 시간 (ms)"""
+        since = _since(days)
+        results = []
+        with self._connect() as conn:
+            stages = conn.execute(
+                "SELECT stage, COUNT(*) AS count, AVG(ms) AS avg_ms, MAX(ms) AS max_ms, AVG(cpu_ms) AS avg_cpu_ms "
+                "FROM stage_timings WHERE ts >= ? GROUP BY stage", (since,)
+            ).fetchall()
+            for row in stages:
+                # (stage, ts) 인덱스로 범위를 좁힌 뒤 정렬 위치로 백분위 계산
+                offset = min(row["count"] - 1, int(row["count"] * percentile))
+                value = conn.execute(
+                    "SELECT ms FROM stage_timings WHERE stage = ? AND ts >= ? ORDER BY ms LIMIT 1 OFFSET ?",
+                    (row["stage"], since, offset)
+                ).fetchone()
+                results.append({
+                    "stage": row["stage"],
+                    "count": row["count"],
+                    "avg_ms": round(row["avg_ms"], 1),
+                    f"p{int(percentile * 100)}_ms": round(value["ms"], 1) if value else None,
+                    "max_ms": round(row["max_ms"], 1),
+                    "avg_cpu_ms": round(row["avg_cpu_ms"], 1) if row["avg_cpu_ms"] is not None else None
+                })
+        return sorted(results, key=lambda r: r["stage"])
+
+    def run_stages(self, run_id: str) -> List[Dict]:
+        """실행 하나의 단계별 벽시계/CPU 시간 합계 (CPU 비율이 낮으면 네트워크/대기 위주)"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT stage, COUNT(*) AS count, SUM(ms) AS wall_ms, SUM(cpu_ms) AS cpu_ms "
+                "FROM stage_timings WHERE run_id = ? GROUP BY stage ORDER BY wall_ms DESC", (run_id,)
+            ).fetchall()
+        return [
+            {
+                "stage": row["stage"],
+                "count": row["count"],
+                "wall_ms": round(row["wall_ms"], 1),
+                "cpu_ms": round(row["cpu_ms"], 1) if row["cpu_ms"] is not None else None,
+                "cpu_ratio": round(row["cpu_ms"] / row["wall_ms"], 2) if row["cpu_ms"] is not None and row["wall_ms"] else None
+            }
+            for row in rows
+        ]
+
+    def selenium_hit_rate(self, days: int = 7) -> Dict:
+        """Selenium 시도 대비 본문 개선 성공 비율"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT SUM(selenium = 1) AS attempts, SUM(selenium_ok = 1) AS hits FROM items WHERE ts >= ?",
+                (_since(days),)
+            ).fetchone()
+        attempts, hits = row["attempts"] or 0, row["hits"] or 0
+        return {"attempts": attempts, "hits": hits, "hit_rate": round(hits / attempts, 3) if attempts else 0.0}
+
+    def rejection_reasons(self, days: int = 7) -> List[Dict]:
+        """거부 사유별 건수"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT source, reason, COUNT(*) AS count FROM items "
+                "WHERE ts >= ? AND decision = 'rejected' GROUP BY source, reason ORDER BY count DESC",
+                (_since(days),)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def recent_runs(self, limit: int = 20) -> List[Dict]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT run_id, run_type, started_at, finished_at, total, success "
+                "FROM runs ORDER BY started_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [
+            {**dict(row), "duration_s": round(row["finished_at"] - row["started_at"], 2) if row["finished_at"] else None}
+            for row in rows
+        ]
+
+
+def _since(days: int) -> float:
+    return time.time() - days * 86400
+
+
+def _as_int(value) -> Optional[int]:
+    return None if value is None else int(bool(value))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> RunHistoryStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = RunHistoryStore()
+    return _store
+
+
+class RunRecorder:
+    """실행 하나의 기록기 - 저장 실패는 크롤링에 영향을 주지 않음"""
+
+    def __init__(self, run_id: str, run_type: str):
+        self.run_id = run_id
+        self.run_type = run_type
+        try:
+            store = get_store()
+            store.purge()
+            store.start_run(run_id, run_type)
+        except Exception as e:
+            logger.error(f"실행 이력 시작 실패: {e}")
+
+    def item(self, **fields) -> Optional[int]:
+        try:
+            return get_store().add_item(self.run_id, fields)
+        except Exception as e:
+            logger.error(f"실행 이력 저장 실패: {e}")
+            return None
+
+    def stage(self, stage: str, ms: float, cpu_ms: float = None):
+        try:
+            get_store().add_stage(self.run_id, stage, ms, cpu_ms)
+        except Exception as e:
+            logger.error(f"단계 시간 저장 실패: {e}")
+
+    @contextmanager
+    def timed(self, stage: str):
+        """블록의 벽시계 시간과 현재 스레드 CPU 시간을 단계로 기록 (기사별 지표와 같은 기준, 작업 스레드 안에서 사용)"""
+        wall_started, cpu_started = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.stage(stage, (time.perf_counter() - wall_started) * 1000, (time.thread_time() - cpu_started) * 1000)
+
+    def finish(self, total: int, success: int):
+        try:
+            get_store().finish_run(self.run_id, total, success)
+        except Exception as e:
+            logger.error(f"실행 이력 종료 실패: {e}")
+
+
+def start_run(run_id: str, run_type: str) -> RunRecorder:
+    """실행 기록 시작 (현재 컨텍스트에 등록)"""
+    return use_run(RunRecorder(run_id, run_type))
+
+
+def use_run(recorder: RunRecorder) -> RunRecorder:
+    """만들어 둔 실행 기록기를 현재 컨텍스트에 등록 (기록기는 스레드에서 만들고 이벤트 루프에서 등록할 때)"""
+    _current_run.set(recorder)
+    return recorder
+
+
+def record_item(**fields):
+    """현재 실행에 기사 결과 기록 (실행 컨텍스트가 없으면 무시)"""
+    recorder = _current_run.get()
+    if recorder is not None:
+        recorder.item(**fields)
+
+
+def record_rejection(source: str, title: str, reason: str, **fields):
+    """거부된 후보 기록"""
+    record_item(source=source, title=title, decision="rejected", reason=reason, **fields)
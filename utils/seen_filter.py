@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+이미 본 URL / GUID / 제목 해시 확인 (시간 구간별 Bloom 필터 + SQLite 정확 확인)
+
+- 1차: 메모리 Bloom 필터 - "없음"은 확정이므로 대부분의 새 후보는 디스크를 읽지 않고 통과
+- 2차: 필터가 "있을 수도"라고 답한 키만 SQLite 에서 정확히 확인 (오탐 제거, 조회 기간 적용)
+- 필터는 시간 구간(기본 1일)마다 새 세대를 만들고 보관 기간이 지난 세대는 통째로 버림 (Bloom 은 삭제 불가)
+- 한 구간이 용량을 넘으면 2배 용량 / 절반 오탐률 필터를 이어 붙임 (scalable Bloom, 전체 오탐률 유지)
+- 필터 파일은 기동 가속용일 뿐이고 기준은 SQLite: 파일 저장 이후 추가된 행(다른 프로세스 포함)은 seq 로 재생
+  → 파일 저장과 오래된 행 정리는 기록할 때마다가 아니라 SEEN_FILTER_SAVE_INTERVAL 마다, 그리고 종료 시
+"""
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import (
+    SEEN_FILTER_DB, SEEN_FILTER_FILE, SEEN_FILTER_RETENTION_DAYS, SEEN_FILTER_SLICE_HOURS,
+    SEEN_FILTER_SLICE_CAPACITY, SEEN_FILTER_ERROR_RATE, SEEN_FILTER_SAVE_INTERVAL
+)
+from utils.text_normalizer import normalize_title
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    key BLOB NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seen_ts ON seen(ts);
+"""
+
+_FORMAT_VERSION = 1
+
+
+def seen_key(kind: str, value: str) -> Optional[bytes]:
+    """(종류, 값) → 16바이트 키 (제목은 정규화 후), 빈 값은 None"""
+    if not value:
+        return None
+    if kind.startswith("title"):
+        value = normalize_title(value)
+        if not value:
+            return None
+    return hashlib.blake2b(f"{kind}\x00{value}".encode('utf-8'), digest_size=16).digest()
+
+
+class BloomFilter:
+    """고정 크기 Bloom 필터 (키는 이미 균일한 16바이트 해시 → 이중 해싱으로 위치 계산)"""
+
+    __slots__ = ("capacity", "error_rate", "size", "hashes", "count", "bits")
+
+    def __init__(self, capacity: int, error_rate: float, bits: bytearray = None, count: int = 0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(64, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bits if bits is not None else bytearray((self.size + 7) // 8)
+        self.count = count
+
+    def _positions(self, key: bytes):
+        first = int.from_bytes(key[:8], "little")
+        step = int.from_bytes(key[8:16], "little") | 1
+        size = self.size
+        return [(first + index * step) % size for index in range(self.hashes)]
+
+    def add(self, key: bytes):
+        bits = self.bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        bits = self.bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class _Generation:
+    """시간 구간 하나의 필터 묶음 (용량을 넘으면 더 큰 필터를 추가)"""
+
+    __slots__ = ("slice_id", "filters")
+
+    def __init__(self, slice_id: int, filters: List[BloomFilter]):
+        self.slice_id = slice_id
+        self.filters = filters
+
+    def add(self, key: bytes, capacity: int, error_rate: float):
+        current = self.filters[-1] if self.filters else None
+        if current is None or current.full:
+            # 필터마다 오탐률을 절반으로 (error_rate/2, /4, ...) → 구간 전체 오탐률 합이 error_rate 를 넘지 않음
+            level = len(self.filters)
+            current = BloomFilter(capacity * (2 ** level), error_rate / (2 ** (level + 1)))
+            self.filters.append(current)
+        current.add(key)
+
+    def __contains__(self, key: bytes) -> bool:
+        return any(key in bloom for bloom in self.filters)
+
+    @property
+    def count(self) -> int:
+        return sum(bloom.count for bloom in self.filters)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(bloom.bits) for bloom in self.filters)
+
+
+class SeenFilter:
+    """이미 본 항목 저장소 (스레드 안전, 여러 프로세스가 같은 DB 를 공유 가능)"""
+
+    def __init__(self, db_path: str = SEEN_FILTER_DB, filter_path: str = SEEN_FILTER_FILE,
+                 retention_days: float = SEEN_FILTER_RETENTION_DAYS, slice_hours: float = SEEN_FILTER_SLICE_HOURS,
+                 slice_capacity: int = SEEN_FILTER_SLICE_CAPACITY, error_rate: float = SEEN_FILTER_ERROR_RATE,
+                 save_interval: float = SEEN_FILTER_SAVE_INTERVAL):
+        self.db_path = db_path
+        self.filter_path = filter_path
+        self.retention = retention_days * 86400
+        self.slice_seconds = slice_hours * 3600
+        self.slice_capacity = slice_capacity
+        self.error_rate = error_rate
+        self.save_interval = save_interval
+        self._last_save = time.monotonic()
+        self._lock = threading.Lock()
+        self._generations: Dict[int, _Generation] = {}
+        self._last_seq = 0
+        self._dirty = False
+        self._stats = {"lookups": 0, "filter_hits": 0, "confirmed": 0}
+        for path in (db_path, filter_path):
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        self._load()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _slice_id(self, ts: float) -> int:
+        return int(ts // self.slice_seconds)
+
+    def _oldest_slice(self, now: float) -> int:
+        return self._slice_id(now - self.retention)
+
+    def _add_to_filter(self, key: bytes, ts: float):
+        slice_id = self._slice_id(ts)
+        if slice_id < self._oldest_slice(time.time()):
+            return
+        generation = self._generations.get(slice_id)
+        if generation is None:
+            generation = self._generations[slice_id] = _Generation(slice_id, [])
+        generation.add(key, self.slice_capacity, self.error_rate)
+        self._dirty = True
+
+    def _expire(self, now: float):
+        oldest = self._oldest_slice(now)
+        for slice_id in [slice_id for slice_id in self._generations if slice_id < oldest]:
+            del self._generations[slice_id]
+            self._dirty = True
+
+    def _replay(self, conn):
+        """마지막으로 반영한 seq 이후 DB 에 추가된 행을 필터에 반영 (다른 프로세스 / 저장 전 종료 대비)"""
+        cutoff = time.time() - self.retention
+        rows = conn.execute("SELECT seq, key, ts FROM seen WHERE seq > ? ORDER BY seq", (self._last_seq,)).fetchall()
+        for seq, key, ts in rows:
+            if ts >= cutoff:
+                self._add_to_filter(key, ts)
+            self._last_seq = seq
+        return len(rows)
+
+    def _load(self):
+        """필터 파일 로드 후 이후 행 재생 (파일이 없거나 설정이 바뀌었으면 DB 에서 새로 구성)"""
+        with self._lock:
+            try:
+                self._read_file()
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"이미 본 항목 필터 파일 무시, DB 에서 재구성 ({self.filter_path}): {e}")
+                self._generations, self._last_seq = {}, 0
+            self._expire(time.time())
+            with self._connect() as conn:
+                row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'seen'").fetchone()
+                if self._last_seq > (row[0] if row else 0):
+                    # DB 가 새로 만들어짐 → 파일의 필터는 다른 DB 기준
+                    logger.warning("이미 본 항목 DB 가 필터 파일보다 오래됨, DB 에서 재구성")
+                    self._generations, self._last_seq = {}, 0
+                replayed = self._replay(conn)
+            if replayed:
+                logger.info(f"이미 본 항목 필터: DB 에서 {replayed}개 반영")
+
+    def _read_file(self):
+        with open(self.filter_path, 'rb') as f:
+            header = json.loads(f.readline())
+            if (header["version"] != _FORMAT_VERSION or header["slice_seconds"] != self.slice_seconds
+                    or header["error_rate"] != self.error_rate or header["slice_capacity"] != self.slice_capacity):
+                raise ValueError("필터 설정 변경됨")
+            generations = {}
+            for entry in header["generations"]:
+                filters = []
+                for capacity, error_rate, count, nbytes in entry["filters"]:
+                    bits = bytearray(f.read(nbytes))
+                    bloom = BloomFilter(capacity, error_rate, bits, count)
+                    if len(bits) != nbytes or len(bits) != (bloom.size + 7) // 8:
+                        raise ValueError("필터 파일 손상")
+                    filters.append(bloom)
+                generations[entry["slice"]] = _Generation(entry["slice"], filters)
+        self._generations, self._last_seq = generations, header["last_seq"]
+
+    def add_many(self, items: Iterable[Tuple[str, str]], ts: float = None) -> int:
+        """(종류, 값) 기록 - 종류: url / guid / title:<분류> (이미 있으면 시각만 갱신)"""
+        now = time.time() if ts is None else ts
+        keys = [(key, kind) for kind, key in ((kind, seen_key(kind, value)) for kind, value in items) if key]
+        if not keys:
+            return 0
+        with self._lock:
+            with self._connect() as conn:
+                # 먼저 다른 프로세스가 추가한 행을 반영해야 seq 커서가 건너뛰지 않음
+                self._replay(conn)
+                conn.executemany("INSERT OR REPLACE INTO seen (key, kind, ts) VALUES (?, ?, ?)",
+                                 [(key, kind, now) for key, kind in keys])
+                self._replay(conn)
+        return len(keys)
+
+    def add(self, kind: str, value: str) -> bool:
+        return self.add_many([(kind, value)]) == 1
+
+    def contains_many(self, items: List[Tuple[str, str]], max_age_days: float = None) -> List[bool]:
+        """(종류, 값)별 본 적 있는지 (max_age_days: 이 기간 안에 기록된 것만, 기본: 보관 기간 전체)"""
+        keys = [seen_key(kind, value) for kind, value in items]
+        with self._lock:
+            now = time.time()
+            with self._connect() as conn:
+                self._replay(conn)
+                self._expire(now)
+                # 1차: 필터 (최신 구간부터)
+                generations = sorted(self._generations.values(), key=lambda generation: -generation.slice_id)
+                candidates = [key for key in keys if key and any(key in generation for generation in generations)]
+                self._stats["lookups"] += len(keys)
+                self._stats["filter_hits"] += len(candidates)
+                if not candidates:
+                    return [False] * len(keys)
+                # 2차: 필터가 있다고 한 키만 정확히 확인
+                cutoff = now - (max_age_days * 86400 if max_age_days is not None else self.retention)
+                found = set()
+                for start in range(0, len(candidates), 500):
+                    chunk = candidates[start:start + 500]
+                    rows = conn.execute(
+                        f"SELECT key FROM seen WHERE ts >= ? AND key IN ({','.join('?' * len(chunk))})",
+                        [cutoff, *chunk]
+                    ).fetchall()
+                    found.update(row[0] for row in rows)
+            self._stats["confirmed"] += len(found)
+        return [key in found for key in keys]
+
+    def contains(self, kind: str, value: str, max_age_days: float = None) -> bool:
+        return self.contains_many([(kind, value)], max_age_days)[0]
+
+    def purge(self) -> int:
+        """보관 기간이 지난 행 삭제"""
+        with self._lock, self._connect() as conn:
+            return conn.execute("DELETE FROM seen WHERE ts < ?", (time.time() - self.retention,)).rowcount
+
+    def maybe_save(self) -> bool:
+        """마지막 저장 후 save_interval 이 지났을 때만 save (기록할 때마다 호출해도 됨)"""
+        with self._lock:
+            if time.monotonic() - self._last_save < self.save_interval:
+                return False
+            self._last_save = time.monotonic()
+        self.save()
+        return True
+
+    def save(self):
+        """필터 파일 저장 (바뀐 경우만, 원자적 교체) + 오래된 행 정리"""
+        self.purge()
+        with self._lock:
+            self._last_save = time.monotonic()
+            self._expire(time.time())
+            if not self._dirty:
+                return
+            generations = [self._generations[slice_id] for slice_id in sorted(self._generations)]
+            header = {
+                "version": _FORMAT_VERSION,
+                "slice_seconds": self.slice_seconds,
+                "slice_capacity": self.slice_capacity,
+                "error_rate": self.error_rate,
+                "last_seq": self._last_seq,
+                "generations": [
+                    {"slice": generation.slice_id,
+                     "filters": [[bloom.capacity, bloom.error_rate, bloom.count, len(bloom.bits)]
+                                 for bloom in generation.filters]}
+                    for generation in generations
+                ]
+            }
+            tmp_path = f"{self.filter_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b"\n")
+                for generation in generations:
+                    for bloom in generation.filters:
+                        f.write(bloom.bits)
+            os.replace(tmp_path, self.filter_path)
+            self._dirty = False
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups, hits, confirmed = self._stats["lookups"], self._stats["filter_hits"], self._stats["confirmed"]
+            return {
+                "generations": len(self._generations),
+                "items": sum(generation.count for generation in self._generations.values()),
+                "filter_bytes": sum(generation.nbytes for generation in self._generations.values()),
+                "lookups": lookups,
+                "filter_hits": hits,
+                "unconfirmed": hits - confirmed  # 필터 오탐 + 조회 기간 밖
+            }
+
+
+_seen_filter = None
+_lock = threading.Lock()
+
+
+def get_seen_filter() -> SeenFilter:
+    global _seen_filter
+    if _seen_filter is None:
+        with _lock:
+            if _seen_filter is None:
+                _seen_filter = SeenFilter()
+    return _seen_filter
+
+
+def shutdown_seen_filter():
+    """종료 시 필터 파일 저장 (사용한 적 없으면 아무것도 안 함)"""
+    if _seen_filter is not None:
+        try:
+            _seen_filter.save()
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"이미 본 항목 필터 저장 실패: {e}")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+의미 기반 유사 제목 탐지 (CPU 전용 해시 n-gram 임베딩 + 코사인 top-k)
+
+- 제목을 정규화한 뒤 단어와 글자 2/3-gram 을 고정 차원으로 해싱한 벡터(L2 정규화)로 표현
+  → 조사/어미가 붙거나 어순이 바뀐 한국어 제목도 가깝게 나옴, 모델 다운로드/GPU/네트워크 불필요
+- numpy 가 있으면 행렬 곱으로 배치 코사인 계산 (정확한 top-k), 없으면 역색인으로 후보를 좁혀 계산 (근사)
+- 벡터는 제목에서 결정적으로 만들어지므로 디스크에는 제목과 기록 시각만 저장 (로드 시 재계산)
+- 분류(NEWS / EVENT)별로 별도 색인, 보관 기간과 최대 항목 수를 넘으면 오래된 것부터 제거
+"""
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import (
+    SEMANTIC_DEDUP_DIR, SEMANTIC_DEDUP_DIM, SEMANTIC_DEDUP_RETENTION_DAYS, SEMANTIC_DEDUP_MAX_ITEMS
+)
+from utils.text_normalizer import normalize_title, extract_words
+
+try:
+    import numpy
+except ImportError:  # 선택 의존성 (없으면 역색인 방식)
+    numpy = None
+
+logger = logging.getLogger(__name__)
+
+_NGRAM_SIZES = (2, 3)
+_WORD_WEIGHT = 1.0  # 단어 전체 일치 (조사가 붙은 형태는 n-gram 이 담당)
+
+
+def _bucket(token: str, dim: int) -> Tuple[int, float]:
+    """토큰 → (버킷, 부호) (부호 해싱으로 충돌 편향 상쇄)"""
+    hashed = zlib.crc32(token.encode('utf-8'))
+    return hashed % dim, (1.0 if hashed & 0x80000000 else -1.0)
+
+
+def embed_title(title: str, dim: int = SEMANTIC_DEDUP_DIM) -> Dict[int, float]:
+    """제목 → 희소 벡터 {버킷: 값} (L2 정규화, 빈 제목은 빈 벡터)"""
+    text = normalize_title(title)
+    vector = defaultdict(float)
+    for word in extract_words(text):
+        bucket, sign = _bucket("w:" + word, dim)
+        vector[bucket] += sign * _WORD_WEIGHT
+    padded = f" {text} "
+    for size in _NGRAM_SIZES:
+        for start in range(len(padded) - size + 1):
+            gram = padded[start:start + size]
+            if gram.strip():
+                bucket, sign = _bucket(gram, dim)
+                vector[bucket] += sign
+    norm = sum(value * value for value in vector.values()) ** 0.5
+    if not norm:
+        return {}
+    return {bucket: value / norm for bucket, value in vector.items() if value}
+
+
+def cosine(left: Dict[int, float], right: Dict[int, float]) -> float:
+    """정규화된 희소 벡터 간 코사인 유사도"""
+    if len(left) > len(right):
+        left, right = right, left
+    return sum(value * right.get(bucket, 0.0) for bucket, value in left.items())
+
+
+class _MatrixBackend:
+    """numpy 행렬 (행 = 저장된 제목), 질의는 행렬 곱 한 번으로 배치 처리"""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.size = 0
+        self.matrix = numpy.zeros((0, dim), dtype=numpy.float32)
+
+    def add(self, vectors: List[Dict[int, float]]):
+        needed = self.size + len(vectors)
+        if needed > len(self.matrix):
+            grown = numpy.zeros((max(needed, len(self.matrix) * 2, 256), self.dim), dtype=numpy.float32)
+            grown[:self.size] = self.matrix[:self.size]
+            self.matrix = grown
+        for offset, vector in enumerate(vectors):
+            if vector:
+                row = self.matrix[self.size + offset]
+                row[list(vector)] = list(vector.values())
+        self.size = needed
+
+    def top_k(self, queries: List[Dict[int, float]], k: int) -> List[List[Tuple[int, float]]]:
+        if not self.size or not queries:
+            return [[] for _ in queries]
+        dense = numpy.zeros((len(queries), self.dim), dtype=numpy.float32)
+        for index, vector in enumerate(queries):
+            if vector:
+                dense[index, list(vector)] = list(vector.values())
+        scores = self.matrix[:self.size] @ dense.T  # (저장 수, 질의 수)
+        k = min(k, self.size)
+        results = []
+        for column in range(len(queries)):
+            column_scores = scores[:, column]
+            rows = numpy.argpartition(-column_scores, k - 1)[:k]
+            rows = rows[numpy.argsort(-column_scores[rows])]
+            results.append([(int(row), float(column_scores[row])) for row in rows])
+        return results
+
+
+class _PostingsBackend:
+    """numpy 가 없을 때: 버킷 → 행 역색인으로 후보를 좁힌 뒤 후보만 정확한 코사인 계산
+
+    흔한 n-gram(예: '우주')은 거의 모든 행에 있으므로, 질의 버킷을 등장 행 수가 적은 순으로 보며
+    후보가 candidate_limit 개를 넘으면 멈춤 (근사 top-k, 같은 사건의 제목은 드문 n-gram 을 공유)
+    """
+
+    def __init__(self, dim: int, candidate_limit: int = 2000):
+        self.dim = dim
+        self.size = 0
+        self.candidate_limit = candidate_limit
+        self.vectors: List[Dict[int, float]] = []
+        self.postings = defaultdict(list)
+
+    def add(self, vectors: List[Dict[int, float]]):
+        for vector in vectors:
+            for bucket in vector:
+                self.postings[bucket].append(self.size)
+            self.vectors.append(vector)
+            self.size += 1
+
+    def top_k(self, queries: List[Dict[int, float]], k: int) -> List[List[Tuple[int, float]]]:
+        results = []
+        limit = max(self.candidate_limit, self.size // 20)
+        for vector in queries:
+            candidates = set()
+            for postings in sorted((self.postings[bucket] for bucket in vector if bucket in self.postings), key=len):
+                candidates.update(postings)
+                if len(candidates) >= limit:
+                    break
+            scores = ((row, cosine(vector, self.vectors[row])) for row in candidates)
+            results.append(heapq.nlargest(k, scores, key=lambda item: item[1]))
+        return results
+
+
+class SemanticIndex:
+    """게시된 제목의 임베딩 색인 (스레드 안전, JSON 으로 영속화)"""
+
+    def __init__(self, path: str, dim: int = SEMANTIC_DEDUP_DIM,
+                 retention_days: int = SEMANTIC_DEDUP_RETENTION_DAYS, max_items: int = SEMANTIC_DEDUP_MAX_ITEMS,
+                 use_numpy: bool = True):
+        self.path = path
+        self.use_numpy = use_numpy and numpy is not None
+        self.dim = dim
+        self.retention_days = retention_days
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._titles: List[str] = []
+        self._added: List[float] = []
+        self._keys = set()
+        self._backend = self._new_backend()
+        self.load()
+
+    @property
+    def backend(self) -> str:
+        return "numpy" if isinstance(self._backend, _MatrixBackend) else "postings"
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _new_backend(self):
+        return _MatrixBackend(self.dim) if self.use_numpy else _PostingsBackend(self.dim)
+
+    def _rebuild(self, items: List[Tuple[str, float]]):
+        """항목 목록으로 색인을 새로 구성 (로드 / 오래된 항목 제거 시)"""
+        self._titles = [title for title, _ in items]
+        self._added = [added for _, added in items]
+        self._keys = {normalize_title(title) for title in self._titles}
+        self._backend = self._new_backend()
+        self._backend.add([embed_title(title, self.dim) for title in self._titles])
+
+    def _expire(self, now: float) -> bool:
+        cutoff = now - self.retention_days * 86400
+        keep = [(title, added) for title, added in zip(self._titles, self._added) if added >= cutoff]
+        if len(keep) > self.max_items:
+            keep = keep[-self.max_items:]
+        if len(keep) == len(self._titles):
+            return False
+        self._rebuild(keep)
+        return True
+
+    def add_many(self, titles: Iterable[str], added_at: float = None) -> int:
+        """제목 추가 (정규화 키가 같은 제목은 한 번만) - 추가된 수 반환"""
+        now = time.time() if added_at is None else added_at
+        with self._lock:
+            new_titles = []
+            for title in titles:
+                key = normalize_title(title)
+                if key and key not in self._keys:
+                    self._keys.add(key)
+                    new_titles.append(title)
+            if not new_titles:
+                return 0
+            self._backend.add([embed_title(title, self.dim) for title in new_titles])
+            self._titles.extend(new_titles)
+            self._added.extend([now] * len(new_titles))
+            # 상한을 10% 넘을 때만 재구성 (추가할 때마다 재구성하지 않도록)
+            if len(self._titles) > self.max_items * 1.1:
+                self._expire(now)
+        return len(new_titles)
+
+    def add(self, title: str, added_at: float = None) -> bool:
+        return self.add_many([title], added_at) == 1
+
+    def query_batch(self, titles: List[str], k: int = 5) -> List[List[Tuple[str, float]]]:
+        """제목별 코사인 유사도 상위 k 개 [(저장된 제목, 유사도)]"""
+        vectors = [embed_title(title, self.dim) for title in titles]
+        with self._lock:
+            matches = self._backend.top_k(vectors, k)
+            return [[(self._titles[row], score) for row, score in rows] for rows in matches]
+
+    def query(self, title: str, k: int = 5) -> List[Tuple[str, float]]:
+        return self.query_batch([title], k)[0]
+
+    def find_duplicates(self, titles: List[str], threshold: float) -> List[Optional[Tuple[str, float]]]:
+        """제목별로 threshold 이상인 가장 가까운 저장 제목 (없으면 None)"""
+        results = []
+        for matches in self.query_batch(titles, k=1):
+            results.append(matches[0] if matches and matches[0][1] >= threshold else None)
+        return results
+
+    def load(self):
+        """파일에서 제목 목록을 읽어 색인 재구성 (없거나 손상되면 빈 색인)"""
+        items = []
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    items = [(title, float(added)) for title, added in json.load(f).get("items", [])]
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                logger.warning(f"의미 색인 로드 실패, 빈 색인으로 시작 ({self.path}): {e}")
+                items = []
+        with self._lock:
+            self._rebuild(items)
+            self._expire(time.time())
+
+    def save(self):
+        with self._lock:
+            self._expire(time.time())
+            data = {"dim": self.dim, "items": [[title, added] for title, added in zip(self._titles, self._added)]}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def stats(self) -> Dict:
+        return {"items": len(self._titles), "dim": self.dim, "backend": self.backend}
+
+
+_indexes: Dict[str, SemanticIndex] = {}
+_lock = threading.Lock()
+
+
+def get_semantic_index(category: str = 'NEWS') -> SemanticIndex:
+    """분류별 색인 (첫 호출 시 파일에서 로드)"""
+    category = category.upper()
+    index = _indexes.get(category)
+    if index is None:
+        with _lock:
+            index = _indexes.get(category)
+            if index is None:
+                path = os.path.join(SEMANTIC_DEDUP_DIR, f"semantic_{category.lower()}.json")
+                index = _indexes[category] = SemanticIndex(path)
+    return index
@@ -29,32 +29,42 @@ def send_to_spring(data: Dict, endpoint: str, source_name: str) -> bool:
         logger.error(f"❌ {source_name} 전송 예외: {e}")
         return False
 
-def send_to_spring_admin(data: Dict, endpoint: str, source_name: str, api_key: str = None) -> bool:
-    """스프링 서버로 데이터 전송 (Admin API)"""
+def deliver_to_spring_admin(data: Dict, endpoint: str, source_name: str, api_key: str = None,
+                            idempotency_key: str = None) -> Dict:
+    """스프링 서버로 데이터 전송 (Admin API) - 재시도 판단용 상태 코드/오류 포함 결과 반환"""
     from config import API_KEY
     
     # API 키가 지정되지 않으면 기본 키 사용
     if api_key is None:
         api_key = API_KEY
     
+    headers = {
+        "Content-Type": "application/json",
+        "X-Crawler-API-Key": api_key
+    }
+    if idempotency_key:
+        # 재전송 시 서버가 같은 게시글로 인식할 수 있도록
+        headers["Idempotency-Key"] = idempotency_key
+    
     try:
         response = requests.post(
             f"{SPRING_SERVER_URL}{endpoint}",
             json=data,
-            headers={
-                "Content-Type": "application/json",
-                "X-Crawler-API-Key": api_key
-            },
+            headers=headers,
             timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code == 200:
             logger.info(f"✅ {source_name} Admin 전송 성공: {data.get('title', '')[:30]}...")
-            return True
+            return {"ok": True, "status": 200, "error": ""}
         else:
             logger.error(f"❌ {source_name} Admin 전송 실패: {response.status_code}")
-            return False
+            return {"ok": False, "status": response.status_code, "error": response.text[:200]}
             
     except Exception as e:
         logger.error(f"❌ {source_name} Admin 전송 예외: {e}")
-        return False
\ No newline at end of file
+        return {"ok": False, "status": None, "error": str(e)}
+
+def send_to_spring_admin(data: Dict, endpoint: str, source_name: str, api_key: str = None) -> bool:
+    """스프링 서버로 데이터 전송 (Admin API)"""
+    return deliver_to_spring_admin(data, endpoint, source_name, api_key)["ok"]
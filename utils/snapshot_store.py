@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+수집 페이지 스냅샷 저장소 (내용 주소 기반, 압축, 보관 기간 제한)
+
+- 본문 HTML 은 sha256 다이제스트를 이름으로 objects/ 아래 한 번만 저장 (zstd, 없으면 gzip)
+- 어떤 URL 을 언제 어떤 방식(fetch / rendered)으로 받았는지는 SQLite 인덱스에 기록
+- 보관 기간/전체 용량을 넘으면 오래된 기록과 참조가 끊긴 객체부터 삭제
+"""
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+from config import (
+    SNAPSHOT_ENABLED, SNAPSHOT_DIR, SNAPSHOT_RETENTION_DAYS, SNAPSHOT_MAX_BYTES, SNAPSHOT_COMPRESSION_LEVEL
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 - 없으면 gzip 사용
+    zstandard = None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    snapshot_id INTEGER PRIMARY KEY,
+    stored_at REAL NOT NULL,
+    kind TEXT NOT NULL,
+    url TEXT NOT NULL,
+    final_url TEXT,
+    status INTEGER,
+    truncated INTEGER,
+    title TEXT,
+    rss_description TEXT,
+    run_id TEXT,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS objects (
+    digest TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    raw_size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_stored ON snapshots(stored_at);
+CREATE INDEX IF NOT EXISTS idx_snapshots_kind ON snapshots(kind, stored_at);
+CREATE INDEX IF NOT EXISTS idx_snapshots_digest ON snapshots(digest);
+"""
+
+_CODEC_SUFFIX = {"zstd": ".zst", "gzip": ".gz"}
+
+
+def _compress(data: bytes):
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=SNAPSHOT_COMPRESSION_LEVEL).compress(data)
+    return "gzip", gzip.compress(data, compresslevel=min(SNAPSHOT_COMPRESSION_LEVEL, 9))
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd 스냅샷을 읽으려면 zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class SnapshotStore:
+    """스냅샷 인덱스(SQLite) + 압축 객체 디렉토리"""
+
+    def __init__(self, root: str = SNAPSHOT_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.index_path = os.path.join(root, "index.db")
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.index_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _object_path(self, digest: str, codec: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest + _CODEC_SUFFIX[codec])
+
+    def put(self, kind: str, url: str, html, final_url: str = "", status: int = None, truncated: bool = False,
+            title: str = "", rss_description: str = "", run_id: str = "") -> str:
+        """스냅샷 저장 후 다이제스트 반환 (같은 내용은 객체를 다시 쓰지 않음)"""
+        data = html.encode('utf-8') if isinstance(html, str) else html
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock, self._connect() as conn:
+            if conn.execute("SELECT 1 FROM objects WHERE digest = ?", (digest,)).fetchone() is None:
+                codec, compressed = _compress(data)
+                path = self._object_path(digest, codec)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(compressed)
+                os.replace(tmp_path, path)
+                conn.execute("INSERT INTO objects (digest, codec, raw_size, stored_size) VALUES (?, ?, ?, ?)",
+                             (digest, codec, len(data), len(compressed)))
+            conn.execute(
+                "INSERT INTO snapshots (stored_at, kind, url, final_url, status, truncated, title, rss_description, run_id, digest) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), kind, url, final_url or url, status, int(bool(truncated)),
+                 title, rss_description, run_id, digest)
+            )
+        return digest
+
+    def read(self, digest: str) -> str:
+        """객체 내용을 문자열로 반환"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT codec FROM objects WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            raise KeyError(digest)
+        with open(self._object_path(digest, row["codec"]), 'rb') as f:
+            return _decompress(row["codec"], f.read()).decode('utf-8', errors='replace')
+
+    def list_snapshots(self, kind: str = None, limit: int = None, since_days: float = None) -> List[Dict]:
+        """스냅샷 메타데이터 목록 (최신 순)"""
+        query = "SELECT * FROM snapshots WHERE 1 = 1"
+        params = []
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        if since_days:
+            query += " AND stored_at >= ?"
+            params.append(time.time() - since_days * 86400)
+        query += " ORDER BY stored_at DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
+
+    def purge(self, retention_days: int = SNAPSHOT_RETENTION_DAYS, max_bytes: int = SNAPSHOT_MAX_BYTES) -> Dict:
+        """보관 기간 초과 기록 삭제 → 용량 초과 시 오래된 기록부터 삭제 → 참조 없는 객체 삭제"""
+        removed_snapshots = 0
+        with self._lock, self._connect() as conn:
+            cutoff = time.time() - retention_days * 86400
+            removed_snapshots += conn.execute("DELETE FROM snapshots WHERE stored_at < ?", (cutoff,)).rowcount
+
+            total = conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM objects").fetchone()[0]
+            if total > max_bytes:
+                # 가장 최근에 참조된 시각이 오래된 객체부터 제거
+                rows = conn.execute(
+                    "SELECT o.digest, o.stored_size FROM objects o JOIN snapshots s ON s.digest = o.digest "
+                    "GROUP BY o.digest ORDER BY MAX(s.stored_at)"
+                ).fetchall()
+                for row in rows:
+                    if total <= max_bytes:
+                        break
+                    removed_snapshots += conn.execute("DELETE FROM snapshots WHERE digest = ?",
+                                                      (row["digest"],)).rowcount
+                    total -= row["stored_size"]
+
+            orphans = conn.execute(
+                "SELECT digest, codec FROM objects WHERE digest NOT IN (SELECT DISTINCT digest FROM snapshots)"
+            ).fetchall()
+            for row in orphans:
+                try:
+                    os.remove(self._object_path(row["digest"], row["codec"]))
+                except FileNotFoundError:
+                    pass
+            conn.executemany("DELETE FROM objects WHERE digest = ?", [(row["digest"],) for row in orphans])
+        return {"snapshots": removed_snapshots, "objects": len(orphans)}
+
+    def stats(self) -> Dict:
+        with self._connect() as conn:
+            snapshots = conn.execute("SELECT kind, COUNT(*) AS count FROM snapshots GROUP BY kind").fetchall()
+            objects = conn.execute(
+                "SELECT COUNT(*) AS count, COALESCE(SUM(raw_size), 0) AS raw, COALESCE(SUM(stored_size), 0) AS stored "
+                "FROM objects"
+            ).fetchone()
+        return {
+            "snapshots": {row["kind"]: row["count"] for row in snapshots},
+            "objects": objects["count"],
+            "raw_bytes": objects["raw"],
+            "stored_bytes": objects["stored"],
+            "codec": "zstd" if zstandard is not None else "gzip"
+        }
+
+
+_store = None
+_store_lock = threading.Lock()
+_last_purge = 0.0
+
+
+def get_snapshot_store() -> SnapshotStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SnapshotStore()
+    return _store
+
+
+def record_snapshot(kind: str, url: str, html, **meta):
+    """크롤링 중 스냅샷 기록 (비활성화/실패 시 크롤링에 영향 없음)"""
+    global _last_purge
+    if not SNAPSHOT_ENABLED or not html:
+        return
+    try:
+        from utils.logger_setup import get_run_id
+        store = get_snapshot_store()
+        store.put(kind, url, html, run_id=get_run_id(), **meta)
+        # 보관 정리는 한 시간에 한 번만
+        if time.monotonic() - _last_purge > 3600:
+            _last_purge = time.monotonic()
+            store.purge()
+    except Exception as e:
+        logger.error(f"스냅샷 저장 실패 ({url[:60]}...): {e}")
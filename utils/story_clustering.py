@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+교차 소스 기사 묶음 (MinHash LSH + union-find)
+
+- 정규화한 제목(공백 제거)의 글자 2-gram 집합으로 MinHash 서명을 만들고
+  밴드 LSH 버킷이 겹치는 항목끼리만 비교 → 추정 Jaccard 가 기준 이상이면 같은 사건으로 합침
+- 항목을 추가할 때마다 바로 합치는 증분 방식 (전체 쌍 비교 없음)
+- 묶음마다 내용이 가장 풍부한 항목 하나만 대표로 골라 본문 추출/셀레니움 렌더링은 대표에만 수행
+"""
+import random
+import zlib
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple
+
+from config import STORY_MINHASH_PERMUTATIONS, STORY_LSH_BANDS
+from utils.text_normalizer import normalize_title
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _permutations(count: int) -> List[Tuple[int, int]]:
+    """고정 시드의 해시 순열 계수 (실행마다 같은 서명)"""
+    rng = random.Random(1)
+    return [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(count)]
+
+
+def shingles(title: str) -> set:
+    """제목 → 글자 2-gram 집합 (띄어쓰기 차이 무시, 한 글자 제목은 그대로)"""
+    text = normalize_title(title).replace(' ', '')
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class StoryClusterer:
+    """제목을 하나씩 추가하며 같은 사건끼리 묶음"""
+
+    def __init__(self, threshold: float, num_perm: int = STORY_MINHASH_PERMUTATIONS, bands: int = STORY_LSH_BANDS):
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나누어 떨어져야 함")
+        self.threshold = threshold
+        self.rows = num_perm // bands
+        self._permutations = _permutations(num_perm)
+        self._buckets = defaultdict(list)  # (밴드 번호, 밴드 값) → 항목 번호
+        self._signatures: List[Tuple[int, ...]] = []
+        self._parent: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _signature(self, grams: set) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(gram.encode('utf-8')) for gram in grams]
+        if not hashes:
+            return tuple(_MAX_HASH for _ in self._permutations)
+        return tuple(
+            min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes)
+            for a, b in self._permutations
+        )
+
+    def similarity(self, left: int, right: int) -> float:
+        """두 항목의 추정 Jaccard 유사도 (서명 일치 비율)"""
+        first, second = self._signatures[left], self._signatures[right]
+        return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+    def find(self, index: int) -> int:
+        root = index
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[index] != root:  # 경로 압축
+            self._parent[index], index = root, self._parent[index]
+        return root
+
+    def _union(self, left: int, right: int):
+        left_root, right_root = self.find(left), self.find(right)
+        if left_root != right_root:
+            # 먼저 들어온 항목을 루트로 유지 (묶음 순서 = 첫 등장 순서)
+            self._parent[max(left_root, right_root)] = min(left_root, right_root)
+
+    def add(self, title: str) -> int:
+        """제목 추가 후 항목 번호 반환 (LSH 후보 중 기준 이상인 항목과 즉시 합침)"""
+        index = len(self._signatures)
+        grams = shingles(title)
+        signature = self._signature(grams)
+        self._signatures.append(signature)
+        self._parent.append(index)
+        if not grams:
+            return index  # 빈 제목은 어떤 항목과도 묶지 않음
+        candidates = set()
+        for band in range(len(signature) // self.rows):
+            key = (band, signature[band * self.rows:(band + 1) * self.rows])
+            candidates.update(self._buckets[key])
+            self._buckets[key].append(index)
+        for other in candidates:
+            if self.find(other) != self.find(index) and self.similarity(index, other) >= self.threshold:
+                self._union(index, other)
+        return index
+
+    def clusters(self) -> List[List[int]]:
+        """묶음 목록 (각 묶음은 항목 번호 오름차순, 묶음은 첫 항목 순)"""
+        groups = defaultdict(list)
+        for index in range(len(self._signatures)):
+            groups[self.find(index)].append(index)
+        return [groups[root] for root in sorted(groups)]
+
+
+def cluster_stories(items: List[Dict], threshold: float, title: Callable[[Dict], str],
+                    richness: Callable[[Dict], float]) -> List[Tuple[Dict, List[Dict]]]:
+    """항목들을 사건별로 묶어 [(대표, 나머지 항목들)] 반환
+
+    대표는 richness 가 가장 큰 항목 (같으면 먼저 나온 항목), 결과 순서는 각 묶음의 첫 등장 순서
+    """
+    clusterer = StoryClusterer(threshold)
+    for item in items:
+        clusterer.add(title(item))
+    result = []
+    for members in clusterer.clusters():
+        best = max(members, key=lambda index: (richness(items[index]), -index))
+        result.append((items[best], [items[index] for index in members if index != best]))
+    return result
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+제목/본문 정제 및 정규화 (미리 컴파일된 패턴 사용)
+"""
+import re
+import unicodedata
+from typing import Iterable, List
+
+# 제목 앞의 [출처] 표기
+_BRACKET_PREFIX = re.compile(r'^\[[^\]\n]*\]\s*')
+
+# 출처 접미사 본문 (예: " - 한국대학신문")
+_SOURCE_SUFFIX_BODY = re.compile(r'[가-힣A-Za-z0-9\s]+')
+
+# 역순 문자열 앞부분에서 매칭 -> 끝에서부터 한 번만 훑으므로 백트래킹 없음
+_TRAILING_WORD_REVERSED = re.compile(r'[가-힣A-Za-z0-9]+')
+_TRAILING_PHRASE_REVERSED = re.compile(r'[가-힣A-Za-z0-9\s\'"\-’]+')
+
+# 정규화 키 생성용
+_NON_WORD = re.compile(r'[^가-힣a-z0-9\s]+')
+_WHITESPACE = re.compile(r'\s+')
+
+# 핵심 키워드 추출용 (중복 체크에서 공유)
+WORD_PATTERN = re.compile(r'[가-힣A-Za-z0-9]+')
+
+
+class BoilerplateFilter:
+    """금지어 목록을 하나의 정규식으로 묶어 한 번의 탐색으로 검사"""
+
+    def __init__(self, words: Iterable[str], prefixes: Iterable[str] = ()):
+        # 긴 단어를 먼저 두어 교대(alternation) 매칭이 일찍 끝나도록 함
+        ordered = sorted(set(words), key=len, reverse=True)
+        self.pattern = re.compile('|'.join(re.escape(word) for word in ordered), re.IGNORECASE)
+        self.prefixes = tuple(prefixes)
+
+    def matches(self, text: str) -> bool:
+        """금지어 포함 또는 금지 접두어로 시작하면 True"""
+        if self.prefixes and text.startswith(self.prefixes):
+            return True
+        return self.pattern.search(text) is not None
+
+    def filter(self, texts: Iterable[str], min_length: int = 0) -> List[str]:
+        """최소 길이를 넘고 금지어가 없는 텍스트만 반환"""
+        return [text for text in texts if len(text) > min_length and not self.matches(text)]
+
+
+# 기사 문단 필터 (정적 크롤링)
+PARAGRAPH_BOILERPLATE = BoilerplateFilter(
+    ['광고', '구독', '로그인', '회원가입', '댓글', '공유하기',
+     '이메일', '페이스북', '트위터', '카카오톡', '라인',
+     'copyright', 'ⓒ', '©', '저작권', '무단전재'],
+    prefixes=('사진=', '이미지=', '출처=', '기자=')
+)
+
+# 렌더링된 본문 블록 필터 (Selenium)
+RENDERED_BLOCK_BOILERPLATE = BoilerplateFilter(['광고', '구독', '로그인', '댓글', '공유하기', '카카오톡'])
+
+# 렌더링된 본문 줄 단위 필터 (Selenium)
+RENDERED_LINE_BOILERPLATE = BoilerplateFilter(['저작권', '무단전재', '사진=', '기자=', '출처='])
+
+# 구글 뉴스 안내 문구 (의미 없는 콘텐츠)
+AGGREGATOR_BOILERPLATE = BoilerplateFilter(
+    ['Google 뉴스가 전세계', '전세계 매체로부터', '종합한 최신 뉴스', '뉴스 소스', '뉴스 제공업체']
+)
+
+
+def strip_source_suffix(text: str) -> str:
+    """끝의 ' - 출처' 제거 (마지막 '-' 한 곳만 검사)"""
+    index = text.rfind('-')
+    if index < 0:
+        return text.strip()
+    tail = text[index + 1:]
+    # '-' 뒤가 모두 한글/영숫자/공백일 때만 출처로 판단
+    if tail and _SOURCE_SUFFIX_BODY.fullmatch(tail):
+        return text[:index].strip()
+    return text.strip()
+
+
+def _strip_trailing(text: str, reversed_pattern) -> str:
+    """끝부분 연속 구간을 역순 매칭으로 제거"""
+    trimmed = text.rstrip()
+    match = reversed_pattern.match(trimmed[::-1])
+    if match:
+        trimmed = trimmed[:len(trimmed) - match.end()]
+    return trimmed.strip()
+
+
+def strip_trailing_word(text: str) -> str:
+    """끝의 단어 하나 제거 (RSS 설명 끝에 붙는 매체명)"""
+    return _strip_trailing(text, _TRAILING_WORD_REVERSED)
+
+
+def strip_trailing_phrase(text: str) -> str:
+    """끝의 제목/출처 구간 제거 (문장부호 이전까지)"""
+    return _strip_trailing(text, _TRAILING_PHRASE_REVERSED)
+
+
+def strip_title_source(title: str) -> str:
+    """제목에서 출처 표기 제거 (예: [한국대학신문], - 한국대학신문)"""
+    title = _BRACKET_PREFIX.sub('', title, count=1).strip()
+    return strip_source_suffix(title)
+
+
+def clean_rss_description(description: str, title: str = "") -> str:
+    """RSS 설명에서 제목과 출처 제거"""
+    if title and title in description:
+        description = description.replace(title, '').strip()
+    description = strip_trailing_word(description)
+    return strip_source_suffix(description)
+
+
+def normalize_title(title: str) -> str:
+    """중복 비교용 제목 키 (전각/대소문자/문장부호/공백 차이 무시)"""
+    text = unicodedata.normalize('NFKC', title or '')
+    text = strip_title_source(text).lower()
+    text = _NON_WORD.sub(' ', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def extract_words(text: str) -> List[str]:
+    """한글/영숫자 단어 목록"""
+    return WORD_PATTERN.findall(text)